@@ -0,0 +1 @@
+from .selection import BACKENDS, set_backend, get_backend, resolve, numba_available
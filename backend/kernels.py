@@ -0,0 +1,225 @@
+"""
+Modulo dei Kernel Compilati con Numba.
+
+Ogni kernel ripete le stesse operazioni, nello stesso ordine, del ciclo
+Python/NumPy che sostituisce, così i due backend danno lo stesso risultato
+(identico bit a bit per Thomas e per i metodi chiusi; per i prodotti
+scalari NumPy può sommare in un ordine diverso, con differenze
+dell'ordine dell'epsilon di macchina).
+
+Gli errori non vengono sollevati dentro i kernel: restituiscono un codice
+di stato e il solver Python solleva l'eccezione con il messaggio originale.
+
+I kernel sono compilati una sola volta, al primo uso (Numba e NumPy vengono
+importati solo in quel momento: i metodi chiusi in puro Python non li richiedono).
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import warnings
+import weakref
+
+# Codici di stato restituiti dai kernel
+OK = 0
+BAD_BRACKET = 1
+NOT_CONVERGED = 2
+
+_KERNELS = {}
+
+# Versioni compilate delle funzioni utente (una compilazione per funzione)
+_JITTED = weakref.WeakKeyDictionary()
+
+
+def kernels():
+    """Compila (una sola volta) i kernel con Numba. Solleva ImportError se assente."""
+    if _KERNELS:
+        return _KERNELS
+
+    import numba
+    import numpy as np
+
+    @numba.njit(cache=False)
+    def thomas(e, f, g, b):
+        # Lavora sul posto su f e b (copie di lavoro preparate dal chiamante)
+        n = f.shape[0]
+        x = np.zeros(n)
+        # Decomposizione: restituisce l'indice del pivot nullo, -1 se tutto va bene
+        for k in range(1, n):
+            if f[k - 1] == 0:
+                return x, k - 1
+            factor = e[k] / f[k - 1]
+            f[k] = f[k] - factor * g[k - 1]
+            b[k] = b[k] - factor * b[k - 1]
+        if f[n - 1] == 0:
+            return x, n - 1
+        x[n - 1] = b[n - 1] / f[n - 1]
+        for k in range(n - 2, -1, -1):
+            x[k] = (b[k] - g[k] * x[k + 1]) / f[k]
+        return x, -1
+
+    @numba.njit(cache=False)
+    def back_substitution(A, b):
+        n = b.shape[0]
+        x = np.zeros(n)
+        x[n - 1] = b[n - 1] / A[n - 1, n - 1]
+        for i in range(n - 2, -1, -1):
+            sum_ax = 0.0
+            for j in range(i + 1, n):
+                sum_ax += A[i, j] * x[j]
+            x[i] = (b[i] - sum_ax) / A[i, i]
+        return x
+
+    @numba.njit(cache=False)
+    def gauss_seidel_sweep(A, b, x, x_old, omega):
+        n = b.shape[0]
+        for i in range(n):
+            dot = 0.0
+            for j in range(n):
+                dot += A[i, j] * x[j]
+            sigma = dot - A[i, i] * x[i]
+            x_new = (b[i] - sigma) / A[i, i]
+            x[i] = omega * x_new + (1 - omega) * x_old[i]
+
+    @numba.njit(cache=False)
+    def bisezione(f, a, b, tol, max_iter):
+        fa = f(a)
+        fb = f(b)
+        if fa * fb >= 0:
+            return a, BAD_BRACKET
+        xr = a
+        xr_old = a
+        for i in range(max_iter):
+            xr = (a + b) / 2
+            fxr = f(xr)
+            if xr != 0 and i > 0:
+                if abs((xr - xr_old) / xr) < tol:
+                    return xr, OK
+            if fxr == 0:
+                return xr, OK
+            if fa * fxr < 0:
+                b = xr
+                fb = fxr
+            else:
+                a = xr
+                fa = fxr
+            xr_old = xr
+        return xr, NOT_CONVERGED
+
+    @numba.njit(cache=False)
+    def falsa_posizione(f, a, b, tol, max_iter):
+        fa = f(a)
+        fb = f(b)
+        if fa * fb >= 0:
+            return a, BAD_BRACKET
+        xr = a
+        xr_old = a
+        ia = 0
+        ib = 0
+        for i in range(max_iter):
+            xr = b - (fb * (a - b)) / (fa - fb)
+            fxr = f(xr)
+            if xr != 0 and i > 0:
+                if abs((xr - xr_old) / xr) < tol:
+                    return xr, OK
+            if fxr == 0:
+                return xr, OK
+            if fa * fxr < 0:
+                b = xr
+                fb = fxr
+                ib = 0
+                ia += 1
+                if ia >= 2:
+                    fa /= 2
+            else:
+                a = xr
+                fa = fxr
+                ia = 0
+                ib += 1
+                if ib >= 2:
+                    fb /= 2
+            xr_old = xr
+        return xr, NOT_CONVERGED
+
+    @numba.njit(cache=False)
+    def regression_sums(x, y):
+        # Somme centrate: medie, poi scarti (come la formula NumPy)
+        n = x.shape[0]
+        xm = 0.0
+        ym = 0.0
+        for i in range(n):
+            xm += x[i]
+            ym += y[i]
+        xm /= n
+        ym /= n
+        sxx = 0.0
+        sxy = 0.0
+        st = 0.0
+        for i in range(n):
+            dx = x[i] - xm
+            dy = y[i] - ym
+            sxx += dx * dx
+            sxy += dx * dy
+            st += dy * dy
+        if sxx == 0:
+            return xm, ym, sxx, sxy, st, 0.0
+        # Residui dy - a1*dx in una terza passata
+        a1 = sxy / sxx
+        sr = 0.0
+        for i in range(n):
+            res = (y[i] - ym) - a1 * (x[i] - xm)
+            sr += res * res
+        return xm, ym, sxx, sxy, st, sr
+
+    _KERNELS['thomas'] = thomas
+    _KERNELS['back_substitution'] = back_substitution
+    _KERNELS['gauss_seidel_sweep'] = gauss_seidel_sweep
+    _KERNELS['bisezione'] = bisezione
+    _KERNELS['falsa_posizione'] = falsa_posizione
+    _KERNELS['regression_sums'] = regression_sums
+    return _KERNELS
+
+
+def load():
+    """
+    Restituisce i kernel compilati, oppure None (con un avviso) se Numba
+    non si può importare, così il chiamante può usare il percorso Python.
+    """
+    try:
+        return kernels()
+    except ImportError:
+        warnings.warn("Numba non è installato: uso il backend Python.", RuntimeWarning, stacklevel=3)
+        return None
+
+
+def call_with_function(name, f, *args):
+    """
+    Esegue un kernel che valuta la funzione utente f, compilandola con Numba
+    (una volta per funzione). Restituisce None, con un avviso, se Numba non
+    è disponibile o se f non è compilabile.
+
+    Se f è avvolta da diagnostics per il conteggio si compila la funzione
+    originale: le valutazioni dentro il kernel non sono contate.
+    """
+    compiled = load()
+    if compiled is None:
+        return None
+
+    import numba
+    from numba.extending import is_jitted
+
+    from diagnostics.recorder import uncounted
+
+    f = uncounted(f)
+
+    try:
+        if is_jitted(f):
+            f_jit = f
+        else:
+            f_jit = _JITTED.get(f)
+            if f_jit is None:
+                f_jit = _JITTED[f] = numba.njit(f)
+        return compiled[name](f_jit, *args)
+    except (numba.core.errors.NumbaError, TypeError, ImportError):
+        warnings.warn("f non è compilabile con Numba: uso il backend Python.", RuntimeWarning, stacklevel=3)
+        return None
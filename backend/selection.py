@@ -0,0 +1,83 @@
+"""
+Modulo per la Scelta del Backend di Calcolo.
+
+I solver con un ciclo scalare critico (thomas, gauss_elimination,
+bisezione, falsa_posizione, gauss_seidel, linear_regression) accettano
+l'argomento backend:
+- 'python': percorso originale Python/NumPy (default).
+- 'numba': ciclo compilato con Numba (kernels.py), se installato.
+- None: usa il backend globale scelto con set_backend().
+
+Numba viene importato solo al primo uso del backend 'numba'. Se non è
+installato si emette un avviso e si usa il percorso Python.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import importlib.util
+import warnings
+
+BACKENDS = ('python', 'numba')
+
+# Backend globale usato quando un solver riceve backend=None
+_BACKEND = 'python'
+
+# Disponibilità di Numba (None = non ancora verificata)
+_NUMBA_AVAILABLE = None
+
+
+def set_backend(name):
+    """
+    Imposta il backend globale dei solver.
+
+    Args:
+        name (str): 'python' oppure 'numba'.
+
+    Returns:
+        str: Il backend precedente (per poterlo ripristinare).
+
+    Raises:
+        ValueError: Se il backend non esiste.
+    """
+    global _BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Backend '{name}' sconosciuto. Disponibili: {', '.join(BACKENDS)}.")
+    previous = _BACKEND
+    _BACKEND = name
+    return previous
+
+
+def get_backend():
+    """Restituisce il backend globale corrente."""
+    return _BACKEND
+
+
+def numba_available():
+    """True se Numba è installato (verifica senza importarlo)."""
+    global _NUMBA_AVAILABLE
+    if _NUMBA_AVAILABLE is None:
+        _NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+    return _NUMBA_AVAILABLE
+
+
+def resolve(backend=None):
+    """
+    Backend effettivo di una chiamata.
+
+    Args:
+        backend (str, optional): Backend richiesto; None usa quello globale.
+
+    Returns:
+        str: 'numba' se richiesto e disponibile, altrimenti 'python'.
+
+    Raises:
+        ValueError: Se il backend non esiste.
+    """
+    name = _BACKEND if backend is None else backend
+    if name not in BACKENDS:
+        raise ValueError(f"Backend '{name}' sconosciuto. Disponibili: {', '.join(BACKENDS)}.")
+    if name == 'numba' and not numba_available():
+        warnings.warn("Numba non è installato: uso il backend Python.", RuntimeWarning, stacklevel=3)
+        return 'python'
+    return name
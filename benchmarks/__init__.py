@@ -0,0 +1,4 @@
+from .harness import Case, case_id, run, run_case, save_results, load_results, compare
+from .problems import FAMILIES, collect
+from .parity import check_parity
+from .imports import import_times
@@ -0,0 +1,115 @@
+"""
+Esecuzione dei benchmark da riga di comando.
+
+Esempi:
+    python -m benchmarks --output results.json
+    python -m benchmarks --family systems ode --max-size 10000
+    python -m benchmarks --baseline baseline.json --threshold 0.15
+    python -m benchmarks --parity
+    python -m benchmarks --imports
+
+Con --baseline il processo termina con codice 1 se almeno un caso è più
+lento (o usa più memoria/valutazioni, con --metric) oltre la soglia.
+Con --parity confronta i backend 'python' e 'numba' e la regressione online
+con quella in memoria, e termina con codice 1 se i risultati differiscono;
+se Numba non è installato il confronto tra i backend viene saltato (e
+segnalato) e il codice di uscita è 2. Con --imports misura il tempo di
+import del pacchetto e dei sottopacchetti in interpreti nuovi.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import argparse
+import sys
+
+from .harness import run, save_results, load_results, compare
+from .imports import import_times
+from .parity import check_parity, check_streaming
+from .problems import FAMILIES, collect
+
+
+def _format_entry(entry):
+    """Riga di riepilogo di un caso."""
+    memory = '-' if entry['peak_memory'] is None else f"{entry['peak_memory'] / 1024:.0f} KiB"
+    error = '-' if entry['error'] is None else f"{entry['error']:.2e}"
+    return (f"{entry['id']:<60} {entry['time_min'] * 1e3:>11.4f} ms  {memory:>12}  "
+            f"evals={entry['n_evals']:<8} err={error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Benchmark dei solver di metodi numerici.")
+    parser.add_argument('--family', nargs='+', choices=list(FAMILIES),
+                        help="Famiglie di problemi da eseguire (default: tutte).")
+    parser.add_argument('--match', help="Esegue solo i casi il cui id contiene questa stringa.")
+    parser.add_argument('--max-size', type=int, default=10**6,
+                        help="Dimensione massima dei problemi (default 10^6).")
+    parser.add_argument('--repeat', type=int, default=5, help="Ripetizioni per la misura del tempo.")
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="Durata minima di ogni ripetizione in secondi.")
+    parser.add_argument('--no-memory', action='store_true', help="Non misura il picco di memoria.")
+    parser.add_argument('--output', help="File JSON in cui salvare i risultati.")
+    parser.add_argument('--baseline', help="File JSON di riferimento per il confronto.")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Aumento relativo tollerato rispetto alla baseline (default 0.10).")
+    parser.add_argument('--metric', nargs='+', default=['time_min'],
+                        choices=['time_min', 'time_median', 'peak_memory', 'n_evals'],
+                        help="Metriche confrontate con la baseline.")
+    parser.add_argument('--parity', action='store_true',
+                        help="Verifica solo la parità dei risultati tra i backend Python e Numba.")
+    parser.add_argument('--imports', action='store_true',
+                        help="Misura solo il tempo di import del pacchetto e dei sottopacchetti.")
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        for item in import_times(repeat=args.repeat):
+            numpy = 'numpy' if item['numpy'] else '-'
+            print(f"{item['statement']:<70} {item['time_min'] * 1e3:>9.2f} ms  "
+                  f"{item['modules']:>4} moduli  {numpy}")
+        return 0
+
+    if args.parity:
+        try:
+            report = check_parity(args.max_size)
+            skipped = None
+        except RuntimeError as exc:
+            report, skipped = [], exc
+        report += check_streaming(args.max_size)
+        for item in report:
+            params = ','.join(f'{k}={v}' for k, v in item['params'].items())
+            status = 'ok' if item['ok'] else 'DIVERSO'
+            print(f"{item['name'] + '[' + params + ']':<45} diff={item['diff']:.2e} "
+                  f"(tol {item['rtol']:.1e})  {status}")
+        failures = [item for item in report if not item['ok']]
+        print(f"\n{len(report) - len(failures)}/{len(report)} casi identici entro la tolleranza.")
+        if failures:
+            return 1
+        if skipped is not None:
+            # Nessun caso Python/Numba eseguito: non va riportato come successo
+            print(f"Parità Python/Numba saltata (skipped): {skipped}")
+            return 2
+        return 0
+
+    cases = collect(args.family, max_size=args.max_size, match=args.match)
+    data = run(cases, repeat=args.repeat, min_time=args.min_time, memory=not args.no_memory,
+               progress=lambda entry: print(_format_entry(entry), flush=True))
+
+    if args.output:
+        save_results(data, args.output)
+
+    if args.baseline:
+        regressions = compare(data, load_results(args.baseline), args.threshold, args.metric)
+        if regressions:
+            print(f"\n{len(regressions)} regressioni oltre il {args.threshold:.0%}:")
+            for item in regressions:
+                print(f"  {item['id']:<60} {item['metric']}: "
+                      f"{item['baseline']:.4g} -> {item['current']:.4g} (x{item['ratio']:.2f})")
+            return 1
+        print("\nNessuna regressione rispetto alla baseline.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
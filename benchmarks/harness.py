@@ -0,0 +1,197 @@
+"""
+Modulo per l'Esecuzione e il Confronto dei Benchmark.
+
+Ogni caso di benchmark è una funzione senza argomenti preparata in anticipo
+(i dati del problema sono costruiti fuori dalla misura). Per ciascun caso si
+misurano:
+- Tempo: minimo e mediana su più ripetizioni, con un numero di chiamate per
+  ripetizione scelto in modo che ognuna duri almeno min_time secondi.
+- Memoria: picco allocato durante una chiamata (tracemalloc, include NumPy).
+- Valutazioni: chiamate alle funzioni utente, iterazioni e passi, raccolte con
+  diagnostics.record().
+- Errore: scostamento dal valore esatto, se il caso lo fornisce.
+
+I risultati sono salvati in JSON e confrontati con un file di riferimento
+(baseline): un caso è una regressione se la metrica cresce oltre la soglia.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import numpy as np
+
+from diagnostics import record
+
+Case = namedtuple('Case', ['family', 'name', 'params', 'func', 'error'])
+Case.__doc__ = """
+Caso di benchmark.
+
+    - family: Sottopacchetto o famiglia di problemi (es. 'systems').
+    - name: Nome del solver misurato.
+    - params: Parametri del problema (es. {'n': 1000}).
+    - func: Funzione senza argomenti che esegue il solver.
+    - error: Funzione error(risultato) -> float, oppure None.
+"""
+
+
+def case_id(case):
+    """Identificativo univoco del caso, es. 'systems.thomas[n=1000]'."""
+    params = ','.join(f'{k}={v}' for k, v in case.params.items())
+    return f'{case.family}.{case.name}[{params}]'
+
+
+def _time_case(func, repeat, min_time):
+    """Restituisce (minimo, mediana) del tempo per chiamata, in secondi."""
+    start = time.perf_counter()
+    func()
+    single = time.perf_counter() - start
+
+    number = max(1, int(min_time / max(single, 1e-9)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return min(samples), statistics.median(samples)
+
+
+def _peak_memory(func):
+    """Picco di memoria allocata (byte) durante una chiamata."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _evaluations(func):
+    """Valutazioni, iterazioni e passi dei solver chiamati direttamente dal caso."""
+    with record(trace=False) as rec:
+        result = func()
+    top = [stats for stats in rec.runs if stats.depth == 0]
+    return result, {
+        'n_evals': sum(stats.n_evals for stats in top),
+        'n_iter': sum(stats.n_iter for stats in top),
+        'n_steps': sum(stats.n_steps for stats in top),
+    }
+
+
+def run_case(case, repeat=5, min_time=0.05, memory=True):
+    """
+    Esegue un caso e restituisce il dizionario delle misure.
+
+    Args:
+        case (Case): Caso da misurare.
+        repeat (int, optional): Numero di ripetizioni per la misura del tempo.
+        min_time (float, optional): Durata minima di ogni ripetizione (secondi).
+        memory (bool, optional): Misura anche il picco di memoria.
+
+    Returns:
+        dict: Misure del caso (id, tempi, memoria, valutazioni, errore).
+    """
+    result, counts = _evaluations(case.func)
+    t_min, t_median = _time_case(case.func, repeat, min_time)
+
+    entry = {
+        'id': case_id(case),
+        'family': case.family,
+        'name': case.name,
+        'params': case.params,
+        'time_min': t_min,
+        'time_median': t_median,
+        'peak_memory': _peak_memory(case.func) if memory else None,
+        **counts,
+        'error': None if case.error is None else float(case.error(result)),
+    }
+    return entry
+
+
+def run(cases, repeat=5, min_time=0.05, memory=True, progress=None):
+    """
+    Esegue una lista di casi.
+
+    Args:
+        cases (list[Case]): Casi da misurare.
+        repeat (int, optional): Ripetizioni per la misura del tempo.
+        min_time (float, optional): Durata minima di ogni ripetizione (secondi).
+        memory (bool, optional): Misura anche il picco di memoria.
+        progress (callable, optional): Chiamata come progress(entry) dopo ogni caso.
+
+    Returns:
+        dict: {'meta': {...}, 'results': [...]} pronto per save_results.
+    """
+    results = []
+    for case in cases:
+        entry = run_case(case, repeat=repeat, min_time=min_time, memory=memory)
+        results.append(entry)
+        if progress is not None:
+            progress(entry)
+
+    meta = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+    }
+    return {'meta': meta, 'results': results}
+
+
+def save_results(data, path):
+    """Salva i risultati in formato JSON."""
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, indent=2)
+
+
+def load_results(path):
+    """Carica i risultati salvati con save_results."""
+    with open(path, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def compare(current, baseline, threshold=0.10, metrics=('time_min',)):
+    """
+    Confronta i risultati con una baseline.
+
+    Args:
+        current (dict): Risultati correnti (output di run o load_results).
+        baseline (dict): Risultati di riferimento.
+        threshold (float, optional): Aumento relativo tollerato (0.10 = +10%).
+        metrics (tuple[str], optional): Metriche da confrontare
+                                        ('time_min', 'time_median', 'peak_memory', 'n_evals').
+
+    Returns:
+        list[dict]: Regressioni trovate (id, metrica, baseline, valore, rapporto),
+                    ordinate per rapporto decrescente. I casi assenti nella
+                    baseline sono ignorati.
+    """
+    reference = {entry['id']: entry for entry in baseline['results']}
+    regressions = []
+
+    for entry in current['results']:
+        old = reference.get(entry['id'])
+        if old is None:
+            continue
+        for metric in metrics:
+            before, after = old.get(metric), entry.get(metric)
+            if not before or after is None:
+                continue
+            ratio = after / before
+            if ratio > 1 + threshold:
+                regressions.append({'id': entry['id'], 'metric': metric,
+                                    'baseline': before, 'current': after, 'ratio': ratio})
+
+    regressions.sort(key=lambda item: item['ratio'], reverse=True)
+    return regressions
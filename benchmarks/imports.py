@@ -0,0 +1,78 @@
+"""
+Modulo per la Misura del Tempo di Import.
+
+Ogni istruzione viene eseguita in un interprete nuovo (python -c), così il
+tempo misurato comprende tutti i moduli caricati e non risente della cache
+di sys.modules. Per ogni istruzione si riportano il tempo minimo su più
+ripetizioni, il numero di moduli caricati e se NumPy è stato importato.
+
+Uso: python -m benchmarks --imports
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Radice della repository (contiene metodi_numerici e i sottopacchetti)
+ROOT = Path(__file__).resolve().parent.parent
+
+STATEMENTS = [
+    'import numpy',
+    'import metodi_numerici',
+    "import metodi_numerici as mn; mn.get_solver('solve_ivp', 'rk4')",
+    "import metodi_numerici as mn; mn.get_solver('solve_ivp', 'bdf')",
+    "import metodi_numerici as mn; mn.get_solver('integrate', 'simpson')",
+    "import metodi_numerici as mn; mn.get_solver('find_root', 'bisezione')",
+    'import integration',
+    'import regression',
+    'from ode import rk4',
+    'from integration import simpson',
+    'from roots import bisezione',
+    'from regression import linear_regression',
+]
+
+_SCRIPT = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({'time': elapsed, 'modules': len(set(sys.modules) - before),
+                  'numpy': 'numpy' in sys.modules}))
+"""
+
+
+def _measure(statement):
+    """Esegue l'istruzione in un interprete nuovo e restituisce le misure."""
+    # json è importato prima della misura: non va contato tra i moduli caricati
+    result = subprocess.run([sys.executable, '-c', 'import json' + _SCRIPT, statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_times(statements=None, repeat=5):
+    """
+    Misura il tempo di import di ogni istruzione.
+
+    Args:
+        statements (list[str], optional): Istruzioni da misurare (default STATEMENTS).
+        repeat (int, optional): Interpreti avviati per ogni istruzione.
+
+    Returns:
+        list[dict]: Per ogni istruzione: 'statement', 'time_min' (secondi),
+                    'modules' (moduli caricati) e 'numpy' (True se importato).
+    """
+    report = []
+    for statement in statements or STATEMENTS:
+        samples = [_measure(statement) for _ in range(repeat)]
+        report.append({
+            'statement': statement,
+            'time_min': min(sample['time'] for sample in samples),
+            'modules': samples[-1]['modules'],
+            'numpy': samples[-1]['numpy'],
+        })
+    return report
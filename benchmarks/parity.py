@@ -0,0 +1,134 @@
+"""
+Modulo per la Verifica di Parità tra i Backend.
+
+Esegue ogni solver con kernel Numba su problemi di dimensione crescente con
+entrambi i backend e confronta i risultati:
+- thomas, bisezione, falsa_posizione: stesse operazioni nello stesso ordine,
+  il risultato deve essere identico bit a bit.
+- gauss_elimination, gauss_seidel, linear_regression: NumPy somma i prodotti
+  scalari in un ordine diverso dal ciclo compilato, si tollera una differenza
+  relativa dell'ordine di max(n, 100) volte l'epsilon di macchina.
+
+Confronta inoltre online_regression (a blocchi, stati uniti con online_merge)
+con linear_regression, anche su fit quasi perfetti in cui syx è molto più
+piccolo della dispersione di y (check_streaming, non richiede Numba).
+
+Uso: python -m benchmarks --parity
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from backend import numba_available
+from regression import linear_regression, online_regression
+from roots import bisezione, falsa_posizione
+from systems import gauss_elimination, thomas, gauss_seidel
+
+from .problems import SIZES, _dominant_matrix
+
+
+def _cubic(x):
+    return x**3 - 2*x - 5
+
+
+def _parity_cases(max_size):
+    """Coppie (nome, params, funzione(backend), tolleranza relativa)."""
+    cases = []
+    for tol in (1e-4, 1e-8, 1e-12):
+        for name, solver in (('bisezione', bisezione), ('falsa_posizione', falsa_posizione)):
+            cases.append((name, {'tol': tol},
+                          lambda backend, solver=solver, tol=tol: solver(_cubic, 2, 3, tol=tol, backend=backend),
+                          0.0))
+
+    for n in SIZES:
+        if n > max_size:
+            break
+        rng = np.random.default_rng(n)
+        e, g, b = rng.uniform(-1, 1, (3, n))
+        f = 4 + rng.uniform(0, 1, n)
+        cases.append(('thomas', {'n': n},
+                      lambda backend, e=e, f=f, g=g, b=b: thomas(e, f, g, b, backend=backend), 0.0))
+
+        x = rng.uniform(0, 10, n)
+        y = 3 * x + 2 + rng.standard_normal(n)
+        cases.append(('linear_regression', {'n': n},
+                      lambda backend, x=x, y=y: np.array(linear_regression(x, y, backend=backend)),
+                      max(n, 100) * np.finfo(float).eps))
+
+        if n <= 1000:
+            A, rhs = _dominant_matrix(n)
+            cases += [
+                ('gauss_elimination', {'n': n},
+                 lambda backend, A=A, rhs=rhs: gauss_elimination(A, rhs, backend=backend),
+                 max(n, 100) * np.finfo(float).eps),
+                ('gauss_seidel', {'n': n},
+                 lambda backend, A=A, rhs=rhs: gauss_seidel(A, rhs, tol=1e-12, max_iter=1000, backend=backend),
+                 max(n, 100) * np.finfo(float).eps),
+            ]
+    return cases
+
+
+def _streaming_cases(max_size):
+    """Terne (nome, params, (riferimento, candidato), tolleranza relativa)."""
+    cases = []
+    for n in SIZES:
+        if n < 1000 or n > max_size:
+            continue
+        rng = np.random.default_rng(n)
+        for fit, noise in (('noisy', 1.0), ('near_perfect', 1e-6)):
+            x = np.linspace(0, 1000, n)
+            y = 3 * x + 1 + rng.normal(0, noise, n)
+            cases.append(('online_regression', {'n': n, 'fit': fit},
+                          (lambda x=x, y=y: linear_regression(x, y),
+                           lambda x=x, y=y: online_regression(x, y, chunk_size=997)),
+                          1e-6))
+    return cases
+
+
+def check_parity(max_size=10**6):
+    """
+    Confronta i backend 'python' e 'numba' su tutti i solver con kernel compilato.
+
+    Args:
+        max_size (int, optional): Dimensione massima dei problemi.
+
+    Returns:
+        list[dict]: Per ogni caso: nome, parametri, differenza relativa massima,
+                    tolleranza e 'ok'.
+
+    Raises:
+        RuntimeError: Se Numba non è installato.
+    """
+    if not numba_available():
+        raise RuntimeError("Numba non è installato: nessun backend compilato da confrontare.")
+
+    report = []
+    for name, params, solve, rtol in _parity_cases(max_size):
+        reference = np.asarray(solve('python'), dtype=float)
+        compiled = np.asarray(solve('numba'), dtype=float)
+        scale = np.maximum(np.abs(reference), 1.0)
+        diff = float(np.max(np.abs(compiled - reference) / scale))
+        report.append({'name': name, 'params': params, 'diff': diff, 'rtol': rtol, 'ok': diff <= rtol})
+    return report
+
+
+def check_streaming(max_size=10**6):
+    """
+    Confronta la regressione online (a blocchi) con quella in memoria.
+
+    Args:
+        max_size (int, optional): Dimensione massima dei problemi.
+
+    Returns:
+        list[dict]: Per ogni caso: nome, parametri, differenza relativa massima,
+                    tolleranza e 'ok'.
+    """
+    report = []
+    # Differenza relativa senza soglia: syx di un fit quasi perfetto è minuscolo
+    for name, params, (reference, candidate), rtol in _streaming_cases(max_size):
+        expected = np.asarray(reference(), dtype=float)
+        diff = float(np.max(np.abs(np.asarray(candidate(), dtype=float) - expected) / np.abs(expected)))
+        report.append({'name': name, 'params': params, 'diff': diff, 'rtol': rtol, 'ok': diff <= rtol})
+    return report
@@ -0,0 +1,283 @@
+"""
+Modulo delle Famiglie di Problemi per i Benchmark.
+
+Ogni famiglia costruisce i casi di un sottopacchetto su dimensioni crescenti
+(n = 10 ... 10^6, limitate dal costo asintotico di ciascun solver):
+- roots: equazione cubica a tolleranze decrescenti.
+- systems: matrici diagonalmente dominanti, dense e tridiagonali.
+- interpolation: funzione di Runge su nodi equispaziati e di Chebyshev.
+- integration: integrali con valore esatto noto.
+- ode: oscillatore armonico (non stiff) e problema lineare stiff.
+- regression: rette con rumore gaussiano.
+
+I solver con kernel compilato compaiono anche con params 'backend': 'numba'
+se Numba è installato (la prima chiamata, fuori dalla misura, compila).
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from backend import numba_available
+from integration import trapezoidal, simpson, gauss_legendre
+from interpolation import lagrange, newton, chebyshev_nodes
+from ode import rk4, rk45, adams_bashforth_moulton, backward_euler, bdf, rosenbrock
+from regression import linear_regression, batched_linear_regression, online_regression
+from roots import bisezione, falsa_posizione, newton_raphson, secanti
+from systems import gauss_elimination, thomas, gauss_seidel, jacobi
+
+from .harness import Case, case_id
+
+SIZES = [10, 100, 1000, 10**4, 10**5, 10**6]
+
+
+def _sizes(limit, max_size):
+    """Dimensioni della scala fino al limite del solver e al massimo richiesto."""
+    return [n for n in SIZES if n <= min(limit, max_size)]
+
+
+def _backends():
+    """Backend da misurare per i solver con kernel compilato."""
+    return [None, 'numba'] if numba_available() else [None]
+
+
+def _with_backend(params, backend):
+    """Parametri del caso; il backend compare solo se diverso da quello Python."""
+    return params if backend is None else {**params, 'backend': backend}
+
+
+def _dominant_matrix(n, seed=0):
+    """Matrice densa a diagonale strettamente dominante e termine noto."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1
+    return A, rng.uniform(-1, 1, n)
+
+
+def roots_cases(max_size):
+    """Cubica x^3 - 2x - 5 = 0 con tolleranze 1e-4, 1e-8, 1e-12."""
+    def f(x):
+        return x**3 - 2*x - 5
+
+    def df(x):
+        return 3*x**2 - 2
+
+    exact = 2.0945514815423265
+
+    def error(r):
+        return abs(r - exact)
+
+    cases = []
+    for tol in (1e-4, 1e-8, 1e-12):
+        params = {'tol': tol}
+        for backend in _backends():
+            bp = _with_backend(params, backend)
+            cases += [
+                Case('roots', 'bisezione', bp,
+                     lambda tol=tol, backend=backend: bisezione(f, 2, 3, tol=tol, backend=backend), error),
+                Case('roots', 'falsa_posizione', bp,
+                     lambda tol=tol, backend=backend: falsa_posizione(f, 2, 3, tol=tol, backend=backend), error),
+            ]
+        cases += [
+            Case('roots', 'newton_raphson', params, lambda tol=tol: newton_raphson(f, df, 2, tol=tol), error),
+            Case('roots', 'secanti', params, lambda tol=tol: secanti(f, 2, 3, tol=tol), error),
+        ]
+    return cases
+
+
+def systems_cases(max_size):
+    """Sistemi densi (Gauss, Jacobi, Gauss-Seidel) e tridiagonali (Thomas)."""
+    cases = []
+
+    for n in _sizes(1000, max_size):
+        A, b = _dominant_matrix(n)
+        x_ref = np.linalg.solve(A, b)
+
+        def error(x, x_ref=x_ref):
+            return np.max(np.abs(x - x_ref))
+
+        cases.append(Case('systems', 'jacobi', {'n': n},
+                          lambda A=A, b=b: jacobi(A, b, tol=1e-10, max_iter=1000), error))
+        for backend in _backends():
+            bp = _with_backend({'n': n}, backend)
+            cases += [
+                Case('systems', 'gauss_elimination', bp,
+                     lambda A=A, b=b, backend=backend: gauss_elimination(A, b, backend=backend), error),
+                Case('systems', 'gauss_seidel', bp,
+                     lambda A=A, b=b, backend=backend: gauss_seidel(A, b, tol=1e-10, max_iter=1000,
+                                                                    backend=backend), error),
+            ]
+
+    for n in _sizes(10**6, max_size):
+        e = np.full(n, -1.0)
+        f = np.full(n, 4.0)
+        g = np.full(n, -1.0)
+        x_true = np.sin(np.arange(n))
+        r = f * x_true
+        r[1:] += e[1:] * x_true[:-1]
+        r[:-1] += g[:-1] * x_true[1:]
+
+        def error(x, x_true=x_true):
+            return np.max(np.abs(x - x_true))
+
+        for backend in _backends():
+            cases.append(Case('systems', 'thomas', _with_backend({'n': n}, backend),
+                              lambda e=e, f=f, g=g, r=r, backend=backend: thomas(e, f, g, r, backend=backend),
+                              error))
+
+    return cases
+
+
+def interpolation_cases(max_size):
+    """Funzione di Runge 1/(1+25x^2) su [-1, 1], nodi equispaziati e di Chebyshev."""
+    def runge(x):
+        return 1 / (1 + 25 * x**2)
+
+    x_eval = np.linspace(-1, 1, 1001)
+    y_true = runge(x_eval)
+
+    def error(y):
+        return np.max(np.abs(y - y_true))
+
+    cases = []
+    for n in (5, 10, 20, 40):
+        if n > max_size:
+            break
+        for kind, nodes in (('equispaced', np.linspace(-1, 1, n)), ('chebyshev', chebyshev_nodes(-1, 1, n))):
+            values = runge(nodes)
+            params = {'n': n, 'nodes': kind}
+            cases += [
+                Case('interpolation', 'lagrange', params,
+                     lambda x=nodes, y=values: lagrange(x, y, x_eval), error),
+                Case('interpolation', 'newton', params,
+                     lambda x=nodes, y=values: newton(x, y, x_eval), error),
+            ]
+    return cases
+
+
+def integration_cases(max_size):
+    """Integrale di sin(x) su [0, pi] (valore esatto 2)."""
+    def error(value):
+        return abs(value - 2.0)
+
+    cases = []
+    for n in _sizes(10**6, max_size):
+        params = {'n': n}
+        cases += [
+            Case('integration', 'trapezoidal', params,
+                 lambda n=n: trapezoidal(np.sin, 0, np.pi, n, vectorized=True), error),
+            Case('integration', 'simpson', params, lambda n=n: simpson(np.sin, 0, np.pi, n), error),
+        ]
+        if n <= 10**5:
+            cases.append(Case('integration', 'gauss_legendre', params,
+                              lambda n=n: gauss_legendre(np.sin, 0, np.pi, n=n, order=5), error))
+    return cases
+
+
+def ode_cases(max_size):
+    """Oscillatore armonico su [0, 10] (non stiff) e y' = -1000 (y - cos x) (stiff)."""
+    def oscillator(x, y):
+        return np.array([y[1], -y[0]])
+
+    exact = np.array([np.cos(10), -np.sin(10)])
+
+    def error(res):
+        return np.max(np.abs(res[1][-1] - exact))
+
+    cases = []
+    for n in _sizes(10**5, max_size):
+        h = 10 / n
+        params = {'steps': n}
+        cases += [
+            Case('ode', 'rk4', params, lambda h=h: rk4(oscillator, 0, [1, 0], 10, h), error),
+            Case('ode', 'adams_bashforth_moulton', params,
+                 lambda h=h: adams_bashforth_moulton(oscillator, 0, [1, 0], 10, h), error),
+        ]
+
+    for rtol in (1e-3, 1e-6, 1e-9):
+        cases.append(Case('ode', 'rk45', {'rtol': rtol},
+                          lambda rtol=rtol: rk45(oscillator, 0, [1, 0], 10, rtol=rtol, atol=rtol * 1e-3),
+                          error))
+
+    # Problema stiff: soluzione lenta vicina a cos(x), autovalore -1000
+    lam = 1000.0
+
+    def stiff(x, y):
+        return -lam * (y - np.cos(x))
+
+    y_end = (lam**2 * np.cos(1) + lam * np.sin(1)) / (1 + lam**2) - lam**2 / (1 + lam**2) * np.exp(-lam)
+
+    def stiff_error(res):
+        return abs(res[1][-1] - y_end)
+
+    for n in _sizes(10**4, max_size):
+        h = 1 / n
+        params = {'steps': n, 'problem': 'stiff'}
+        cases += [
+            Case('ode', 'backward_euler', params, lambda h=h: backward_euler(stiff, 0, 0.0, 1, h), stiff_error),
+            Case('ode', 'bdf2', params, lambda h=h: bdf(stiff, 0, 0.0, 1, h, order=2), stiff_error),
+            Case('ode', 'rosenbrock', params, lambda h=h: rosenbrock(stiff, 0, 0.0, 1, h), stiff_error),
+        ]
+    return cases
+
+
+def regression_cases(max_size):
+    """Retta y = 3x + 2 con rumore, fino a 10^6 punti (1000 serie per il caso a lotti)."""
+    cases = []
+    for n in _sizes(10**6, max_size):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 10, n)
+        y = 3 * x + 2 + rng.standard_normal(n)
+
+        def error(res):
+            return abs(res[0] - 3)
+
+        params = {'n': n}
+        for backend in _backends():
+            cases.append(Case('regression', 'linear_regression', _with_backend(params, backend),
+                              lambda x=x, y=y, backend=backend: linear_regression(x, y, backend=backend), error))
+        cases.append(Case('regression', 'online_regression', params,
+                          lambda x=x, y=y: online_regression(x, y), error))
+        if n <= 1000:
+            Y = 3 * x + 2 + rng.standard_normal((1000, n))
+            cases.append(Case('regression', 'batched_linear_regression', {'n': n, 'series': 1000},
+                              lambda x=x, Y=Y: batched_linear_regression(x, Y),
+                              lambda res: np.max(np.abs(res[0] - 3))))
+    return cases
+
+
+FAMILIES = {
+    'roots': roots_cases,
+    'systems': systems_cases,
+    'interpolation': interpolation_cases,
+    'integration': integration_cases,
+    'ode': ode_cases,
+    'regression': regression_cases,
+}
+
+
+def collect(families=None, max_size=10**6, match=None):
+    """
+    Costruisce i casi di benchmark.
+
+    Args:
+        families (list[str], optional): Famiglie da includere (default tutte).
+        max_size (int, optional): Dimensione massima dei problemi.
+        match (str, optional): Mantiene solo i casi il cui id contiene questa stringa.
+
+    Returns:
+        list[Case]: Casi di benchmark.
+    """
+    names = list(FAMILIES) if not families else families
+    unknown = [name for name in names if name not in FAMILIES]
+    if unknown:
+        raise ValueError(f"Famiglie sconosciute: {', '.join(unknown)}. Disponibili: {', '.join(FAMILIES)}.")
+
+    cases = []
+    for name in names:
+        cases += FAMILIES[name](max_size)
+
+    if match:
+        cases = [case for case in cases if match in case_id(case)]
+    return cases
@@ -0,0 +1 @@
+from .memo import CachedFunction, CacheInfo, cached
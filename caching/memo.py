@@ -0,0 +1,211 @@
+"""
+Modulo per la Memorizzazione delle Valutazioni di Funzione.
+
+Utile quando la stessa funzione costosa viene passata più volte ai solver
+su punti in parte coincidenti, ad esempio:
+- simpson/trapezoidal con n raddoppiato: metà dei nodi sono già stati valutati.
+- bisezione/newton_raphson ripetuti con tol più stretta: le prime iterazioni
+  ripercorrono gli stessi punti.
+
+La cache è un dizionario ordinato (LRU, dimensione limitata) indicizzato dal
+valore float esatto di x. Chiamata su un array, CachedFunction cerca ogni
+punto nella cache e valuta i soli punti mancanti con un'unica chiamata
+vettoriale di f.
+
+Gli argomenti aggiuntivi (args) fanno parte della chiave: gli array NumPy
+sono indicizzati dal contenuto (forma, dtype e byte), gli altri argomenti
+devono essere hashable.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import functools
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evals', 'maxsize', 'currsize'])
+CacheInfo.__doc__ = """
+Statistiche della cache.
+
+    - hits: Punti trovati nella cache.
+    - misses: Punti calcolati (non presenti nella cache).
+    - evals: Chiamate effettive della funzione originale.
+    - maxsize: Numero massimo di punti conservati (None = illimitato).
+    - currsize: Punti attualmente conservati.
+"""
+
+_MISSING = object()
+
+
+def _args_key(args):
+    """
+    Parte della chiave dovuta agli argomenti aggiuntivi (None se non ce ne sono).
+    Gli array NumPy sono sostituiti da (forma, dtype, byte): due array con lo
+    stesso contenuto danno la stessa chiave.
+
+    Raises:
+        TypeError: Se un argomento non è un array e non è hashable.
+    """
+    if not args:
+        return None
+    key = []
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            arg = ('ndarray', arg.shape, arg.dtype.str, arg.tobytes())
+        else:
+            try:
+                hash(arg)
+            except TypeError:
+                raise TypeError(f"Gli argomenti di una funzione con cache devono essere array NumPy "
+                                f"o hashable (ricevuto {type(arg).__name__}).") from None
+        key.append(arg)
+    return tuple(key)
+
+
+class CachedFunction:
+    """
+    Funzione f(x, *args) con cache LRU dei valori già calcolati.
+
+    Attributes:
+        func (callable): Funzione originale.
+        maxsize (int | None): Numero massimo di punti conservati (None = illimitato).
+        vectorized (bool): Se True i punti mancanti di un array sono valutati
+                           con un'unica chiamata func(array, *args), altrimenti
+                           uno alla volta. Se la chiamata vettoriale non restituisce
+                           un valore per punto (ultimo asse), i punti sono
+                           rivalutati uno alla volta.
+    """
+
+    def __init__(self, func, maxsize=2**16, vectorized=True):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize deve essere almeno 1 (oppure None).")
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.vectorized = vectorized
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evals = 0
+
+    def __call__(self, x, *args):
+        """
+        Valuta f in x (scalare o array) usando i valori già calcolati.
+
+        Gli argomenti aggiuntivi fanno parte della chiave: gli array NumPy per
+        contenuto, gli altri devono essere hashable. Per un array x il risultato ha forma (...) + x.shape, dove (...) è la forma
+        del valore di f in un punto (vuota per f scalare), come per la chiamata
+        vettoriale di f.
+        """
+        extra = _args_key(args)
+        if np.ndim(x) == 0:
+            return self._scalar(x, args, extra)
+        return self._array(x, args, extra)
+
+    def _key(self, x, extra):
+        return x if extra is None else (x, extra)
+
+    def _store(self, point, extra, value):
+        """Inserisce un valore ed elimina i meno usati di recente oltre maxsize."""
+        # NaN non è mai uguale a se stesso: non potrebbe essere ritrovato
+        if point != point:
+            return
+        self._cache[self._key(point, extra)] = value
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def _scalar(self, x, args, extra):
+        point = float(x)
+        key = self._key(point, extra)
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+        value = self.func(x, *args)
+        self.misses += 1
+        self.evals += 1
+        self._store(point, extra, value)
+        return value
+
+    def _array(self, x, args, extra):
+        x = np.asarray(x, dtype=float)
+        points = x.ravel().tolist()
+        cache = self._cache
+
+        # Ricerca nella cache: i punti mancanti sono raccolti senza duplicati
+        values = [None] * len(points)
+        missing = {}
+        for i, point in enumerate(points):
+            key = self._key(point, extra)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                missing.setdefault(point, []).append(i)
+            else:
+                cache.move_to_end(key)
+                values[i] = value
+
+        self.misses += len(missing)
+        self.hits += len(points) - len(missing)
+
+        if missing:
+            new_values = None
+            if self.vectorized:
+                # Un'unica chiamata vettoriale sui soli punti mancanti
+                result = np.asarray(self.func(np.fromiter(missing, float, len(missing)), *args))
+                self.evals += 1
+                if result.shape[-1:] == (len(missing),):
+                    new_values = [result[..., j] for j in range(len(missing))]
+            if new_values is None:
+                # f non vettoriale, o che non restituisce un valore per punto
+                # (es. una costante o una riduzione): un punto alla volta
+                new_values = [self.func(point, *args) for point in missing]
+                self.evals += len(missing)
+
+            for (point, positions), value in zip(missing.items(), new_values):
+                for i in positions:
+                    values[i] = value
+                self._store(point, extra, value)
+
+        # Asse dei punti per ultimo, come nella chiamata vettoriale di f
+        out = np.asarray(values)
+        return np.moveaxis(out, 0, -1).reshape(out.shape[1:] + x.shape)
+
+    def cache_info(self):
+        """Restituisce le statistiche della cache (CacheInfo)."""
+        return CacheInfo(self.hits, self.misses, self.evals, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Svuota la cache e azzera le statistiche."""
+        self._cache.clear()
+        self.hits = self.misses = self.evals = 0
+
+
+def cached(func=None, maxsize=2**16, vectorized=True):
+    """
+    Avvolge una funzione in una CachedFunction (utilizzabile anche come decoratore).
+
+        @cached(maxsize=10000)
+        def f(x):
+            ...
+
+        simpson(f, 0, 1, 1000)
+        simpson(f, 0, 1, 2000)   # metà dei nodi già in cache
+        f.cache_info()
+
+    Args:
+        func (callable, optional): Funzione f(x, *args) da memorizzare.
+        maxsize (int, optional): Numero massimo di punti conservati (None = illimitato).
+        vectorized (bool, optional): f accetta array (i punti mancanti sono valutati
+                                     con una sola chiamata).
+
+    Returns:
+        CachedFunction | callable: La funzione con cache, oppure il decoratore se
+        func non è indicata.
+    """
+    if func is None:
+        return functools.partial(cached, maxsize=maxsize, vectorized=vectorized)
+    return CachedFunction(func, maxsize=maxsize, vectorized=vectorized)
@@ -0,0 +1 @@
+from .recorder import record, Recorder, SolverStats, instrumented
@@ -0,0 +1,216 @@
+"""
+Modulo per la Strumentazione dei Solver.
+
+La registrazione è opzionale e si attiva con il context manager record():
+
+    with record() as rec:
+        bisezione(f, 0, 2)
+    rec.last.n_evals, rec.last.n_iter, rec.last.trace, rec.last.wall_time
+
+Per ogni chiamata di un solver decorato con @instrumented viene creato un
+oggetto SolverStats con il numero di valutazioni delle funzioni utente, le
+iterazioni (con l'errore di ciascuna: ea, norme dei residui, ...), i passi
+e il tempo di esecuzione.
+
+Fuori da record() la variabile globale ACTIVE vale None: il decoratore
+chiama direttamente la funzione originale e gli hook nei cicli si fermano
+al controllo 'if ACTIVE is not None', senza allocare né contare nulla.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+# Recorder attivo (None = strumentazione disabilitata)
+ACTIVE = None
+
+
+@dataclass
+class SolverStats:
+    """
+    Statistiche di una singola chiamata di un solver.
+
+    Attributes:
+        name (str): Nome del solver.
+        depth (int): Livello di annidamento (0 = chiamata diretta dell'utente).
+        n_evals (int): Valutazioni delle funzioni utente (f, df, g, ...).
+        n_iter (int): Iterazioni registrate.
+        n_steps (int): Passi di integrazione (solver di ODE).
+        n_rejected (int): Passi rifiutati (solver adattivi).
+        wall_time (float): Tempo di esecuzione in secondi.
+        converged (bool | None): True se il solver è terminato senza eccezioni.
+        trace (list[dict]): Valori registrati a ogni iterazione (se trace=True).
+    """
+    name: str
+    depth: int = 0
+    n_evals: int = 0
+    n_iter: int = 0
+    n_steps: int = 0
+    n_rejected: int = 0
+    wall_time: float = 0.0
+    converged: bool = None
+    trace: list = field(default_factory=list)
+
+
+class Recorder:
+    """
+    Raccoglie le statistiche di tutte le chiamate instrumentate dentro record().
+
+    Attributes:
+        runs (list[SolverStats]): Statistiche in ordine di chiamata.
+        trace (bool): Se True conserva i valori di ogni iterazione.
+        callback (callable | None): Chiamata come callback(stats, values) a ogni iterazione.
+    """
+
+    def __init__(self, trace=True, callback=None):
+        self.runs = []
+        self.trace = trace
+        self.callback = callback
+        self._stack = []
+
+    @property
+    def current(self):
+        """Statistiche del solver in esecuzione (il più interno), o None."""
+        return self._stack[-1] if self._stack else None
+
+    @property
+    def last(self):
+        """Statistiche dell'ultima chiamata di primo livello, o None."""
+        for stats in reversed(self.runs):
+            if stats.depth == 0:
+                return stats
+        return None
+
+    def by_name(self, name):
+        """Restituisce le statistiche di tutte le chiamate del solver 'name'."""
+        return [stats for stats in self.runs if stats.name == name]
+
+
+@contextmanager
+def record(trace=True, callback=None):
+    """
+    Attiva la strumentazione dei solver all'interno del blocco with.
+
+    Args:
+        trace (bool, optional): Conserva i valori di ogni iterazione in stats.trace.
+        callback (callable, optional): Funzione callback(stats, values) chiamata a ogni
+                                       iterazione (es. per log o grafici in tempo reale).
+
+    Yields:
+        Recorder: Oggetto con le statistiche raccolte (rec.runs, rec.last).
+    """
+    global ACTIVE
+    previous = ACTIVE
+    ACTIVE = Recorder(trace=trace, callback=callback)
+    try:
+        yield ACTIVE
+    finally:
+        ACTIVE = previous
+
+
+def iteration(**values):
+    """
+    Registra un'iterazione del solver corrente con i valori dati (es. ea=..., residual=...).
+    Va chiamata solo quando ACTIVE non è None.
+    """
+    stats = ACTIVE.current
+    if stats is None:
+        return
+    stats.n_iter += 1
+    if ACTIVE.trace:
+        stats.trace.append(values)
+    if ACTIVE.callback is not None:
+        ACTIVE.callback(stats, values)
+
+
+def steps(accepted=0, rejected=0):
+    """Aggiunge passi accettati/rifiutati al solver corrente (solo con ACTIVE non None)."""
+    stats = ACTIVE.current
+    if stats is not None:
+        stats.n_steps += accepted
+        stats.n_rejected += rejected
+
+
+def rename(name):
+    """
+    Cambia il nome con cui il solver corrente compare nelle statistiche (solo con
+    ACTIVE non None). Usato dai motori comuni (explicit_rk, symplectic) per
+    registrare il metodo effettivo (es. 'rk4') invece del nome del motore.
+    """
+    stats = ACTIVE.current
+    if stats is not None:
+        stats.name = name
+
+
+def _counting(func, stats):
+    """Avvolge una funzione utente contando le sue chiamate in stats.n_evals."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats.n_evals += 1
+        return func(*args, **kwargs)
+    wrapper._uncounted = func
+    return wrapper
+
+
+def uncounted(func):
+    """
+    Restituisce la funzione utente senza il contatore di valutazioni (se presente).
+    Da usare prima di compilare f con Numba: il wrapper Python non è compilabile.
+    """
+    return getattr(func, '_uncounted', func)
+
+
+def instrumented(name, evals=()):
+    """
+    Decoratore che registra le statistiche di un solver quando record() è attivo.
+
+    Args:
+        name (str): Nome con cui il solver compare nelle statistiche.
+        evals (tuple[str], optional): Nomi degli argomenti che sono funzioni utente
+                                      da contare (es. ('f', 'df')). Non vengono contate
+                                      con executor né dentro un ciclo compilato con Numba
+                                      (jit=True o backend Numba); se f non è compilabile
+                                      il percorso Python le conta normalmente.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = ACTIVE
+            if recorder is None:
+                return func(*args, **kwargs)
+
+            stats = SolverStats(name, depth=len(recorder._stack))
+            recorder.runs.append(stats)
+
+            # Con un executor (valutazioni nei worker, f da serializzare) la funzione
+            # utente non viene avvolta. Con jit e backend Numba sì: il ciclo compilato
+            # usa uncounted(f), mentre il ripiego in Python (f non compilabile) conta
+            bound = signature.bind(*args, **kwargs)
+            if evals and bound.arguments.get('executor') is None:
+                for arg in evals:
+                    if callable(bound.arguments.get(arg)):
+                        bound.arguments[arg] = _counting(bound.arguments[arg], stats)
+                args, kwargs = bound.args, bound.kwargs
+
+            recorder._stack.append(stats)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                stats.converged = False
+                raise
+            finally:
+                stats.wall_time = time.perf_counter() - start
+                recorder._stack.pop()
+            stats.converged = True
+            return result
+
+        return wrapper
+    return decorator
@@ -1,2 +1,40 @@
-from .trapezoidal import trapezoidal
-from .simpson import simpson
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from integration import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+# I moduli di trapezoidal e simpson hanno nomi privati (_trapezoidal.py, ...):
+# con lo stesso nome della funzione, l'import del sottomodulo la sostituirebbe
+# con il modulo come attributo del pacchetto.
+
+_EXPORTS = {
+    'trapezoidal': '_trapezoidal',
+    'simpson': '_simpson',
+    'gauss_legendre': 'gauss',
+    'gauss_lobatto': 'gauss',
+    'legendre_nodes': 'gauss',
+    'lobatto_nodes': 'gauss',
+    'trapezoidal_stream': 'streaming',
+    'simpson_stream': 'streaming',
+    'cumulative_trapezoidal_stream': 'streaming',
+    'cumulative_simpson_stream': 'streaming',
+    'tensor_simpson': 'cubature',
+    'tensor_gauss': 'cubature',
+    'sparse_grid': 'cubature',
+    'evaluate_nodes': 'parallel',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,10 +10,15 @@ Corso:       Metodi Numerici per l'Ingegneria
 """
 
 import numpy as np
-from .trapezoidal import trapezoidal
 
+from diagnostics.recorder import instrumented
 
-def simpson(f, a, b, n):
+from ._trapezoidal import trapezoidal
+from .parallel import evaluate_nodes
+
+
+@instrumented('simpson', evals=('f',))
+def simpson(f, a, b, n, args=(), executor=None, chunksize=64):
     """
     Calcola l'integrale definito di f(x) tra a e b.
 
@@ -23,14 +28,25 @@ def simpson(f, a, b, n):
       e Simpson 1/3 sui rimanenti.
     - Se n è PARI: Usa Simpson 1/3 su tutto l'intervallo.
 
+    Integrande vettoriali: se f(x, *args) restituisce un array di forma
+    (..., n + 1), la riduzione avviene sull'ultimo asse (campioni) e si
+    ottengono tutti gli integrali con una sola valutazione, ad esempio
+    f = lambda x, p: np.exp(-p[:, None] * x) per una famiglia di parametri p.
+
+    Con un executor (pool di processi o thread) f viene chiamata punto per
+    punto in parallelo: utile per integrande costose non vettorializzabili.
+
     Args:
-        f (callable): Funzione integranda.
+        f (callable): Funzione integranda f(x, *args).
         a (float): Estremo inferiore.
         b (float): Estremo superiore.
         n (int): Numero di intervalli.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+        executor (concurrent.futures.Executor, optional): Pool per la valutazione parallela.
+        chunksize (int, optional): Nodi per ogni task inviato all'executor.
 
     Returns:
-        float: Valore approssimato dell'integrale.
+        float | np.ndarray: Valore approssimato dell'integrale (forma (...) per integrande vettoriali).
     """
     # Controllo input base
     if n < 1:
@@ -41,11 +57,15 @@ def simpson(f, a, b, n):
     # CASO n=1:
     if n == 1:
         # Richiamiamo la funzione trapezoidal
-        return trapezoidal(f, a, b, n)
+        return trapezoidal(f, a, b, n, args=args, vectorized=True,
+                           executor=executor, chunksize=chunksize)
 
     # Generiamo tutti i nodi e le valutazioni della funzione
     x = np.linspace(a, b, n + 1)
-    y = f(x)
+    if executor is not None:
+        y = evaluate_nodes(f, x, executor, chunksize, args)
+    else:
+        y = np.asarray(f(x, *args))
 
     sum_val = 0.0
     m = n
@@ -55,7 +75,7 @@ def simpson(f, a, b, n):
         # Applichiamo Simpson 3/8 agli ultimi 3 intervalli (4 punti)
         # Punti coinvolti: n-3, n-2, n-1, n
         # Formula Simp38 (pannello b): 3h * (f0 + 3f1 + 3f2 + f3) / 8
-        sum_val += (3 * h / 8) * (y[n - 3] + 3 * y[n - 2] + 3 * y[n - 1] + y[n])
+        sum_val += (3 * h / 8) * (y[..., n - 3] + 3 * y[..., n - 2] + 3 * y[..., n - 1] + y[..., n])
 
         # Riduciamo m di 3, così trattiamo la parte restante con la 1/3
         m = n - 3
@@ -68,12 +88,12 @@ def simpson(f, a, b, n):
         # h/3 * (y0 + 4*(dispari) + 2*(pari) + ym)
 
         # Somma termini indici dispari (1, 3, ..., m-1)
-        sum_odds = 4 * np.sum(y[1:m:2])
+        sum_odds = 4 * np.sum(y[..., 1:m:2], axis=-1)
 
         # Somma termini indici pari (2, 4, ..., m-2)
-        sum_evens = 2 * np.sum(y[2:m:2])
+        sum_evens = 2 * np.sum(y[..., 2:m:2], axis=-1)
 
-        simpson_13_part = (h / 3) * (y[0] + sum_odds + sum_evens + y[m])
+        simpson_13_part = (h / 3) * (y[..., 0] + sum_odds + sum_evens + y[..., m])
 
         sum_val += simpson_13_part
 
@@ -0,0 +1,71 @@
+"""
+Modulo per l'Integrazione con il Metodo dei Trapezi.
+
+Questo modulo implementa la regola del trapezio per il calcolo approssimato
+di integrali definiti, gestendo sia l'applicazione su segmento singolo
+che la formula composta per intervalli multipli.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics.recorder import instrumented
+
+from .parallel import evaluate_nodes
+
+
+@instrumented('trapezoidal', evals=('f',))
+def trapezoidal(f, a, b, n, args=(), vectorized=False, executor=None, chunksize=64):
+    """
+    Calcola l'integrale definito usando la regola del Trapezio composta.
+
+    Di default f viene chiamata punto per punto (anche funzioni non vettoriali,
+    es. math.sin). Con vectorized=True f viene valutata una sola volta su tutti
+    i nodi: se restituisce un array di forma (..., n + 1) la somma avviene
+    sull'ultimo asse e si ottiene un integrale per ogni elemento di (...).
+    Con un executor (pool di processi o thread) i nodi vengono valutati in
+    parallelo a blocchi di chunksize punti; la somma finale avviene in ordine
+    fisso, quindi il risultato non dipende dal numero di worker.
+
+    Args:
+        f: La funzione da integrare f(x, *args)
+        a (float): Inizio dell'intervallo
+        b (float): Fine dell'intervallo
+        n (int): Numero di intervalli
+        args (tuple, optional): Argomenti aggiuntivi passati a f
+        vectorized (bool, optional): Valuta f con un'unica chiamata sui nodi
+        executor (concurrent.futures.Executor, optional): Pool per la valutazione parallela
+        chunksize (int, optional): Nodi per ogni task inviato all'executor
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale
+    """
+    if n < 1:
+        raise ValueError("Il numero di intervalli n deve essere >= 1")
+
+    # Calcolo del passo (h)
+    h = (b - a) / n
+
+    if vectorized or executor is not None:
+        x = np.linspace(a, b, n + 1)
+        if executor is not None:
+            # Valutazione parallela punto per punto, valori nell'ordine dei nodi
+            y = evaluate_nodes(f, x, executor, chunksize, args)
+        else:
+            # Un'unica valutazione su tutti i nodi, riduzione sull'asse dei campioni
+            y = np.asarray(f(x, *args))
+        somma = y[..., 0] + y[..., n] + 2 * np.sum(y[..., 1:n], axis=-1)
+        return (h / 2) * somma
+
+    # Valutazione estremi (f(a) + f(b))
+    somma = f(a, *args) + f(b, *args)
+
+    # Sommatoria dei punti interni moltiplicati per 2
+    for i in range(1, n):
+        x = a + i * h
+        somma += 2 * f(x, *args)
+
+    # Calcolo finale
+    return (h / 2) * somma
@@ -0,0 +1,216 @@
+"""
+Modulo per l'Integrazione Multidimensionale (Cubatura).
+
+Estende le regole 1-D del pacchetto a domini rettangolari in d dimensioni:
+- Prodotto tensoriale di Simpson (misto 1/3 + 3/8) o di Gauss-Legendre.
+- Griglie sparse di Smolyak (tecnica di combinazione) per d elevato,
+  dove il prodotto tensoriale richiederebbe n^d valutazioni.
+
+I nodi non vengono mai materializzati tutti insieme: la griglia viene
+percorsa a blocchi di al più 'block_size' punti e su ogni blocco si esegue
+una sola chiamata vettoriale f(x1, x2, ..., xd).
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+from math import comb
+
+import numpy as np
+
+from diagnostics.recorder import instrumented
+
+from .gauss import legendre_nodes
+
+
+def _simpson_rule(a, b, n):
+    """
+    Nodi e pesi 1-D della regola di Simpson mista (come `simpson`) su n intervalli.
+    """
+    if n < 1:
+        raise ValueError("Il numero di intervalli n deve essere almeno 1.")
+
+    h = (b - a) / n
+    x = np.linspace(a, b, n + 1)
+    w = np.zeros(n + 1)
+
+    if n == 1:
+        w[:] = h / 2
+        return x, w
+
+    m = n
+    if n % 2 != 0:
+        # Simpson 3/8 sugli ultimi 3 intervalli
+        w[n - 3:] += (3 * h / 8) * np.array([1.0, 3.0, 3.0, 1.0])
+        m = n - 3
+
+    if m > 1:
+        # Simpson 1/3 sui primi m intervalli
+        w[0] += h / 3
+        w[1:m:2] += 4 * h / 3
+        w[2:m:2] += 2 * h / 3
+        w[m] += h / 3
+
+    return x, w
+
+
+def _gauss_rule(a, b, n, order):
+    """
+    Nodi e pesi 1-D di Gauss-Legendre composta su n pannelli di [a, b].
+    """
+    if n < 1:
+        raise ValueError("Il numero di pannelli n deve essere almeno 1.")
+
+    t, wt = legendre_nodes(order)
+    h = (b - a) / n
+    mids = a + h / 2 + h * np.arange(n)
+
+    x = (mids[:, None] + (h / 2) * t[None, :]).ravel()
+    w = np.tile((h / 2) * wt, n)
+    return x, w
+
+
+def _per_dimension(value, d, name):
+    """Espande un parametro scalare in una lista con un valore per dimensione."""
+    if np.ndim(value) == 0:
+        return [int(value)] * d
+    if len(value) != d:
+        raise ValueError(f"Il parametro {name} deve avere un valore per ciascuna delle {d} dimensioni.")
+    return [int(v) for v in value]
+
+
+def _tensor_sum(f, rules, block_size, args):
+    """
+    Somma pesata di f sul prodotto tensoriale delle regole 1-D, a blocchi.
+
+    Ogni blocco contiene al più block_size punti: gli indici lineari vengono
+    convertiti in multi-indici (np.unravel_index) e il peso di ogni punto è il
+    prodotto dei pesi 1-D. La memoria è quindi O(block_size * d).
+    """
+    if block_size < 1:
+        raise ValueError("La dimensione del blocco block_size deve essere almeno 1.")
+
+    shape = tuple(len(x) for x, _ in rules)
+    total_points = int(np.prod(shape))
+
+    result = 0.0
+    for start in range(0, total_points, block_size):
+        idx = np.unravel_index(np.arange(start, min(start + block_size, total_points)), shape)
+
+        coords = [x[i] for (x, _), i in zip(rules, idx)]
+        w = rules[0][1][idx[0]]
+        for (_, wk), i in zip(rules[1:], idx[1:]):
+            w = w * wk[i]
+
+        y = np.asarray(f(*coords, *args))
+        result = result + np.dot(y, w)
+
+    return result
+
+
+@instrumented('tensor_simpson', evals=('f',))
+def tensor_simpson(f, bounds, n, block_size=65536, args=()):
+    """
+    Integrale su un dominio rettangolare con il prodotto tensoriale di Simpson.
+
+    Lungo ogni asse si usa la regola di Simpson mista (1/3 + 3/8 se n è dispari,
+    Trapezi se n = 1), come in `simpson`.
+
+    Args:
+        f (callable): Integranda vettoriale f(x1, ..., xd, *args). Riceve d array
+                      di coordinate della stessa lunghezza e restituisce (..., punti).
+        bounds (list[tuple]): Estremi [(a1, b1), ..., (ad, bd)].
+        n (int | list[int]): Numero di intervalli (uno per dimensione o comune).
+        block_size (int, optional): Numero massimo di punti valutati per chiamata.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+    """
+    d = len(bounds)
+    ns = _per_dimension(n, d, "n")
+    rules = [_simpson_rule(a, b, nk) for (a, b), nk in zip(bounds, ns)]
+    return _tensor_sum(f, rules, block_size, args)
+
+
+@instrumented('tensor_gauss', evals=('f',))
+def tensor_gauss(f, bounds, n=1, order=5, block_size=65536, args=()):
+    """
+    Integrale su un dominio rettangolare con il prodotto tensoriale di Gauss-Legendre.
+
+    Args:
+        f (callable): Integranda vettoriale f(x1, ..., xd, *args).
+        bounds (list[tuple]): Estremi [(a1, b1), ..., (ad, bd)].
+        n (int | list[int]): Numero di pannelli per dimensione.
+        order (int | list[int]): Nodi di Gauss per pannello in ogni dimensione.
+        block_size (int, optional): Numero massimo di punti valutati per chiamata.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+    """
+    d = len(bounds)
+    ns = _per_dimension(n, d, "n")
+    orders = _per_dimension(order, d, "order")
+    rules = [_gauss_rule(a, b, nk, ok) for (a, b), nk, ok in zip(bounds, ns, orders)]
+    return _tensor_sum(f, rules, block_size, args)
+
+
+def _multi_indices(d, total_min, total_max):
+    """Genera i multi-indici i (i_k >= 1) con total_min <= |i| <= total_max."""
+    if d == 1:
+        for i in range(max(total_min, 1), total_max + 1):
+            yield (i,)
+        return
+
+    # Gli altri d-1 indici valgono almeno 1 ciascuno
+    for first in range(1, total_max - (d - 1) + 1):
+        for rest in _multi_indices(d - 1, total_min - first, total_max - first):
+            yield (first,) + rest
+
+
+@instrumented('sparse_grid', evals=('f',))
+def sparse_grid(f, bounds, level, block_size=65536, args=()):
+    """
+    Integrale su un dominio rettangolare con la griglia sparsa di Smolyak.
+
+    Usa la tecnica di combinazione con regole 1-D di Gauss-Legendre
+    (m(i) = 2i - 1 nodi al livello i):
+
+        A(q, d) = sum_{q-d+1 <= |i| <= q} (-1)^(q-|i|) * C(d-1, q-|i|) * (U^i1 x ... x U^id)
+
+    con q = d + level. Il numero di punti cresce solo polinomialmente con d,
+    a differenza di n^d del prodotto tensoriale.
+
+    Args:
+        f (callable): Integranda vettoriale f(x1, ..., xd, *args).
+        bounds (list[tuple]): Estremi [(a1, b1), ..., (ad, bd)].
+        level (int): Livello di raffinamento (>= 0).
+        block_size (int, optional): Numero massimo di punti valutati per chiamata.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+    """
+    if level < 0:
+        raise ValueError("Il livello della griglia sparsa deve essere >= 0.")
+
+    d = len(bounds)
+    q = d + level
+
+    # Regole 1-D per livello, condivise tra i termini della combinazione
+    rules_1d = [{} for _ in range(d)]
+
+    result = 0.0
+    for idx in _multi_indices(d, max(q - d + 1, d), q):
+        coeff = (-1) ** (q - sum(idx)) * comb(d - 1, q - sum(idx))
+
+        rules = []
+        for k, (i, (a, b)) in enumerate(zip(idx, bounds)):
+            if i not in rules_1d[k]:
+                rules_1d[k][i] = _gauss_rule(a, b, 1, 2 * i - 1)
+            rules.append(rules_1d[k][i])
+
+        result = result + coeff * _tensor_sum(f, rules, block_size, args)
+
+    return result
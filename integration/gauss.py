@@ -0,0 +1,184 @@
+"""
+Modulo per l'Integrazione Numerica (Quadratura Gaussiana).
+
+Implementa le regole composte di Gauss-Legendre e Gauss-Lobatto.
+Nodi e pesi di riferimento su [-1, 1] vengono calcolati una sola volta
+per ogni ordine e conservati in una cache LRU:
+- Gauss-Legendre: algoritmo di Golub-Welsch (autovalori della matrice di Jacobi).
+- Gauss-Lobatto: iterazione di Newton sui polinomi di Legendre.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from diagnostics.recorder import instrumented
+
+from .parallel import evaluate_nodes
+
+
+@lru_cache(maxsize=64)
+def legendre_nodes(order):
+    """
+    Calcola nodi e pesi di Gauss-Legendre su [-1, 1] (Golub-Welsch).
+
+    I nodi sono gli autovalori della matrice tridiagonale simmetrica di Jacobi
+    associata ai polinomi di Legendre; i pesi si ricavano dalla prima
+    componente degli autovettori normalizzati.
+
+    Args:
+        order (int): Numero di nodi (>= 1). La regola è esatta per polinomi di grado 2*order - 1.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (nodi, pesi) in sola lettura.
+    """
+    if order < 1:
+        raise ValueError("L'ordine della regola di Gauss-Legendre deve essere almeno 1.")
+
+    k = np.arange(1, order)
+    beta = k / np.sqrt(4.0 * k ** 2 - 1.0)
+
+    J = np.diag(beta, 1) + np.diag(beta, -1)
+    nodes, vectors = np.linalg.eigh(J)
+    weights = 2.0 * vectors[0, :] ** 2
+
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+@lru_cache(maxsize=64)
+def lobatto_nodes(order, tol=1e-15, max_iter=100):
+    """
+    Calcola nodi e pesi di Gauss-Lobatto su [-1, 1] (Newton sui polinomi di Legendre).
+
+    I nodi sono gli estremi -1, 1 e gli zeri di P'_{order-1}(x). Si parte dai
+    nodi di Chebyshev-Gauss-Lobatto e si itera Newton sulla formula
+    (1 - x^2) P'_N(x) = N (P_{N-1}(x) - x P_N(x)), con N = order - 1.
+
+    Args:
+        order (int): Numero di nodi (>= 2), estremi inclusi.
+        tol (float): Tolleranza sullo spostamento dei nodi.
+        max_iter (int): Numero massimo di iterazioni di Newton.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (nodi, pesi) in sola lettura, nodi crescenti.
+
+    Raises:
+        RuntimeError: Se l'iterazione di Newton non converge.
+    """
+    if order < 2:
+        raise ValueError("L'ordine della regola di Gauss-Lobatto deve essere almeno 2.")
+
+    N = order - 1
+
+    # Stima iniziale: nodi di Chebyshev-Gauss-Lobatto
+    x = np.cos(np.pi * np.arange(order) / N)
+    P = np.zeros((order, order))
+
+    for it in range(max_iter):
+        x_old = x.copy()
+
+        # Ricorrenza di Bonnet: P[:, k] = P_k(x)
+        P[:, 0] = 1.0
+        P[:, 1] = x
+        for k in range(2, order):
+            P[:, k] = ((2 * k - 1) * x * P[:, k - 1] - (k - 1) * P[:, k - 2]) / k
+
+        # Passo di Newton sulla funzione P_{N-1}(x) - x P_N(x) (nulla nei nodi)
+        x = x_old - (x * P[:, N] - P[:, N - 1]) / (order * P[:, N])
+
+        if np.max(np.abs(x - x_old)) < tol:
+            break
+    else:
+        raise RuntimeError(f"Newton per i nodi di Gauss-Lobatto non ha convertito dopo {max_iter} iterazioni.")
+
+    weights = 2.0 / (N * order * P[:, N] ** 2)
+
+    # Ordiniamo in senso crescente (i coseni partono da +1)
+    nodes = x[::-1].copy()
+    weights = weights[::-1].copy()
+
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+def _composite_gauss(f, a, b, n, nodes, weights, args, executor, chunksize):
+    """
+    Applica una regola di riferimento su n pannelli uguali di [a, b]
+    con un'unica valutazione vettoriale di f su tutti i nodi.
+    Se f restituisce (..., n_nodi) la riduzione avviene sull'ultimo asse.
+    """
+    if n < 1:
+        raise ValueError("Il numero di pannelli n deve essere almeno 1.")
+
+    h = (b - a) / n
+    half = h / 2
+
+    # Punti medi dei pannelli (n, 1) + nodi scalati (1, order) -> (n, order)
+    mids = a + half + h * np.arange(n)
+    x = (mids[:, None] + half * nodes[None, :]).ravel()
+
+    if executor is not None:
+        y = evaluate_nodes(f, x, executor, chunksize, args)
+    else:
+        y = np.asarray(f(x, *args))
+
+    # Pesi ripetuti su ogni pannello: il prodotto scalare riduce sull'ultimo asse
+    w = np.tile(weights, n)
+    return half * np.dot(y, w)
+
+
+@instrumented('gauss_legendre', evals=('f',))
+def gauss_legendre(f, a, b, n=1, order=5, args=(), executor=None, chunksize=64):
+    """
+    Calcola l'integrale definito di f(x) tra a e b con Gauss-Legendre composta.
+
+    L'intervallo viene diviso in n pannelli e su ciascuno si applica la regola
+    a 'order' nodi (esatta per polinomi di grado 2*order - 1). La funzione
+    viene valutata con una sola chiamata vettoriale su tutti i nodi.
+
+    Args:
+        f (callable): Funzione integranda f(x, *args) (deve accettare un np.ndarray).
+        a (float): Estremo inferiore.
+        b (float): Estremo superiore.
+        n (int): Numero di pannelli.
+        order (int): Numero di nodi per pannello.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+        executor (concurrent.futures.Executor, optional): Pool per la valutazione parallela punto per punto.
+        chunksize (int, optional): Nodi per ogni task inviato all'executor.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale (forma (...) per integrande vettoriali).
+    """
+    nodes, weights = legendre_nodes(order)
+    return _composite_gauss(f, a, b, n, nodes, weights, args, executor, chunksize)
+
+
+@instrumented('gauss_lobatto', evals=('f',))
+def gauss_lobatto(f, a, b, n=1, order=5, args=(), executor=None, chunksize=64):
+    """
+    Calcola l'integrale definito di f(x) tra a e b con Gauss-Lobatto composta.
+
+    Come Gauss-Legendre, ma include gli estremi di ogni pannello tra i nodi
+    (esatta per polinomi di grado 2*order - 3).
+
+    Args:
+        f (callable): Funzione integranda f(x, *args) (deve accettare un np.ndarray).
+        a (float): Estremo inferiore.
+        b (float): Estremo superiore.
+        n (int): Numero di pannelli.
+        order (int): Numero di nodi per pannello (>= 2).
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+        executor (concurrent.futures.Executor, optional): Pool per la valutazione parallela punto per punto.
+        chunksize (int, optional): Nodi per ogni task inviato all'executor.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale (forma (...) per integrande vettoriali).
+    """
+    nodes, weights = lobatto_nodes(order)
+    return _composite_gauss(f, a, b, n, nodes, weights, args, executor, chunksize)
@@ -0,0 +1,53 @@
+"""
+Modulo per la Valutazione Parallela delle Integrande.
+
+Per integrande costose e non vettorializzabili (es. una simulazione che
+richiede millisecondi per chiamata) i nodi vengono suddivisi in blocchi e
+valutati su un pool di `concurrent.futures` (ProcessPoolExecutor o
+ThreadPoolExecutor). I valori tornano nell'ordine dei nodi e la somma
+pesata viene eseguita dal processo principale sempre nello stesso ordine:
+il risultato è identico bit per bit qualunque siano il numero di worker
+e la dimensione dei blocchi.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+from itertools import repeat
+
+import numpy as np
+
+
+def _eval_chunk(f, xs, args):
+    """Valuta f punto per punto su un blocco di nodi (eseguita nel worker)."""
+    return [f(x, *args) for x in xs]
+
+
+def evaluate_nodes(f, x, executor, chunksize=64, args=()):
+    """
+    Valuta f(x_i, *args) su tutti i nodi distribuendo i blocchi su un executor.
+
+    Con ProcessPoolExecutor f deve essere serializzabile (pickle), cioè
+    definita a livello di modulo.
+
+    Args:
+        f (callable): Funzione scalare f(x, *args).
+        x (np.ndarray): Nodi in cui valutare f.
+        executor (concurrent.futures.Executor): Pool di processi o thread.
+        chunksize (int, optional): Nodi per ogni task inviato al pool.
+        args (tuple, optional): Argomenti aggiuntivi passati a f.
+
+    Returns:
+        np.ndarray: Valori di f nei nodi, forma (..., len(x)) se f è vettoriale.
+    """
+    if chunksize < 1:
+        raise ValueError("La dimensione dei blocchi chunksize deve essere almeno 1.")
+
+    chunks = [x[i:i + chunksize] for i in range(0, len(x), chunksize)]
+
+    # executor.map restituisce i risultati nell'ordine dei blocchi
+    parts = executor.map(_eval_chunk, repeat(f), chunks, repeat(args))
+    values = np.array([v for part in parts for v in part], dtype=float)
+
+    # Asse dei campioni in ultima posizione, come per le integrande vettoriali
+    return np.moveaxis(values, 0, -1)
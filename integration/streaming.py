@@ -0,0 +1,191 @@
+"""
+Modulo per l'Integrazione in Streaming di Segnali Campionati.
+
+Integra segnali equispaziati (passo h) letti a blocchi da un iteratore,
+da un array o da un np.memmap su disco, senza mai tenere in memoria
+l'intero segnale. Tra un blocco e il successivo si conservano solo pochi
+campioni di bordo e i valori cumulativi necessari, così la memoria resta
+costante e la regola di Simpson mista (1/3 + 3/8 per n dispari) coincide
+con quella di `simpson` applicata all'intero segnale.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+
+def _iter_chunks(samples, chunk_size):
+    """
+    Restituisce i blocchi (..., L) del segnale. Gli array (anche np.memmap)
+    vengono letti a fette lungo l'ultimo asse; gli iterabili sono usati così come sono.
+    """
+    if chunk_size < 1:
+        raise ValueError("La dimensione del blocco chunk_size deve essere almeno 1.")
+
+    if isinstance(samples, np.ndarray):
+        n = samples.shape[-1]
+        for start in range(0, n, chunk_size):
+            yield np.asarray(samples[..., start:start + chunk_size], dtype=float)
+        return
+
+    for chunk in samples:
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.ndim == 0:
+            chunk = chunk[None]
+        if chunk.shape[-1] > 0:
+            yield chunk
+
+
+def cumulative_trapezoidal_stream(samples, h, chunk_size=65536):
+    """
+    Integrale cumulativo con la regola dei Trapezi, blocco per blocco.
+
+    Per ogni blocco in ingresso produce l'array degli integrali da x_0 fino
+    a ciascun campione del blocco (il primo valore assoluto è 0).
+
+    Args:
+        samples (iterable | np.ndarray): Blocchi di campioni (..., L) o array/np.memmap completo.
+        h (float): Passo di campionamento.
+        chunk_size (int, optional): Dimensione dei blocchi per array e np.memmap.
+
+    Yields:
+        np.ndarray: Integrale cumulativo nei campioni del blocco corrente.
+    """
+    total = 0.0
+    last = None
+
+    for chunk in _iter_chunks(samples, chunk_size):
+        if last is None:
+            # Primo blocco: l'integrale nel primo campione vale 0
+            zero = np.zeros(chunk.shape[:-1] + (1,))
+            steps = (h / 2) * (chunk[..., :-1] + chunk[..., 1:])
+            out = np.concatenate((zero, np.cumsum(steps, axis=-1)), axis=-1)
+        else:
+            ext = np.concatenate((last, chunk), axis=-1)
+            steps = (h / 2) * (ext[..., :-1] + ext[..., 1:])
+            out = total[..., None] + np.cumsum(steps, axis=-1)
+
+        total = out[..., -1]
+        last = chunk[..., -1:]
+        yield out
+
+
+def trapezoidal_stream(samples, h, chunk_size=65536):
+    """
+    Integrale con la regola dei Trapezi composta su un segnale letto a blocchi.
+
+    Args:
+        samples (iterable | np.ndarray): Blocchi di campioni (..., L) o array/np.memmap completo.
+        h (float): Passo di campionamento.
+        chunk_size (int, optional): Dimensione dei blocchi per array e np.memmap.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+
+    Raises:
+        ValueError: Se il segnale contiene meno di 2 campioni.
+    """
+    return _last_value(cumulative_trapezoidal_stream(samples, h, chunk_size))
+
+
+def cumulative_simpson_stream(samples, h, chunk_size=65536):
+    """
+    Integrale cumulativo con la regola di Simpson mista, blocco per blocco.
+
+    Il valore nel campione k è quello che `simpson` restituirebbe sui primi
+    k intervalli: Simpson 1/3 se k è pari, Simpson 1/3 + 3/8 sugli ultimi
+    tre intervalli se k è dispari (> 1), Trapezi se k = 1.
+
+    Tra i blocchi si conservano al più 4 campioni e il valore cumulativo
+    Simpson 1/3 nel primo di essi (indice pari), quindi la memoria non
+    dipende dalla lunghezza del segnale.
+
+    Args:
+        samples (iterable | np.ndarray): Blocchi di campioni (..., L) o array/np.memmap completo.
+        h (float): Passo di campionamento.
+        chunk_size (int, optional): Dimensione dei blocchi per array e np.memmap.
+
+    Yields:
+        np.ndarray: Integrale cumulativo nei campioni del blocco corrente.
+    """
+    count = 0      # Campioni già consumati
+    g0 = 0         # Indice globale (pari) del primo campione conservato
+    carry = None   # Campioni conservati da g0 a count - 1
+    c0 = 0.0       # Integrale Simpson 1/3 cumulativo in g0
+
+    for chunk in _iter_chunks(samples, chunk_size):
+        ext = chunk if carry is None else np.concatenate((carry, chunk), axis=-1)
+        L = ext.shape[-1]
+        c0_b = np.asarray(c0)[..., None]
+
+        # Cumulativo Simpson 1/3 negli indici locali pari 0, 2, ..., 2m
+        m = (L - 1) // 2
+        pairs = (h / 3) * (ext[..., 0:2 * m:2] + 4 * ext[..., 1:2 * m:2] + ext[..., 2:2 * m + 1:2])
+        c_even = np.concatenate((np.broadcast_to(c0_b, pairs.shape[:-1] + (1,)),
+                                 c0_b + np.cumsum(pairs, axis=-1)), axis=-1)
+
+        # Indici locali dei campioni del blocco corrente
+        j = np.arange(count - g0, L)
+        out = np.empty(ext.shape[:-1] + (len(j),))
+
+        even = j % 2 == 0
+        out[..., even] = c_even[..., j[even] // 2]
+
+        odd = ~even
+        jo = j[odd]
+        # k = 1 globale: un solo intervallo, regola dei Trapezi
+        first = (g0 + jo) == 1
+        if np.any(first):
+            out[..., np.flatnonzero(odd)[first]] = (h / 2) * (ext[..., 0:1] + ext[..., 1:2])
+        # k dispari >= 3: Simpson 1/3 fino a k-3, poi Simpson 3/8 sugli ultimi tre intervalli
+        jr = jo[~first]
+        if len(jr):
+            simp38 = (3 * h / 8) * (ext[..., jr - 3] + 3 * ext[..., jr - 2] + 3 * ext[..., jr - 1] + ext[..., jr])
+            out[..., np.flatnonzero(odd)[~first]] = c_even[..., (jr - 3) // 2] + simp38
+
+        # Aggiornamento stato: ultimo indice pari e, si conserva da e - 2 (se esiste)
+        count += chunk.shape[-1]
+        e = (count - 1) - ((count - 1) % 2)
+        new_g0 = max(e - 2, 0)
+        c0 = c_even[..., (new_g0 - g0) // 2]
+        carry = ext[..., new_g0 - g0:]
+        g0 = new_g0
+
+        yield out
+
+
+def simpson_stream(samples, h, chunk_size=65536):
+    """
+    Integrale con la regola di Simpson mista su un segnale letto a blocchi.
+
+    Equivale a `simpson` sull'intero segnale (n = numero di campioni - 1
+    intervalli), ma con memoria costante: la parità di n viene risolta
+    solo alla fine del flusso.
+
+    Args:
+        samples (iterable | np.ndarray): Blocchi di campioni (..., L) o array/np.memmap completo.
+        h (float): Passo di campionamento.
+        chunk_size (int, optional): Dimensione dei blocchi per array e np.memmap.
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+
+    Raises:
+        ValueError: Se il segnale contiene meno di 2 campioni.
+    """
+    return _last_value(cumulative_simpson_stream(samples, h, chunk_size))
+
+
+def _last_value(cumulative):
+    """Consuma un generatore cumulativo e restituisce l'integrale totale."""
+    out = None
+    n_samples = 0
+    for out in cumulative:
+        n_samples += out.shape[-1]
+
+    if n_samples < 2:
+        raise ValueError("Sono necessari almeno 2 campioni per integrare il segnale.")
+
+    result = out[..., -1]
+    return float(result) if result.ndim == 0 else result
@@ -1 +1,25 @@
-from .polynomial import lagrange, newton, chebyshev_nodes
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from interpolation import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+_EXPORTS = {
+    'lagrange': 'polynomial',
+    'newton': 'polynomial',
+    'chebyshev_nodes': 'polynomial',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
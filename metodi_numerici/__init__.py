@@ -0,0 +1,42 @@
+"""
+Pacchetto principale di Metodi Numerici.
+
+    import metodi_numerici as mn
+
+    mn.solve_ivp(f, 0, [1, 0], 10, method='rk4', h=0.01)
+    mn.integrate(np.sin, 0, np.pi, method='simpson', n=100)
+    mn.roots.bisezione(f, 2, 3)
+
+L'import non carica NumPy né alcun solver: i sottopacchetti sono importati
+al primo accesso come attributi (PEP 562) e le funzioni del registro
+importano solo il modulo del metodo richiesto. Utile per script e processi
+di breve durata, dove il tempo di avvio conta.
+
+I sottopacchetti (roots, systems, ...) si trovano nella radice della
+repository, che deve essere nel percorso di import.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import importlib
+
+from .registry import REGISTRY, register, get_solver, solve_ivp, integrate, find_root, solve_linear
+
+SUBPACKAGES = ('roots', 'systems', 'interpolation', 'integration', 'ode', 'regression',
+               'diagnostics', 'backend', 'caching')
+
+__all__ = ['REGISTRY', 'register', 'get_solver', 'solve_ivp', 'integrate', 'find_root',
+           'solve_linear', *SUBPACKAGES]
+
+
+def __getattr__(name):
+    if name not in SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(name)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
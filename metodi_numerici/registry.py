@@ -0,0 +1,169 @@
+"""
+Modulo del Registro dei Metodi.
+
+Associa ad ogni famiglia di problemi (solve_ivp, integrate, find_root,
+solve_linear) i metodi disponibili, indicati come (pacchetto, funzione).
+I nomi sono letti dal pacchetto, che importa solo il sottomodulo che li
+definisce, quindi solve_ivp(..., method='rk4') non carica né i solver stiff
+né integration.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import importlib
+
+REGISTRY = {
+    # f(x, y), x0, y0, x_end, ...
+    'solve_ivp': {
+        'euler': ('ode', 'euler'),
+        'heun': ('ode', 'heun'),
+        'heun_iterative': ('ode', 'heun_iterative'),
+        'midpoint': ('ode', 'midpoint'),
+        'ralston': ('ode', 'ralston'),
+        'rk4': ('ode', 'rk4'),
+        'rk45': ('ode', 'rk45'),
+        'abm': ('ode', 'adams_bashforth_moulton'),
+        'backward_euler': ('ode', 'backward_euler'),
+        'bdf': ('ode', 'bdf'),
+        'rosenbrock': ('ode', 'rosenbrock'),
+    },
+    # f(x), a, b, ...
+    'integrate': {
+        'trapezoidal': ('integration', 'trapezoidal'),
+        'simpson': ('integration', 'simpson'),
+        'gauss_legendre': ('integration', 'gauss_legendre'),
+        'gauss_lobatto': ('integration', 'gauss_lobatto'),
+    },
+    # f, argomenti del metodo (intervallo, derivata o stime iniziali), ...
+    'find_root': {
+        'bisezione': ('roots', 'bisezione'),
+        'falsa_posizione': ('roots', 'falsa_posizione'),
+        'newton_raphson': ('roots', 'newton_raphson'),
+        'secanti': ('roots', 'secanti'),
+        'fixed_point': ('roots', 'fixed_point'),
+    },
+    # A, b, ...
+    'solve_linear': {
+        'gauss_elimination': ('systems', 'gauss_elimination'),
+        'gauss_seidel': ('systems', 'gauss_seidel'),
+        'jacobi': ('systems', 'jacobi'),
+    },
+}
+
+
+def register(kind, method, module, name):
+    """
+    Aggiunge (o sostituisce) un metodo nel registro.
+
+    Args:
+        kind (str): Famiglia di problemi (es. 'solve_ivp').
+        method (str): Nome con cui il metodo viene richiesto.
+        module (str): Modulo o pacchetto che definisce il solver (es. 'mio_pacchetto.solver').
+        name (str): Nome della funzione nel modulo.
+
+    Raises:
+        ValueError: Se la famiglia non esiste.
+    """
+    if kind not in REGISTRY:
+        raise ValueError(f"Famiglia '{kind}' sconosciuta. Disponibili: {', '.join(REGISTRY)}.")
+    REGISTRY[kind][method] = (module, name)
+
+
+def get_solver(kind, method):
+    """
+    Restituisce il solver registrato, importando solo il suo modulo.
+
+    Args:
+        kind (str): Famiglia di problemi ('solve_ivp', 'integrate', 'find_root', 'solve_linear').
+        method (str): Nome del metodo.
+
+    Returns:
+        callable: La funzione del solver.
+
+    Raises:
+        ValueError: Se la famiglia o il metodo non esistono.
+    """
+    if kind not in REGISTRY:
+        raise ValueError(f"Famiglia '{kind}' sconosciuta. Disponibili: {', '.join(REGISTRY)}.")
+    methods = REGISTRY[kind]
+    if method not in methods:
+        raise ValueError(f"Metodo '{method}' sconosciuto. Disponibili: {', '.join(methods)}.")
+    module, name = methods[method]
+    return getattr(importlib.import_module(module), name)
+
+
+def solve_ivp(f, x0, y0, x_end, method='rk4', **options):
+    """
+    Risolve un problema ai valori iniziali con il metodo scelto.
+
+        solve_ivp(f, 0, [1, 0], 10, method='rk4', h=0.01)
+        solve_ivp(f, 0, [1, 0], 10, method='rk45', rtol=1e-8)
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y.
+        x_end (float): Valore finale x.
+        method (str, optional): Metodo in REGISTRY['solve_ivp']. Default 'rk4'.
+        **options: Argomenti del solver (es. h per i metodi a passo fisso).
+
+    Returns:
+        Il risultato del solver (di norma la tupla (x, y)).
+    """
+    return get_solver('solve_ivp', method)(f, x0, y0, x_end, **options)
+
+
+def integrate(f, a, b, method='simpson', **options):
+    """
+    Calcola l'integrale definito di f tra a e b con il metodo scelto.
+
+        integrate(np.sin, 0, np.pi, method='simpson', n=100)
+        integrate(np.sin, 0, np.pi, method='gauss_legendre', n=4, order=5)
+
+    Args:
+        f (callable): Funzione integranda f(x, *args).
+        a (float): Estremo inferiore.
+        b (float): Estremo superiore.
+        method (str, optional): Metodo in REGISTRY['integrate']. Default 'simpson'.
+        **options: Argomenti del solver (es. n, args, executor).
+
+    Returns:
+        float | np.ndarray: Valore approssimato dell'integrale.
+    """
+    return get_solver('integrate', method)(f, a, b, **options)
+
+
+def find_root(f, *args, method='bisezione', **options):
+    """
+    Trova uno zero di f con il metodo scelto.
+
+        find_root(f, 2, 3, method='bisezione', tol=1e-10)
+        find_root(f, df, 2, method='newton_raphson')
+
+    Args:
+        f (callable): Funzione di cui trovare lo zero (g(x) per fixed_point).
+        *args: Argomenti posizionali del metodo (intervallo, derivata, stime iniziali).
+        method (str, optional): Metodo in REGISTRY['find_root']. Default 'bisezione'.
+        **options: Argomenti del solver (es. tol, max_iter).
+
+    Returns:
+        float: La radice approssimata.
+    """
+    return get_solver('find_root', method)(f, *args, **options)
+
+
+def solve_linear(A, b, method='gauss_elimination', **options):
+    """
+    Risolve il sistema lineare Ax = b con il metodo scelto.
+
+    Args:
+        A (array): Matrice dei coefficienti (n x n).
+        b (array): Vettore dei termini noti (n).
+        method (str, optional): Metodo in REGISTRY['solve_linear']. Default 'gauss_elimination'.
+        **options: Argomenti del solver (es. tol, x0, backend).
+
+    Returns:
+        np.ndarray: Il vettore soluzione x.
+    """
+    return get_solver('solve_linear', method)(A, b, **options)
@@ -1 +1,45 @@
-from .solvers import euler, heun, heun_iterative, midpoint, ralston, rk4
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from ode import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+_EXPORTS = {
+    'euler': 'solvers',
+    'heun': 'solvers',
+    'heun_iterative': 'solvers',
+    'midpoint': 'solvers',
+    'ralston': 'solvers',
+    'rk4': 'solvers',
+    'symplectic': 'solvers',
+    'velocity_verlet': 'solvers',
+    'leapfrog': 'solvers',
+    'yoshida4': 'solvers',
+    'forest_ruth': 'solvers',
+    'rk45': 'adaptive',
+    'backward_euler': 'stiff',
+    'bdf': 'stiff',
+    'rosenbrock': 'stiff',
+    'rk4_ensemble': 'ensemble',
+    'ensemble_rk': 'ensemble',
+    'explicit_rk': 'runge_kutta',
+    'iter_explicit_rk': 'runge_kutta',
+    'adams_bashforth_moulton': 'multistep',
+    'shooting': 'bvp',
+    'finite_differences': 'bvp',
+    'finite_differences_nonlinear': 'bvp',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,305 @@
+"""
+Modulo per la risoluzione di ODE a Passo Adattivo.
+
+Implementa il metodo di Runge-Kutta embedded di Dormand-Prince 5(4):
+- Stima dell'errore locale dalla differenza tra le soluzioni di ordine 5 e 4.
+- Controllo del passo PI (proporzionale-integrale), più stabile del solo
+  controllo proporzionale quando il passo oscilla.
+- FSAL (First Same As Last): l'ultimo stadio di un passo accettato è il
+  primo del passo successivo, quindi servono 6 valutazioni di f per passo.
+- Uscita densa: interpolante di ordine 4 su ogni passo, per campionare la
+  soluzione in istanti arbitrari senza forzare passi piccoli.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+from .events import prepare_events, evaluate_events, detect_events
+
+# --- Tableau di Dormand-Prince 5(4) ---
+C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+
+A = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [1/5, 0, 0, 0, 0, 0],
+    [3/40, 9/40, 0, 0, 0, 0],
+    [44/45, -56/15, 32/9, 0, 0, 0],
+    [19372/6561, -25360/2187, 64448/6561, -212/729, 0, 0],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+])
+
+# Pesi della soluzione di ordine 5 (coincidono con l'ultima riga di A: FSAL)
+B = A[6]
+
+# Differenza tra pesi di ordine 5 e 4 (stima dell'errore locale)
+E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+
+# Coefficienti dell'uscita densa: y(x + s*h) = y + h * K^T @ (P @ [s, s^2, s^3, s^4])
+P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+# Parametri del controllore PI (Hairer-Wanner)
+SAFETY = 0.9
+BETA = 0.04
+ALPHA = 1/5 - 0.75 * BETA
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+
+
+def _rms_norm(v):
+    """Norma quadratica media (RMS) di un vettore."""
+    return np.sqrt(np.mean(v ** 2))
+
+
+def _initial_step(fun, x0, y0, f0, rtol, atol):
+    """
+    Stima del passo iniziale (Hairer-Norsett-Wanner, Sez. II.4).
+    """
+    scale = atol + np.abs(y0) * rtol
+    d0 = _rms_norm(y0 / scale)
+    d1 = _rms_norm(f0 / scale)
+
+    if d0 < 1e-5 or d1 < 1e-5:
+        h0 = 1e-6
+    else:
+        h0 = 0.01 * d0 / d1
+
+    y1 = y0 + h0 * f0
+    f1 = fun(x0 + h0, y1)
+    d2 = _rms_norm((f1 - f0) / scale) / h0
+
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+
+    return min(100 * h0, h1)
+
+
+def dense_eval(y_old, h, K, s):
+    """
+    Valuta l'interpolante densa di Dormand-Prince all'interno di un passo.
+
+    Args:
+        y_old (np.ndarray): Soluzione all'inizio del passo (n_variabili,).
+        h (float): Ampiezza del passo.
+        K (np.ndarray): Stadi del passo (7, n_variabili).
+        s (float | np.ndarray): Posizione/i relativa/e nel passo, 0 <= s <= 1.
+
+    Returns:
+        np.ndarray: Soluzione interpolata, forma (len(s), n_variabili) o (n_variabili,).
+    """
+    s = np.asarray(s, dtype=float)
+    powers = s[..., None] ** np.arange(1, 5)     # (..., 4)
+    Q = K.T @ P                                  # (n_variabili, 4)
+    return y_old + h * (powers @ Q.T)
+
+
+@instrumented('rk45', evals=('f',))
+def rk45(f, x0, y0, x_end, rtol=1e-6, atol=1e-9, h0=None, h_max=np.inf,
+         x_eval=None, max_steps=100000, events=None):
+    """
+    Risolve una ODE o un sistema di ODE con Dormand-Prince 5(4) a passo adattivo.
+
+    Il passo viene scelto automaticamente in modo che l'errore locale stimato
+    resti sotto atol + rtol * |y| (norma RMS): passi piccoli nei transitori
+    rapidi, passi grandi nei tratti regolari.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y (scalare o vettore per i sistemi).
+        x_end (float): Valore finale x (> x0).
+        rtol (float, optional): Tolleranza relativa sull'errore locale.
+        atol (float, optional): Tolleranza assoluta sull'errore locale.
+        h0 (float, optional): Passo iniziale. Se None viene stimato automaticamente.
+        h_max (float, optional): Passo massimo consentito.
+        x_eval (array, optional): Istanti crescenti in [x0, x_end] in cui restituire
+                                  la soluzione (uscita densa). Se None si restituiscono
+                                  i passi accettati.
+        max_steps (int, optional): Numero massimo di passi (accettati o rifiutati).
+        events (callable | list[callable], optional): Funzioni evento g(x, y), localizzate
+                                                      sull'interpolante densa (vedi events.py).
+                                                      Un evento terminale ferma l'integrazione.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati
+        (y ha forma (n,) per una ODE o (n, n_variabili) per i sistemi).
+        Se events è dato: (x, y, x_events, y_events), con una lista di array
+        per ciascuna funzione evento; dopo un evento terminale l'uscita si
+        ferma all'istante dell'evento.
+
+    Raises:
+        ValueError: Se x_end <= x0 o se x_eval esce da [x0, x_end].
+        RuntimeError: Se il passo diventa troppo piccolo o si supera max_steps.
+    """
+    if x_end <= x0:
+        raise ValueError("x_end deve essere maggiore di x0.")
+
+    y0 = np.array(y0, dtype=float)
+    scalar = y0.ndim == 0
+
+    # Lavoriamo sempre con vettori 1-D, ma f riceve y nella forma originale
+    if scalar:
+        def fun(x, y):
+            return np.atleast_1d(f(x, y[0])).astype(float)
+    else:
+        def fun(x, y):
+            return np.asarray(f(x, y), dtype=float)
+
+    y = np.atleast_1d(y0).copy()
+    x = float(x0)
+    n_vars = len(y)
+
+    if x_eval is not None:
+        x_eval = np.asarray(x_eval, dtype=float)
+        if np.any(np.diff(x_eval) < 0):
+            raise ValueError("x_eval deve essere ordinato in senso crescente.")
+        if len(x_eval) and (x_eval[0] < x0 or x_eval[-1] > x_end):
+            raise ValueError("Gli istanti x_eval devono appartenere a [x0, x_end].")
+        y_eval = np.zeros((len(x_eval), n_vars))
+        # Eventuali punti coincidenti con x0
+        j = np.searchsorted(x_eval, x0, side='right')
+        y_eval[:j] = y
+    else:
+        xs = [x]
+        ys = [y.copy()]
+
+    # Gli eventi ricevono y nella forma originale (scalare per una singola ODE)
+    events = prepare_events(events)
+    log = [[] for _ in events]
+    if scalar:
+        def shape(v):
+            return v[..., 0]
+    else:
+        def shape(v):
+            return v
+    if events:
+        g_old = evaluate_events(events, x, shape(y))
+    stopped = None
+
+    K = np.zeros((7, n_vars))
+    K[0] = fun(x, y)
+
+    if h0 is None:
+        h = _initial_step(fun, x, y, K[0], rtol, atol)
+    else:
+        h = float(h0)
+    h = min(h, h_max)
+
+    err_prev = 1e-4
+    steps = 0
+
+    while x < x_end:
+        if steps >= max_steps:
+            raise RuntimeError(f"Dormand-Prince non ha raggiunto x_end dopo {max_steps} passi.")
+        steps += 1
+
+        # Non oltrepassare x_end
+        if x + h > x_end:
+            h = x_end - x
+
+        if h < 10 * np.spacing(x):
+            raise RuntimeError(f"Passo troppo piccolo in x={x}: impossibile rispettare la tolleranza.")
+
+        # Stadi 2..6 (il primo è già disponibile grazie a FSAL)
+        for i in range(1, 6):
+            K[i] = fun(x + C[i] * h, y + h * (A[i, :i] @ K[:i]))
+
+        y_new = y + h * (B[:6] @ K[:6])
+        K[6] = fun(x + h, y_new)
+
+        # Stima dell'errore locale e norma pesata
+        err = h * (E @ K)
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err_norm = _rms_norm(err / scale)
+
+        if err_norm <= 1:
+            # Passo accettato
+            x_new = x + h
+            if _diag.ACTIVE is not None:
+                _diag.steps(accepted=1)
+                _diag.iteration(x=x_new, h=h, err=err_norm)
+
+            if events:
+                g_new = evaluate_events(events, x_new, shape(y_new))
+
+                def y_at(xq):
+                    return shape(dense_eval(y, h, K, (xq - x) / h))
+
+                for k, x_ev, y_ev, terminal in detect_events(events, g_old, g_new, x, x_new, y_at):
+                    log[k].append((x_ev, y_ev))
+                    if terminal:
+                        stopped = x_ev
+                        break
+                g_old = g_new
+
+            # Con un evento terminale l'uscita si ferma all'istante dell'evento
+            x_stop = x_new if stopped is None else stopped
+
+            if x_eval is not None:
+                # Uscita densa per gli istanti che cadono in (x, x_stop]
+                i0 = np.searchsorted(x_eval, x, side='right')
+                i1 = np.searchsorted(x_eval, x_stop, side='right')
+                if i1 > i0:
+                    s = (x_eval[i0:i1] - x) / h
+                    y_eval[i0:i1] = dense_eval(y, h, K, s)
+            elif stopped is None:
+                xs.append(x_new)
+                ys.append(y_new)
+            else:
+                xs.append(stopped)
+                ys.append(dense_eval(y, h, K, (stopped - x) / h))
+
+            if stopped is not None:
+                break
+
+            # Controllo PI
+            if err_norm == 0:
+                factor = MAX_FACTOR
+            else:
+                factor = SAFETY * err_norm ** (-ALPHA) * err_prev ** BETA
+                factor = min(MAX_FACTOR, max(MIN_FACTOR, factor))
+            err_prev = max(err_norm, 1e-4)
+
+            x = x_new
+            y = y_new
+            K[0] = K[6]   # FSAL
+            h = min(h * factor, h_max)
+        else:
+            # Passo rifiutato: solo riduzione, nessun termine integrale
+            if _diag.ACTIVE is not None:
+                _diag.steps(rejected=1)
+            factor = max(MIN_FACTOR, SAFETY * err_norm ** (-1 / 5))
+            h = h * factor
+
+    if x_eval is not None:
+        x_out, y_out = x_eval, y_eval
+        if stopped is not None:
+            n_out = np.searchsorted(x_eval, stopped, side='right')
+            x_out, y_out = x_out[:n_out], y_out[:n_out]
+    else:
+        x_out, y_out = np.array(xs), np.array(ys)
+
+    if scalar:
+        y_out = y_out[:, 0]
+
+    if not events:
+        return x_out, y_out
+
+    x_events = [np.array([xe for xe, _ in entries]) for entries in log]
+    y_events = [np.array([ye for _, ye in entries]) for entries in log]
+    return x_out, y_out, x_events, y_events
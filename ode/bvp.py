@@ -0,0 +1,219 @@
+"""
+Modulo per la risoluzione di Problemi ai Limiti (BVP) del 2° ordine.
+
+Problema: y'' = f(x, y, y') su [a, b], con y(a) = ya e y(b) = yb.
+
+Include due metodi:
+- Shooting: tutte le pendenze iniziali candidate vengono integrate insieme
+  come ensemble (ensemble.py); la coppia di candidati che racchiude lo zero
+  del residuo y(b) - yb viene poi raffinata con Falsa Posizione.
+- Differenze Finite: le differenze centrate trasformano il problema in un
+  sistema tridiagonale, risolto con l'algoritmo di Thomas in O(n). Il caso
+  non lineare usa il metodo di Newton, con Jacobiano anch'esso tridiagonale.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+from roots.bracketing import falsa_posizione
+from systems.linear import thomas
+
+from .ensemble import ensemble_rk
+from .runge_kutta import explicit_rk
+
+
+@instrumented('shooting', evals=('f',))
+def shooting(f, a, b, ya, yb, h, slopes=(-10, 10), n_slopes=21, method='rk4',
+             tol=1e-10, max_iter=100):
+    """
+    Risolve un BVP con condizioni di Dirichlet con il Metodo di Shooting.
+
+    Il problema viene scritto come sistema del 1° ordine nello stato [y, y'].
+    Le n_slopes pendenze iniziali y'(a) equispaziate in 'slopes' sono integrate
+    in un'unica corsa vettoriale; la prima coppia adiacente con residui di segno
+    opposto fornisce l'intervallo per Falsa Posizione.
+
+    Args:
+        f (callable): Sistema f(x, Y) con Y = [y, y'], che restituisce [y', y''].
+                      Come in ensemble_rk, Y[0] e Y[1] possono essere array
+                      (una colonna per pendenza candidata).
+        a (float): Estremo sinistro.
+        b (float): Estremo destro.
+        ya (float): Condizione al contorno y(a).
+        yb (float): Condizione al contorno y(b).
+        h (float): Passo di integrazione.
+        slopes (tuple, optional): Intervallo (min, max) delle pendenze candidate.
+        n_slopes (int, optional): Numero di pendenze candidate (>= 2).
+        method (str | tuple, optional): Metodo RK usato per l'integrazione.
+        tol (float, optional): Tolleranza relativa sulla pendenza iniziale.
+        max_iter (int, optional): Iterazioni massime di Falsa Posizione.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) dove y ha forma (n_passi, 2):
+        y[:, 0] è la soluzione e y[:, 1] la sua derivata (y[0, 1] è la pendenza trovata).
+
+    Raises:
+        ValueError: Se nessuna coppia di pendenze candidate racchiude la soluzione.
+    """
+    if n_slopes < 2:
+        raise ValueError("Servono almeno 2 pendenze candidate.")
+
+    candidates = np.linspace(slopes[0], slopes[1], n_slopes)
+    Y0 = np.column_stack([np.full(n_slopes, float(ya)), candidates])
+
+    # Tutte le pendenze in un'unica integrazione (i membri divergenti diventano NaN)
+    _, y_ens, _ = ensemble_rk(f, a, Y0, b, h, method=method)
+    residual = y_ens[-1, :, 0] - yb
+
+    def phi(s):
+        return explicit_rk(f, a, [ya, s], b, h, method=method)[1][-1, 0] - yb
+
+    exact = np.flatnonzero(residual == 0)
+    change = np.flatnonzero(residual[:-1] * residual[1:] < 0)
+
+    if len(exact):
+        slope = candidates[exact[0]]
+    elif len(change):
+        i = change[0]
+        slope = falsa_posizione(phi, candidates[i], candidates[i + 1], tol=tol, max_iter=max_iter)
+    else:
+        raise ValueError("Nessuna pendenza in 'slopes' racchiude la soluzione: allargare l'intervallo.")
+
+    return explicit_rk(f, a, [ya, slope], b, h, method=method)
+
+
+def _coefficient(c, x):
+    """Valuta un coefficiente (costante o funzione vettoriale di x) sui nodi x."""
+    if callable(c):
+        return np.broadcast_to(np.asarray(c(x), dtype=float), x.shape)
+    return np.full(x.shape, float(c))
+
+
+def finite_differences(p, q, r, a, b, ya, yb, n):
+    """
+    Risolve il BVP lineare y'' = p(x) y' + q(x) y + r(x) con le Differenze Finite.
+
+    Discretizzazione centrata (2° ordine) sugli n-1 nodi interni:
+        (1 + h p_i/2) y_{i-1} - (2 + h^2 q_i) y_i + (1 - h p_i/2) y_{i+1} = h^2 r_i
+
+    Args:
+        p (callable | float): Coefficiente di y' (funzione vettoriale di x o costante).
+        q (callable | float): Coefficiente di y.
+        r (callable | float): Termine noto.
+        a (float): Estremo sinistro.
+        b (float): Estremo destro.
+        ya (float): Condizione al contorno y(a).
+        yb (float): Condizione al contorno y(b).
+        n (int): Numero di intervalli (>= 2).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con gli n+1 nodi e la soluzione.
+    """
+    if n < 2:
+        raise ValueError("Servono almeno 2 intervalli.")
+
+    x = np.linspace(a, b, n + 1)
+    h = (b - a) / n
+    xi = x[1:-1]
+
+    P = _coefficient(p, xi)
+    Q = _coefficient(q, xi)
+    R = _coefficient(r, xi)
+
+    lower = 1 + h * P / 2
+    diag = -(2 + h**2 * Q)
+    upper = 1 - h * P / 2
+    rhs = h**2 * R
+
+    # Le condizioni al contorno passano nei termini noti
+    rhs[0] -= lower[0] * ya
+    rhs[-1] -= upper[-1] * yb
+
+    y = np.empty(n + 1)
+    y[0], y[-1] = ya, yb
+    y[1:-1] = thomas(lower, diag, upper, rhs)
+
+    return x, y
+
+
+@instrumented('finite_differences_nonlinear', evals=('f', 'df_dy', 'df_dyp'))
+def finite_differences_nonlinear(f, a, b, ya, yb, n, y_init=None, df_dy=None, df_dyp=None,
+                                 tol=1e-10, max_iter=50):
+    """
+    Risolve il BVP non lineare y'' = f(x, y, y') con Differenze Finite e Newton.
+
+    Il residuo centrato sul nodo i dipende solo da y_{i-1}, y_i, y_{i+1}, quindi
+    il Jacobiano è tridiagonale e ogni iterazione di Newton costa O(n) (Thomas).
+    Le derivate parziali di f, se non fornite, sono stimate alle differenze
+    finite su tutti i nodi insieme (f deve accettare array).
+
+    Args:
+        f (callable): Funzione f(x, y, yp), vettoriale sui nodi.
+        a (float): Estremo sinistro.
+        b (float): Estremo destro.
+        ya (float): Condizione al contorno y(a).
+        yb (float): Condizione al contorno y(b).
+        n (int): Numero di intervalli (>= 2).
+        y_init (array, optional): Stima iniziale sugli n+1 nodi. Default: retta tra ya e yb.
+        df_dy (callable, optional): Derivata parziale di f rispetto a y.
+        df_dyp (callable, optional): Derivata parziale di f rispetto a y'.
+        tol (float, optional): Tolleranza sulla norma infinito della correzione di Newton.
+        max_iter (int, optional): Iterazioni massime di Newton.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con gli n+1 nodi e la soluzione.
+
+    Raises:
+        RuntimeError: Se Newton non converge entro max_iter iterazioni.
+    """
+    if n < 2:
+        raise ValueError("Servono almeno 2 intervalli.")
+
+    x = np.linspace(a, b, n + 1)
+    h = (b - a) / n
+    xi = x[1:-1]
+
+    if y_init is None:
+        y = ya + (yb - ya) * (x - a) / (b - a)
+    else:
+        y = np.array(y_init, dtype=float)
+        if y.shape != x.shape:
+            raise ValueError("y_init deve avere n+1 elementi.")
+    y[0], y[-1] = ya, yb
+
+    for _ in range(max_iter):
+        yi = y[1:-1]
+        yp = (y[2:] - y[:-2]) / (2 * h)
+        fi = np.asarray(f(xi, yi, yp), dtype=float)
+
+        # Derivate parziali di f su tutti i nodi interni (f è puntuale)
+        if df_dy is not None:
+            fy = _coefficient(lambda t: df_dy(t, yi, yp), xi)
+        else:
+            eps = np.sqrt(np.finfo(float).eps) * np.maximum(1, np.abs(yi))
+            fy = (f(xi, yi + eps, yp) - fi) / eps
+        if df_dyp is not None:
+            fyp = _coefficient(lambda t: df_dyp(t, yi, yp), xi)
+        else:
+            eps = np.sqrt(np.finfo(float).eps) * np.maximum(1, np.abs(yp))
+            fyp = (f(xi, yi, yp + eps) - fi) / eps
+
+        residual = y[:-2] - 2 * yi + y[2:] - h**2 * fi
+
+        lower = 1 + h * fyp / 2
+        diag = -(2 + h**2 * fy)
+        upper = 1 - h * fyp / 2
+
+        delta = thomas(lower, diag, upper, -residual)
+        y[1:-1] += delta
+        if _diag.ACTIVE is not None:
+            _diag.iteration(delta=np.max(np.abs(delta)), residual=np.max(np.abs(residual)))
+
+        if np.max(np.abs(delta)) < tol * (1 + np.max(np.abs(y))):
+            return x, y
+
+    raise RuntimeError(f"Newton non ha convertito dopo {max_iter} iterazioni.")
@@ -0,0 +1,148 @@
+"""
+Modulo per l'Integrazione di Ensemble di ODE.
+
+Integra in un'unica corsa vettoriale molte condizioni iniziali (Monte Carlo,
+studi di sensitività): f viene chiamata una sola volta per stadio su tutto
+l'ensemble, invece di ripetere il solver in un ciclo Python per ogni membro.
+
+Convenzione: f riceve lo stato con le variabili sul primo asse, y[k] è
+l'array della k-esima variabile su tutti i membri (forma (n_membri,)).
+Le funzioni scritte per un singolo sistema, ad esempio
+    np.array([alpha * y[0] - beta * y[0] * y[1], ...])
+funzionano quindi senza modifiche.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+from .runge_kutta import get_tableau
+
+
+def rk4_ensemble(f, x0, y0, x_end, h, params=None, blowup=1e12):
+    """
+    Risolve un ensemble di ODE (o sistemi) con RK4, tutti i membri insieme.
+    Scorciatoia per ensemble_rk(..., method='rk4').
+
+    Args:
+        f (callable): Funzione derivata f(x, y) oppure f(x, y, p) se params è dato.
+        x0 (float): Valore iniziale x.
+        y0 (np.ndarray): Condizioni iniziali (n_membri,) o (n_membri, n_variabili).
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        params (np.ndarray, optional): Parametri per membro.
+        blowup (float, optional): Soglia oltre la quale un membro è considerato divergente.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, y, alive), vedi ensemble_rk.
+    """
+    return ensemble_rk(f, x0, y0, x_end, h, method='rk4', params=params, blowup=blowup)
+
+
+@instrumented('ensemble_rk', evals=('f',))
+def ensemble_rk(f, x0, y0, x_end, h, method='rk4', params=None, blowup=1e12):
+    """
+    Risolve un ensemble di ODE (o sistemi) con un metodo Runge-Kutta esplicito,
+    tutti i membri insieme.
+
+    I membri il cui stato diventa NaN/inf o supera in modulo 'blowup' vengono
+    mascherati: da quel passo in poi valgono NaN e non vengono più passati a f,
+    così un membro divergente non rallenta né contamina gli altri. Lo stesso
+    vale per i membri con y0 non valido, esclusi già dalla prima valutazione.
+
+    Args:
+        f (callable): Funzione derivata f(x, y) oppure f(x, y, p) se params è dato.
+                      y ha forma (n_variabili, n_attivi) per i sistemi o (n_attivi,)
+                      per le ODE singole; deve restituire un array della stessa forma.
+        x0 (float): Valore iniziale x.
+        y0 (np.ndarray): Condizioni iniziali, forma (n_membri,) per una ODE
+                         o (n_membri, n_variabili) per i sistemi.
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        method (str | tuple, optional): Metodo RK ('euler', 'heun', 'midpoint',
+                                        'ralston', 'rk4') o tableau (A, b, c).
+        params (np.ndarray, optional): Parametri per membro, forma (n_membri,) o
+                                       (n_membri, n_parametri). f riceve p con i
+                                       parametri sul primo asse (p[j] su tutti i membri).
+        blowup (float, optional): Soglia oltre la quale un membro è considerato divergente.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, y, alive) dove:
+            - x è l'array dei passi temporali.
+            - y ha forma (n_passi, n_membri) o (n_passi, n_membri, n_variabili).
+            - alive è la maschera booleana (n_membri,) dei membri arrivati a x_end.
+    """
+    A, b, c = get_tableau(method)
+    s = len(b)
+
+    x = np.arange(x0, x_end + h/100, h)
+    n = len(x)
+
+    y0 = np.array(y0, dtype=float)
+    if y0.ndim not in (1, 2):
+        raise ValueError("y0 deve avere forma (n_membri,) o (n_membri, n_variabili).")
+    n_members = y0.shape[0]
+
+    y = np.full((n,) + y0.shape, np.nan)
+    y[0] = y0
+
+    if params is not None:
+        params = np.array(params, dtype=float)
+        if params.shape[0] != n_members:
+            raise ValueError("params deve avere un elemento per ogni membro dell'ensemble.")
+
+    # Indici dei membri ancora attivi e stato compatto (variabili sul primo asse)
+    active = np.arange(n_members)
+    Y = y0.T.copy()
+    P = None if params is None else params.T.copy()
+
+    def rhs(xi, Yi):
+        if P is None:
+            return f(xi, Yi)
+        return f(xi, Yi, P)
+
+    def healthy(Yi):
+        # Membri con tutte le variabili finite e sotto la soglia di blowup
+        ok = np.isfinite(Yi) & (np.abs(Yi) <= blowup)
+        return ok.all(axis=0) if Yi.ndim == 2 else ok
+
+    # Membri con y0 non valido: esclusi prima della prima valutazione di f
+    ok = healthy(Y)
+    if not ok.all():
+        active = active[ok]
+        Y = Y[..., ok]
+        if P is not None:
+            P = P[..., ok]
+
+    for i in range(n - 1):
+        if len(active) == 0:
+            break
+
+        # Stadi calcolati su tutti i membri attivi con una chiamata ciascuno
+        K = np.empty((s,) + Y.shape)
+        K[0] = rhs(x[i] + c[0] * h, Y)
+        for j in range(1, s):
+            K[j] = rhs(x[i] + c[j] * h, Y + h * np.tensordot(A[j, :j], K[:j], axes=1))
+
+        Y = Y + h * np.tensordot(b, K, axes=1)
+
+        # Maschera dei membri divergenti (controllo su tutte le variabili)
+        ok = healthy(Y)
+        if not ok.all():
+            active = active[ok]
+            Y = Y[..., ok]
+            if P is not None:
+                P = P[..., ok]
+
+        y[i + 1, active] = Y.T
+        if _diag.ACTIVE is not None:
+            _diag.steps(1)
+
+    alive = np.zeros(n_members, dtype=bool)
+    alive[active] = True
+
+    return x, y, alive
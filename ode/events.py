@@ -0,0 +1,89 @@
+"""
+Modulo per la Rilevazione di Eventi durante l'integrazione di ODE.
+
+Un evento è una funzione g(x, y) che si annulla nell'istante di interesse
+(impatto, superamento di una soglia, ...). Dopo ogni passo si controlla il
+cambio di segno di g tra inizio e fine del passo; se c'è, lo zero viene
+localizzato con il metodo di Falsa Posizione (roots.bracketing) applicato
+all'interpolante del passo, senza ulteriori passi del solver.
+
+Attributi opzionali della funzione evento (stessa convenzione di SciPy):
+- g.terminal = True  -> l'integrazione si ferma al primo zero.
+- g.direction = +1/-1 -> solo attraversamenti crescenti/decrescenti (0 = entrambi).
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from roots.bracketing import falsa_posizione
+
+
+def prepare_events(events):
+    """
+    Normalizza l'argomento events in una lista di funzioni.
+
+    Args:
+        events (callable | list[callable] | None): Funzione/i evento g(x, y).
+
+    Returns:
+        list[callable]: Lista (eventualmente vuota) delle funzioni evento.
+    """
+    if events is None:
+        return []
+    if callable(events):
+        return [events]
+    return list(events)
+
+
+def evaluate_events(events, x, y):
+    """Valuta tutte le funzioni evento nel punto (x, y)."""
+    return np.array([float(g(x, y)) for g in events])
+
+
+def detect_events(events, g_old, g_new, x_old, x_new, y_at, tol=1e-12):
+    """
+    Cerca gli zeri delle funzioni evento all'interno di un passo [x_old, x_new].
+
+    Args:
+        events (list[callable]): Funzioni evento g(x, y).
+        g_old (np.ndarray): Valori degli eventi all'inizio del passo.
+        g_new (np.ndarray): Valori degli eventi alla fine del passo.
+        x_old (float): Inizio del passo.
+        x_new (float): Fine del passo.
+        y_at (callable): Interpolante del passo, y_at(x) per x in [x_old, x_new].
+        tol (float): Tolleranza relativa sulla posizione dell'evento.
+
+    Returns:
+        list[tuple]: Eventi trovati (indice, x_evento, y_evento, terminale),
+                     ordinati per x crescente.
+    """
+    found = []
+
+    for k, g in enumerate(events):
+        a, b = g_old[k], g_new[k]
+        direction = getattr(g, 'direction', 0)
+
+        # Uno zero esatto all'inizio del passo è già stato segnalato al passo precedente
+        if a == 0:
+            continue
+        if b != 0 and a * b > 0:
+            continue
+        if direction > 0 and not a < 0:
+            continue
+        if direction < 0 and not a > 0:
+            continue
+
+        if b == 0:
+            x_ev = x_new
+        else:
+            def phi(xq):
+                return float(g(xq, y_at(xq)))
+
+            x_ev = falsa_posizione(phi, x_old, x_new, tol=tol)
+
+        found.append((k, x_ev, y_at(x_ev), bool(getattr(g, 'terminal', False))))
+
+    found.sort(key=lambda item: item[1])
+    return found
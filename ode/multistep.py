@@ -0,0 +1,134 @@
+"""
+Modulo per la risoluzione di ODE con Metodi Multistep Lineari.
+
+Implementa i predictor-corrector di Adams-Bashforth-Moulton di ordine 1-5:
+- Predittore esplicito di Adams-Bashforth (AB_k) sulle ultime k derivate.
+- Correttore implicito di Adams-Moulton (AM_k) applicato una volta (PECE).
+- Avvio con RK4 per i primi k-1 passi.
+
+Le derivate passate sono conservate in un buffer circolare: ad ogni passo
+si scrive solo la derivata più recente al posto della più vecchia, e i pesi
+vengono ruotati invece di spostare i dati. Servono quindi 2 valutazioni di f
+per passo (PECE) o 1 sola (PEC), contro le 4 di RK4.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+from .runge_kutta import explicit_rk
+
+# Coefficienti di Adams-Bashforth: y_{i+1} = y_i + h * sum_j AB[k][j] * f_{i-j}
+AB = {
+    1: np.array([1.0]),
+    2: np.array([3, -1]) / 2,
+    3: np.array([23, -16, 5]) / 12,
+    4: np.array([55, -59, 37, -9]) / 24,
+    5: np.array([1901, -2774, 2616, -1274, 251]) / 720,
+}
+
+# Coefficienti di Adams-Moulton: y_{i+1} = y_i + h * sum_j AM[k][j] * f_{i+1-j}
+AM = {
+    1: np.array([1.0]),
+    2: np.array([1, 1]) / 2,
+    3: np.array([5, 8, -1]) / 12,
+    4: np.array([9, 19, -5, 1]) / 24,
+    5: np.array([251, 646, -264, 106, -19]) / 720,
+}
+
+
+def _rotated_weights(coeffs, k):
+    """
+    Pesi riordinati per ogni posizione della testa del buffer circolare.
+
+    W[head, slot] è il coefficiente della derivata contenuta in 'slot' quando
+    la più recente si trova in 'head' (coeffs[j] moltiplica f_{i-j}).
+    """
+    W = np.zeros((k, k))
+    lags = np.arange(len(coeffs))
+    for head in range(k):
+        W[head, (head - lags) % k] = coeffs
+    return W
+
+
+@instrumented('adams_bashforth_moulton', evals=('f',))
+def adams_bashforth_moulton(f, x0, y0, x_end, h, order=4, mode='PECE'):
+    """
+    Risolve una ODE o un sistema di ODE con il predictor-corrector di
+    Adams-Bashforth-Moulton a passo fisso.
+
+    Predittore AB e correttore AM hanno lo stesso ordine; i primi order-1
+    passi sono calcolati con RK4.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y (scalare o vettore per i sistemi).
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        order (int, optional): Ordine del metodo, da 1 a 5. Default 4.
+        mode (str, optional): 'PECE' (2 valutazioni di f per passo, la derivata
+                              salvata è quella del valore corretto) oppure 'PEC'
+                              (1 valutazione, si riusa la derivata del predittore).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Una tupla (x, y) dove:
+            - x è l'array dei passi temporali.
+            - y è l'array delle soluzioni (o matrice n_passi x n_variabili per i sistemi).
+
+    Raises:
+        ValueError: Se order non è tra 1 e 5 o mode non è valido.
+    """
+    if order not in AB:
+        raise ValueError("order deve essere compreso tra 1 e 5.")
+    if mode not in ('PECE', 'PEC'):
+        raise ValueError("mode deve essere 'PECE' o 'PEC'.")
+
+    k = order
+    x = np.arange(x0, x_end + h/100, h)
+    n = len(x)
+    y0 = np.array(y0, dtype=float)
+
+    y = np.zeros((n,) + y0.shape)
+
+    # Avvio con RK4 sui primi k punti
+    n_start = min(k, n)
+    y[:n_start] = explicit_rk(f, x0, y0, x[n_start - 1], h, method='rk4')[1][:n_start]
+
+    if n <= k:
+        return x, y
+
+    # Buffer circolare delle ultime k derivate: la più recente è in F[head]
+    F = np.zeros((k,) + y0.shape)
+    for j in range(k):
+        F[j] = f(x[j], y[j])
+    head = k - 1
+
+    W_pred = _rotated_weights(AB[k], k)
+    W_corr = _rotated_weights(AM[k][1:], k)
+    beta0 = AM[k][0]
+
+    for i in range(k - 1, n - 1):
+        # P: predittore di Adams-Bashforth
+        y_pred = y[i] + h * np.tensordot(W_pred[head], F, axes=1)
+        # E: derivata nel punto predetto
+        f_pred = f(x[i + 1], y_pred)
+        # C: correttore di Adams-Moulton
+        y[i + 1] = y[i] + h * (beta0 * f_pred + np.tensordot(W_corr[head], F, axes=1))
+
+        # La nuova derivata sostituisce la più vecchia
+        head = (head + 1) % k
+        if mode == 'PECE':
+            # E: derivata nel punto corretto
+            F[head] = f(x[i + 1], y[i + 1])
+        else:
+            F[head] = f_pred
+
+    if _diag.ACTIVE is not None:
+        _diag.steps(n - k)
+
+    return x, y
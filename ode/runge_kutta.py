@@ -0,0 +1,467 @@
+"""
+Motore Runge-Kutta Esplicito basato su Tableau di Butcher.
+
+Un metodo RK esplicito a s stadi è definito dal suo tableau (A, b, c):
+    k_j = f(x_i + c_j h, y_i + h * sum_{l<j} A[j, l] k_l)
+    y_{i+1} = y_i + h * sum_j b_j k_j
+
+Tutti i metodi a passo singolo del pacchetto (Eulero, Heun, Midpoint,
+Ralston, RK4) sono espressi tramite questo motore. Gli stadi vengono
+memorizzati in buffer preallocati e aggiornati sul posto (out=), così ad
+ogni passo non si creano array temporanei. Se Numba è installato si può
+usare un ciclo compilato (jit=True) quando f è compilabile.
+
+L'uscita può essere decimata (save_every), campionata in istanti scelti
+(save_at, interpolazione di Hermite cubica), prodotta a blocchi da un
+generatore (iter_explicit_rk) o scritta direttamente su un np.memmap:
+la memoria dipende dal numero di campioni salvati, non dai passi.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import warnings
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+from .events import prepare_events, evaluate_events, detect_events
+
+
+def _tableau(A, b, c):
+    return (np.array(A, dtype=float), np.array(b, dtype=float), np.array(c, dtype=float))
+
+
+TABLEAUS = {
+    # Eulero (1° ordine)
+    'euler': _tableau([[0]], [1], [0]),
+    # Heun senza iterazione (RK2)
+    'heun': _tableau([[0, 0],
+                      [1, 0]], [1/2, 1/2], [0, 1]),
+    # Punto medio (RK2)
+    'midpoint': _tableau([[0, 0],
+                          [1/2, 0]], [0, 1], [0, 1/2]),
+    # Ralston (RK2 ottimizzato)
+    'ralston': _tableau([[0, 0],
+                         [3/4, 0]], [1/3, 2/3], [0, 3/4]),
+    # Runge-Kutta classico del 4° ordine
+    'rk4': _tableau([[0, 0, 0, 0],
+                     [1/2, 0, 0, 0],
+                     [0, 1/2, 0, 0],
+                     [0, 0, 1, 0]], [1/6, 1/3, 1/3, 1/6], [0, 1/2, 1/2, 1]),
+}
+
+
+def get_tableau(method):
+    """
+    Restituisce il tableau (A, b, c) di un metodo.
+
+    Args:
+        method (str | tuple): Nome di un metodo in TABLEAUS oppure una tupla (A, b, c).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Il tableau (A, b, c).
+
+    Raises:
+        ValueError: Se il metodo è sconosciuto o il tableau non è esplicito.
+    """
+    if isinstance(method, str):
+        if method not in TABLEAUS:
+            raise ValueError(f"Metodo '{method}' sconosciuto. Disponibili: {', '.join(TABLEAUS)}.")
+        return TABLEAUS[method]
+
+    A, b, c = _tableau(*method)
+    s = len(b)
+    if A.shape != (s, s) or len(c) != s:
+        raise ValueError("Tableau non valido: A deve essere (s x s), b e c di lunghezza s.")
+    if np.any(np.triu(A) != 0):
+        raise ValueError("Il tableau deve essere esplicito (A strettamente triangolare inferiore).")
+    return A, b, c
+
+
+# --- Percorso compilato (Numba, opzionale) ---
+_NUMBA_KERNELS = {}
+
+
+def _numba_kernels():
+    """Compila (una sola volta) i cicli RK con Numba. Solleva ImportError se assente."""
+    if _NUMBA_KERNELS:
+        return _NUMBA_KERNELS
+
+    import numba
+
+    @numba.njit(cache=False)
+    def rk_vector(f, x0, h, n, y0, A, b, c, every, out):
+        s = len(b)
+        m = y0.shape[0]
+        K = np.empty((s, m))
+        y = y0.copy()
+        stage = np.empty(m)
+        row = 1
+        for i in range(n - 1):
+            x = x0 + i * h
+            for j in range(s):
+                for q in range(m):
+                    acc = 0.0
+                    for l in range(j):
+                        acc += A[j, l] * K[l, q]
+                    stage[q] = y[q] + h * acc
+                K[j, :] = f(x + c[j] * h, stage)
+            for q in range(m):
+                acc = 0.0
+                for j in range(s):
+                    acc += b[j] * K[j, q]
+                y[q] += h * acc
+            if (i + 1) % every == 0 or i + 1 == n - 1:
+                out[row, :] = y
+                row += 1
+        return out
+
+    @numba.njit(cache=False)
+    def rk_scalar(f, x0, h, n, y0, A, b, c, every, out):
+        s = len(b)
+        K = np.empty(s)
+        y = y0
+        row = 1
+        for i in range(n - 1):
+            x = x0 + i * h
+            for j in range(s):
+                acc = 0.0
+                for l in range(j):
+                    acc += A[j, l] * K[l]
+                K[j] = f(x + c[j] * h, y + h * acc)
+            acc = 0.0
+            for j in range(s):
+                acc += b[j] * K[j]
+            y += h * acc
+            if (i + 1) % every == 0 or i + 1 == n - 1:
+                out[row] = y
+                row += 1
+        return out
+
+    _NUMBA_KERNELS['vector'] = rk_vector
+    _NUMBA_KERNELS['scalar'] = rk_scalar
+    return _NUMBA_KERNELS
+
+
+def _run_numba(f, x0, h, n, y0, A, b, c, every, out):
+    """
+    Esegue il ciclo compilato scrivendo le righe salvate in out. Restituisce
+    None (con un avviso) se Numba non è disponibile o se f non è compilabile,
+    così il chiamante può ripiegare sul percorso NumPy. Un eventuale contatore
+    di diagnostics viene tolto da f prima della compilazione.
+    """
+    try:
+        import numba
+        from numba.extending import is_jitted
+        kernels = _numba_kernels()
+    except ImportError:
+        warnings.warn("Numba non è installato: uso il percorso NumPy.", RuntimeWarning)
+        return None
+
+    f = _diag.uncounted(f)
+    try:
+        f_jit = f if is_jitted(f) else numba.njit(f)
+        if y0.ndim == 0:
+            return kernels['scalar'](f_jit, x0, h, n, float(y0), A, b, c, every, out)
+        return kernels['vector'](f_jit, x0, h, n, y0, A, b, c, every, out)
+    except numba.core.errors.NumbaError:
+        warnings.warn("f non è compilabile con Numba: uso il percorso NumPy.", RuntimeWarning)
+        return None
+
+
+# --- Griglia e campioni salvati ---
+
+def _n_steps(x0, x_end, h):
+    """Numero di punti della griglia np.arange(x0, x_end + h/100, h), senza allocarla."""
+    return max(int(np.ceil((x_end + h/100 - x0) / h)), 1)
+
+
+def _saved_x(x0, h, n, save_every, save_at):
+    """Ascisse dei campioni salvati (decimazione con ultimo punto sempre incluso, o save_at)."""
+    if save_at is not None:
+        save_at = np.array(save_at, dtype=float)
+        if np.any(np.diff(save_at) < 0):
+            raise ValueError("save_at deve essere ordinato in senso crescente.")
+        x_last = x0 + (n - 1) * h
+        if len(save_at) and (save_at[0] < x0 - h/100 or save_at[-1] > x_last + h/100):
+            raise ValueError(f"Gli istanti save_at devono appartenere a [{x0}, {x_last}].")
+        return save_at
+
+    if save_every < 1:
+        raise ValueError("save_every deve essere almeno 1.")
+
+    idx = np.arange(0, n, save_every)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return x0 + idx * h
+
+
+def _hermite(y0, f0, y1, f1, h, theta):
+    """Interpolante cubica di Hermite su un passo, theta in [0, 1]."""
+    t2 = theta * theta
+    t3 = t2 * theta
+    return ((2 * t3 - 3 * t2 + 1) * y0 + (t3 - 2 * t2 + theta) * h * f0
+            + (-2 * t3 + 3 * t2) * y1 + (t3 - t2) * h * f1)
+
+
+def _rk_chunks(f, x0, h, n, y0, A, b, c, save_every, save_at, chunk_size, events=(), log=None):
+    """
+    Ciclo RK in puro NumPy che produce i campioni salvati a blocchi.
+
+    Tra un passo e l'altro vengono conservati solo lo stato corrente, i
+    buffer degli stadi e il blocco di uscita (chunk_size righe). Se sono
+    presenti eventi, gli zeri trovati vengono aggiunti a log[k] come coppie
+    (x, y); un evento terminale chiude l'uscita con lo stato all'evento.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: (x, y) del blocco, al più chunk_size righe.
+    """
+    s = len(b)
+
+    # Buffer preallocati: stadi K, stato intermedio, incremento, stato corrente/nuovo
+    K = np.zeros((s,) + y0.shape)
+    stage = np.zeros(y0.shape)
+    incr = np.zeros(y0.shape)
+    y_cur = y0.copy()
+    y_new = np.zeros(y0.shape)
+
+    buf_x = np.empty(chunk_size)
+    buf_y = np.empty((chunk_size,) + y0.shape)
+    m = 0
+
+    if save_at is not None:
+        targets = _saved_x(x0, h, n, save_every, save_at)
+        j = 0
+        # Eventuali istanti coincidenti con x0
+        while j < len(targets) and targets[j] <= x0:
+            buf_x[m], buf_y[m] = targets[j], y0
+            m += 1
+            j += 1
+            if m == chunk_size:
+                yield buf_x.copy(), buf_y.copy()
+                m = 0
+    else:
+        buf_x[0], buf_y[0] = x0, y0
+        m = 1
+
+    if events:
+        g_old = evaluate_events(events, x0, y0)
+
+    # Con c[0] = 0 la pendenza finale di un passo è il primo stadio del successivo
+    reuse_first = c[0] == 0
+    have_first = False
+
+    for i in range(n - 1):
+        x = x0 + i * h
+
+        if not have_first:
+            K[0] = f(x + c[0] * h, y_cur)
+        have_first = False
+
+        for q in range(1, s):
+            # stage = y_i + h * sum_l A[q, l] * K[l]
+            np.dot(A[q, :q], K[:q], out=stage)
+            stage *= h
+            stage += y_cur
+            K[q] = f(x + c[q] * h, stage)
+
+        # y_{i+1} = y_i + h * sum_q b_q * K[q]
+        np.dot(b, K, out=incr)
+        incr *= h
+        np.add(y_cur, incr, out=y_new)
+        if _diag.ACTIVE is not None:
+            _diag.steps(1)
+
+        x_next = x0 + (i + 1) * h
+        last = i + 1 == n - 1
+        f1 = None
+
+        # --- Eventi: cambio di segno sul passo, zero localizzato sull'interpolante ---
+        stop = None
+        if events:
+            g_new = evaluate_events(events, x_next, y_new)
+            crossing = (g_old != 0) & ((g_new == 0) | (np.sign(g_old) != np.sign(g_new)))
+            if np.any(crossing):
+                f0 = K[0].copy() if reuse_first else f(x, y_cur)
+                f1 = np.asarray(f(x_next, y_new), dtype=float)
+
+                def y_at(xq, y_a=y_cur.copy(), f_a=f0, y_b=y_new.copy(), f_b=f1, x_a=x):
+                    return _hermite(y_a, f_a, y_b, f_b, h, (xq - x_a) / h)
+
+                for k, x_ev, y_ev, terminal in detect_events(events, g_old, g_new, x, x_next, y_at):
+                    log[k].append((x_ev, y_ev))
+                    if terminal:
+                        stop = (x_ev, y_ev)
+                        break
+            g_old = g_new
+
+        x_limit = x_next if stop is None else stop[0]
+
+        if save_at is None:
+            if stop is None and ((i + 1) % save_every == 0 or last):
+                buf_x[m], buf_y[m] = x_next, y_new
+                m += 1
+        else:
+            if j < len(targets) and (targets[j] <= x_limit or (last and stop is None)):
+                # Interpolazione di Hermite con le pendenze agli estremi del passo
+                f0 = K[0].copy() if reuse_first else f(x, y_cur)
+                if f1 is None:
+                    f1 = np.asarray(f(x_next, y_new), dtype=float)
+                while j < len(targets) and (targets[j] <= x_limit or (last and stop is None)):
+                    theta = (targets[j] - x) / h
+                    buf_x[m], buf_y[m] = targets[j], _hermite(y_cur, f0, y_new, f1, h, theta)
+                    m += 1
+                    j += 1
+                    if m == chunk_size:
+                        yield buf_x.copy(), buf_y.copy()
+                        m = 0
+
+        if stop is not None:
+            # Evento terminale: l'ultima riga è lo stato all'evento
+            if m == chunk_size:
+                yield buf_x.copy(), buf_y.copy()
+                m = 0
+            buf_x[m], buf_y[m] = stop
+            m += 1
+            break
+
+        if f1 is not None and reuse_first:
+            K[0] = f1
+            have_first = True
+
+        if m == chunk_size:
+            yield buf_x.copy(), buf_y.copy()
+            m = 0
+
+        y_cur, y_new = y_new, y_cur
+
+    if m:
+        yield buf_x[:m].copy(), buf_y[:m].copy()
+
+
+def _prepare_out(out, shape):
+    """Restituisce l'array di uscita: nuovo, fornito dall'utente o np.memmap (.npy) su file."""
+    if out is None:
+        return np.zeros(shape)
+    if isinstance(out, str):
+        return np.lib.format.open_memmap(out, mode='w+', dtype=float, shape=shape)
+    if out.shape != shape:
+        raise ValueError(f"L'array out deve avere forma {shape}.")
+    return out
+
+
+def iter_explicit_rk(f, x0, y0, x_end, h, method='rk4', save_every=1, save_at=None, chunk_size=1024):
+    """
+    Versione a generatore di explicit_rk: produce la soluzione a blocchi.
+
+    La memoria occupata è limitata da chunk_size (righe per blocco), non dal
+    numero di passi: utile per integrazioni lunghissime da scrivere su disco
+    o da elaborare al volo.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y.
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        method (str | tuple, optional): Nome del metodo o tableau (A, b, c).
+        save_every (int, optional): Salva un passo ogni save_every (l'ultimo è sempre incluso).
+        save_at (array, optional): Istanti crescenti in cui salvare la soluzione
+                                   (interpolazione di Hermite cubica). Esclude save_every.
+        chunk_size (int, optional): Numero massimo di righe per blocco.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: (x, y) di ciascun blocco.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve essere almeno 1.")
+    if save_at is not None and save_every != 1:
+        raise ValueError("save_at e save_every non possono essere usati insieme.")
+
+    A, b, c = get_tableau(method)
+    n = _n_steps(x0, x_end, h)
+    y0 = np.array(y0, dtype=float)
+
+    # Validazione anticipata degli istanti richiesti
+    _saved_x(x0, h, n, save_every, save_at)
+
+    yield from _rk_chunks(f, x0, h, n, y0, A, b, c, save_every, save_at, chunk_size)
+
+
+@instrumented('explicit_rk', evals=('f',))
+def explicit_rk(f, x0, y0, x_end, h, method='rk4', jit=False, save_every=1, save_at=None, out=None,
+                events=None):
+    """
+    Risolve una ODE o un sistema di ODE con un metodo Runge-Kutta esplicito.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y (scalare o vettore per i sistemi).
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        method (str | tuple, optional): Nome del metodo ('euler', 'heun', 'midpoint',
+                                        'ralston', 'rk4') o tableau (A, b, c). Default 'rk4'.
+        jit (bool, optional): Usa il ciclo compilato con Numba (se installato e se f
+                              è compilabile); altrimenti ripiega sul percorso NumPy.
+                              Non disponibile con save_at.
+        save_every (int, optional): Salva un passo ogni save_every (l'ultimo è sempre incluso).
+        save_at (array, optional): Istanti crescenti in cui salvare la soluzione
+                                   (interpolazione di Hermite cubica). Esclude save_every.
+        out (np.ndarray | str, optional): Array (anche np.memmap) in cui scrivere y, oppure
+                                          percorso di un file .npy da creare come memmap.
+        events (callable | list[callable], optional): Funzioni evento g(x, y) (vedi events.py).
+                                                      Con un evento terminale l'integrazione
+                                                      si ferma e l'ultima riga è lo stato all'evento.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Una tupla (x, y) dove:
+            - x è l'array dei passi temporali salvati.
+            - y è l'array delle soluzioni (o matrice n_passi x n_variabili per i sistemi).
+        Se events è dato: (x, y, x_events, y_events), con una lista di array
+        (istanti e stati degli zeri) per ciascuna funzione evento.
+    """
+    if save_at is not None and save_every != 1:
+        raise ValueError("save_at e save_every non possono essere usati insieme.")
+
+    A, b, c = get_tableau(method)
+    if _diag.ACTIVE is not None and isinstance(method, str):
+        # euler, rk4, ... compaiono con il proprio nome (i tableau personalizzati come explicit_rk)
+        _diag.rename(method)
+    n = _n_steps(x0, x_end, h)
+    y0 = np.array(y0, dtype=float)
+
+    x = _saved_x(x0, h, n, save_every, save_at)
+    y = _prepare_out(out, (len(x),) + y0.shape)
+
+    events = prepare_events(events)
+
+    if jit and save_at is None and not events:
+        y[0] = y0
+        result = _run_numba(f, x0, h, n, y0, A, b, c, save_every, y)
+        if result is not None:
+            if _diag.ACTIVE is not None:
+                _diag.steps(n - 1)
+            return x, y
+    elif jit:
+        warnings.warn("jit non supporta save_at ed events: uso il percorso NumPy.", RuntimeWarning)
+
+    log = [[] for _ in events]
+    row = 0
+    for x_chunk, y_chunk in _rk_chunks(f, x0, h, n, y0, A, b, c, save_every, save_at, 4096,
+                                       events, log):
+        x[row:row + len(x_chunk)] = x_chunk
+        y[row:row + len(y_chunk)] = y_chunk
+        row += len(y_chunk)
+
+    if not events:
+        return x, y
+
+    # Un evento terminale può aver fermato l'integrazione prima di x_end
+    x, y = x[:row], y[:row]
+    x_events = [np.array([xe for xe, _ in entries]) for entries in log]
+    y_events = [np.array([ye for _, ye in entries]) for entries in log]
+    return x, y, x_events, y_events
@@ -6,13 +6,25 @@ Include metodi a passo singolo espliciti:
 - 2° Ordine (RK2): Heun (Semplice e Iterativo), Midpoint, Ralston
 - 4° Ordine (RK4): Classico (gestisce anche sistemi di ODE)
 
+e integratori simplettici per sistemi Hamiltoniani separabili
+(Velocity Verlet, Leapfrog, Yoshida 4, Forest-Ruth), che mantengono
+limitato l'errore sull'energia anche su orizzonti molto lunghi.
+
+I metodi Runge-Kutta espliciti sono espressi tramite i rispettivi tableau
+di Butcher ed eseguiti dal motore comune `explicit_rk` (runge_kutta.py).
+
 Autore:      Sicky2005
 Corso:       Metodi Numerici per l'Ingegneria
 """
 
 import numpy as np
 
-def euler(f, x0, y0, x_end, h):
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+from .runge_kutta import explicit_rk, _n_steps, _saved_x
+
+def euler(f, x0, y0, x_end, h, save_every=1, save_at=None, out=None, events=None):
     """
     Risolve una ODE o un sistema di ODE usando il Metodo di Eulero (1° Ordine).
     Formula: y_{i+1} = y_i + f(x_i, y_i) * h
@@ -23,30 +35,22 @@ def euler(f, x0, y0, x_end, h):
         y0 (float | np.ndarray): Condizione iniziale y(x0). Scalare per singola ODE, array per sistemi.
         x_end (float): Valore finale della variabile indipendente.
         h (float): Passo di integrazione.
+        save_every (int, optional): Salva un passo ogni save_every (decimazione).
+        save_at (array, optional): Istanti in cui salvare la soluzione (interpolazione di Hermite).
+        out (np.ndarray | str, optional): Array/np.memmap o file .npy in cui scrivere y.
+        events (callable | list, optional): Funzioni evento g(x, y); se date si restituisce
+                                            anche (x_events, y_events), vedi explicit_rk.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Una tupla (x, y) dove:
             - x è l'array dei passi temporali.
             - y è l'array delle soluzioni (o matrice n_passi x n_variabili per i sistemi).
     """
-    x = np.arange(x0, x_end + h/100, h)
-    n = len(x)
-
-    y0 = np.array(y0, dtype=float)
-    if y0.ndim == 0:
-        y = np.zeros(n)
-    else:
-        y = np.zeros((n, len(y0)))
+    return explicit_rk(f, x0, y0, x_end, h, method='euler',
+                       save_every=save_every, save_at=save_at, out=out, events=events)
 
-    y[0] = y0
 
-    for i in range(n - 1):
-        y[i + 1] = y[i] + f(x[i], y[i]) * h
-
-    return x, y
-
-
-def heun(f, x0, y0, x_end, h):
+def heun(f, x0, y0, x_end, h, save_every=1, save_at=None, out=None, events=None):
     """
     Risolve una ODE usando il Metodo di Heun Semplice (RK2 - Senza iterazione).
     Usa la media tra la pendenza iniziale e quella stimata alla fine dell'intervallo.
@@ -57,29 +61,20 @@ def heun(f, x0, y0, x_end, h):
         y0 (float | np.ndarray): Valore iniziale y.
         x_end (float): Valore finale x.
         h (float): Passo di integrazione.
+        save_every (int, optional): Salva un passo ogni save_every (decimazione).
+        save_at (array, optional): Istanti in cui salvare la soluzione (interpolazione di Hermite).
+        out (np.ndarray | str, optional): Array/np.memmap o file .npy in cui scrivere y.
+        events (callable | list, optional): Funzioni evento g(x, y); se date si restituisce
+                                            anche (x_events, y_events), vedi explicit_rk.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
     """
-    x = np.arange(x0, x_end + h/100, h)
-    n = len(x)
-
-    y0 = np.array(y0, dtype=float)
-    if y0.ndim == 0:
-        y = np.zeros(n)
-    else:
-        y = np.zeros((n, len(y0)))
-
-    y[0] = y0
-
-    for i in range(n - 1):
-        k1 = f(x[i], y[i])                # Pendenza iniziale
-        k2 = f(x[i] + h, y[i] + k1 * h)   # Pendenza finale (stimata con Eulero)
-        y[i + 1] = y[i] + (0.5 * k1 + 0.5 * k2) * h
-
-    return x, y
+    return explicit_rk(f, x0, y0, x_end, h, method='heun',
+                       save_every=save_every, save_at=save_at, out=out, events=events)
 
 
+@instrumented('heun_iterative', evals=('f',))
 def heun_iterative(f, x0, y0, x_end, h, es=0.01, max_it=20):
     """
     Risolve una ODE usando il Metodo di Heun con Iterazione (Correttore).
@@ -130,6 +125,8 @@ def heun_iterative(f, x0, y0, x_end, h, es=0.01, max_it=20):
             ea = np.max(np.abs((y_new - y_old) / (y_new + 1e-15))) * 100
 
             y_old = y_new
+            if _diag.ACTIVE is not None:
+                _diag.iteration(x=x[i] + h, ea=ea)
 
             # Uscita anticipata se l'errore è sotto la soglia
             if ea <= es:
@@ -137,11 +134,13 @@ def heun_iterative(f, x0, y0, x_end, h, es=0.01, max_it=20):
 
         # Salviamo il risultato raffinato
         y[i + 1] = y_old
+        if _diag.ACTIVE is not None:
+            _diag.steps(1)
 
     return x, y
 
 
-def midpoint(f, x0, y0, x_end, h):
+def midpoint(f, x0, y0, x_end, h, save_every=1, save_at=None, out=None, events=None):
     """
     Risolve una ODE usando il Metodo del Punto Medio (Midpoint - RK2).
     Valuta la pendenza a metà dell'intervallo h/2.
@@ -152,30 +151,20 @@ def midpoint(f, x0, y0, x_end, h):
         y0 (float | np.ndarray): Valore iniziale y.
         x_end (float): Valore finale x.
         h (float): Passo di integrazione.
+        save_every (int, optional): Salva un passo ogni save_every (decimazione).
+        save_at (array, optional): Istanti in cui salvare la soluzione (interpolazione di Hermite).
+        out (np.ndarray | str, optional): Array/np.memmap o file .npy in cui scrivere y.
+        events (callable | list, optional): Funzioni evento g(x, y); se date si restituisce
+                                            anche (x_events, y_events), vedi explicit_rk.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
     """
-    x = np.arange(x0, x_end + h/100, h)
-    n = len(x)
-
-    y0 = np.array(y0, dtype=float)
-    if y0.ndim == 0:
-        y = np.zeros(n)
-    else:
-        y = np.zeros((n, len(y0)))
+    return explicit_rk(f, x0, y0, x_end, h, method='midpoint',
+                       save_every=save_every, save_at=save_at, out=out, events=events)
 
-    y[0] = y0
-
-    for i in range(n - 1):
-        k1 = f(x[i], y[i])
-        k2 = f(x[i] + 0.5 * h, y[i] + 0.5 * k1 * h)
-        y[i + 1] = y[i] + k2 * h
 
-    return x, y
-
-
-def ralston(f, x0, y0, x_end, h):
+def ralston(f, x0, y0, x_end, h, save_every=1, save_at=None, out=None, events=None):
     """
     Risolve una ODE usando il Metodo di Ralston (RK2 Ottimizzato).
     Metodo di secondo ordine che minimizza l'errore di troncamento.
@@ -186,30 +175,20 @@ def ralston(f, x0, y0, x_end, h):
         y0 (float | np.ndarray): Valore iniziale y.
         x_end (float): Valore finale x.
         h (float): Passo di integrazione.
+        save_every (int, optional): Salva un passo ogni save_every (decimazione).
+        save_at (array, optional): Istanti in cui salvare la soluzione (interpolazione di Hermite).
+        out (np.ndarray | str, optional): Array/np.memmap o file .npy in cui scrivere y.
+        events (callable | list, optional): Funzioni evento g(x, y); se date si restituisce
+                                            anche (x_events, y_events), vedi explicit_rk.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
     """
-    x = np.arange(x0, x_end + h/100, h)
-    n = len(x)
+    return explicit_rk(f, x0, y0, x_end, h, method='ralston',
+                       save_every=save_every, save_at=save_at, out=out, events=events)
 
-    y0 = np.array(y0, dtype=float)
-    if y0.ndim == 0:
-        y = np.zeros(n)
-    else:
-        y = np.zeros((n, len(y0)))
 
-    y[0] = y0
-
-    for i in range(n - 1):
-        k1 = f(x[i], y[i])
-        k2 = f(x[i] + 0.75 * h, y[i] + 0.75 * k1 * h)
-        y[i + 1] = y[i] + ((1/3) * k1 + (2/3) * k2) * h
-
-    return x, y
-
-
-def rk4(f, x0, y0, x_end, h):
+def rk4(f, x0, y0, x_end, h, save_every=1, save_at=None, out=None, events=None):
     """
     Risolve una ODE o un Sistema di ODE usando Runge-Kutta del 4° Ordine (RK4).
     Metodo standard ad alta precisione (O(h^4)). Gestisce automaticamente input scalari o vettoriali.
@@ -222,30 +201,196 @@ def rk4(f, x0, y0, x_end, h):
                                  Passare una lista/array [y1, y2...] per i sistemi.
         x_end (float): Valore finale x.
         h (float): Passo di integrazione.
+        save_every (int, optional): Salva un passo ogni save_every (decimazione).
+        save_at (array, optional): Istanti in cui salvare la soluzione (interpolazione di Hermite).
+        out (np.ndarray | str, optional): Array/np.memmap o file .npy in cui scrivere y.
+        events (callable | list, optional): Funzioni evento g(x, y); se date si restituisce
+                                            anche (x_events, y_events), vedi explicit_rk.
 
     Returns:
         tuple[np.ndarray, np.ndarray]: Una tupla (x, y) dove:
             - x è l'array dei passi temporali.
             - y è l'array delle soluzioni (o matrice n x m per i sistemi).
     """
-    x = np.arange(x0, x_end + h/100, h)
-    n = len(x)
+    return explicit_rk(f, x0, y0, x_end, h, method='rk4',
+                       save_every=save_every, save_at=save_at, out=out, events=events)
+
+
+# --- Integratori simplettici ---
+# Ogni schema è una sequenza di sottopassi: ('K', d) aggiorna p con d*h*F(q)
+# (kick), ('D', c) aggiorna q con c*h*p/m (drift).
+
+_YOSHIDA_W1 = 1 / (2 - 2 ** (1/3))
+_YOSHIDA_W0 = 1 - 2 * _YOSHIDA_W1
+
+SYMPLECTIC_SCHEMES = {
+    'velocity_verlet': (('K', 1/2), ('D', 1), ('K', 1/2)),
+    'leapfrog': (('D', 1/2), ('K', 1), ('D', 1/2)),
+    # Composizione di Yoshida di tre passi di Verlet, forma kick-first
+    'yoshida4': (('K', _YOSHIDA_W1 / 2), ('D', _YOSHIDA_W1),
+                 ('K', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('D', _YOSHIDA_W0),
+                 ('K', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('D', _YOSHIDA_W1),
+                 ('K', _YOSHIDA_W1 / 2)),
+    # Forest-Ruth, forma drift-first
+    'forest_ruth': (('D', _YOSHIDA_W1 / 2), ('K', _YOSHIDA_W1),
+                    ('D', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('K', _YOSHIDA_W0),
+                    ('D', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('K', _YOSHIDA_W1),
+                    ('D', _YOSHIDA_W1 / 2)),
+}
+
+
+@instrumented('symplectic', evals=('force',))
+def symplectic(force, x0, q0, p0, x_end, h, method='velocity_verlet', mass=1.0, save_every=1):
+    """
+    Integra un sistema Hamiltoniano separabile H = p^2/(2m) + V(q) con uno
+    schema simplettico di splitting.
 
-    y0 = np.array(y0, dtype=float)
+    La forza F(q) = -dV/dq viene valutata una sola volta per ogni kick, su
+    tutto lo stato insieme; se lo schema termina con un kick, la forza della
+    fine del passo viene riusata all'inizio del successivo.
 
-    if y0.ndim == 0:
-        y = np.zeros(n)
-    else:
-        y = np.zeros((n, len(y0)))
+    Args:
+        force (callable): Forza F(q), vettoriale: riceve q e restituisce un array
+                          della stessa forma.
+        x0 (float): Istante iniziale.
+        q0 (float | np.ndarray): Posizioni iniziali.
+        p0 (float | np.ndarray): Momenti iniziali (stessa forma di q0).
+        x_end (float): Istante finale.
+        h (float): Passo di integrazione.
+        method (str, optional): 'velocity_verlet', 'leapfrog', 'yoshida4' o 'forest_ruth'.
+        mass (float | np.ndarray, optional): Massa (scalare o per componente di q).
+        save_every (int, optional): Salva un passo ogni save_every (l'ultimo è sempre incluso).
 
-    y[0] = y0
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, q, p) con i passi salvati.
+    """
+    if method not in SYMPLECTIC_SCHEMES:
+        raise ValueError(f"Metodo simplettico sconosciuto: '{method}'. "
+                         f"Disponibili: {', '.join(SYMPLECTIC_SCHEMES)}.")
+    scheme = SYMPLECTIC_SCHEMES[method]
+    if _diag.ACTIVE is not None:
+        _diag.rename(method)
+
+    q = np.array(q0, dtype=float)
+    p = np.array(p0, dtype=float)
+    if q.shape != p.shape:
+        raise ValueError("q0 e p0 devono avere la stessa forma.")
+    inv_mass = 1 / np.asarray(mass, dtype=float)
+
+    n = _n_steps(x0, x_end, h)
+    x = _saved_x(x0, h, n, save_every, None)
+    q_out = np.zeros((len(x),) + q.shape)
+    p_out = np.zeros((len(x),) + p.shape)
+    q_out[0], p_out[0] = q, p
+
+    F = np.asarray(force(q), dtype=float)
+    fresh = True
+    row = 1
+
+    for i in range(1, n):
+        for kind, coef in scheme:
+            if kind == 'K':
+                if not fresh:
+                    F = np.asarray(force(q), dtype=float)
+                    fresh = True
+                p += (coef * h) * F
+            else:
+                q += (coef * h) * inv_mass * p
+                fresh = False
+
+        if _diag.ACTIVE is not None:
+            _diag.steps(1)
+
+        if i % save_every == 0 or i == n - 1:
+            q_out[row], p_out[row] = q, p
+            row += 1
+
+    return x, q_out, p_out
+
+
+def velocity_verlet(force, x0, q0, p0, x_end, h, mass=1.0, save_every=1):
+    """
+    Integra un sistema Hamiltoniano separabile con Velocity Verlet (2° ordine).
+    Kick-drift-kick: una valutazione della forza per passo.
 
-    for i in range(n - 1):
-        k1 = f(x[i], y[i])
-        k2 = f(x[i] + 0.5 * h, y[i] + 0.5 * h * k1)
-        k3 = f(x[i] + 0.5 * h, y[i] + 0.5 * h * k2)
-        k4 = f(x[i] + h, y[i] + h * k3)
+    Args:
+        force (callable): Forza F(q), vettoriale.
+        x0 (float): Istante iniziale.
+        q0 (float | np.ndarray): Posizioni iniziali.
+        p0 (float | np.ndarray): Momenti iniziali.
+        x_end (float): Istante finale.
+        h (float): Passo di integrazione.
+        mass (float | np.ndarray, optional): Massa.
+        save_every (int, optional): Salva un passo ogni save_every.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, q, p).
+    """
+    return symplectic(force, x0, q0, p0, x_end, h, method='velocity_verlet',
+                      mass=mass, save_every=save_every)
+
+
+def leapfrog(force, x0, q0, p0, x_end, h, mass=1.0, save_every=1):
+    """
+    Integra un sistema Hamiltoniano separabile con Leapfrog (2° ordine).
+    Drift-kick-drift: una valutazione della forza per passo.
+
+    Args:
+        force (callable): Forza F(q), vettoriale.
+        x0 (float): Istante iniziale.
+        q0 (float | np.ndarray): Posizioni iniziali.
+        p0 (float | np.ndarray): Momenti iniziali.
+        x_end (float): Istante finale.
+        h (float): Passo di integrazione.
+        mass (float | np.ndarray, optional): Massa.
+        save_every (int, optional): Salva un passo ogni save_every.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, q, p).
+    """
+    return symplectic(force, x0, q0, p0, x_end, h, method='leapfrog',
+                      mass=mass, save_every=save_every)
+
+
+def yoshida4(force, x0, q0, p0, x_end, h, mass=1.0, save_every=1):
+    """
+    Integra un sistema Hamiltoniano separabile con il metodo di Yoshida (4° ordine).
+    Composizione di tre passi di Verlet: tre valutazioni della forza per passo.
 
-        y[i + 1] = y[i] + (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+    Args:
+        force (callable): Forza F(q), vettoriale.
+        x0 (float): Istante iniziale.
+        q0 (float | np.ndarray): Posizioni iniziali.
+        p0 (float | np.ndarray): Momenti iniziali.
+        x_end (float): Istante finale.
+        h (float): Passo di integrazione.
+        mass (float | np.ndarray, optional): Massa.
+        save_every (int, optional): Salva un passo ogni save_every.
 
-    return x, y
\ No newline at end of file
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, q, p).
+    """
+    return symplectic(force, x0, q0, p0, x_end, h, method='yoshida4',
+                      mass=mass, save_every=save_every)
+
+
+def forest_ruth(force, x0, q0, p0, x_end, h, mass=1.0, save_every=1):
+    """
+    Integra un sistema Hamiltoniano separabile con il metodo di Forest-Ruth (4° ordine).
+    Forma drift-first della composizione di 4° ordine: tre valutazioni della forza per passo.
+
+    Args:
+        force (callable): Forza F(q), vettoriale.
+        x0 (float): Istante iniziale.
+        q0 (float | np.ndarray): Posizioni iniziali.
+        p0 (float | np.ndarray): Momenti iniziali.
+        x_end (float): Istante finale.
+        h (float): Passo di integrazione.
+        mass (float | np.ndarray, optional): Massa.
+        save_every (int, optional): Salva un passo ogni save_every.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Tupla (x, q, p).
+    """
+    return symplectic(force, x0, q0, p0, x_end, h, method='forest_ruth',
+                      mass=mass, save_every=save_every)
@@ -0,0 +1,394 @@
+"""
+Modulo per la risoluzione di ODE Stiff (Metodi Impliciti).
+
+Per i problemi stiff i metodi espliciti richiedono passi migliaia di volte
+più piccoli della scala temporale della soluzione. I metodi impliciti
+restano stabili con passi grandi:
+- Eulero Implicito (Backward Euler), 1° ordine, L-stabile.
+- BDF (Backward Differentiation Formulas) a passo fisso di ordine 1-5.
+- Rosenbrock ROS2 (linearmente implicito, 2° ordine, L-stabile).
+
+Lo Jacobiano viene stimato con differenze finite in un'unica chiamata
+vettoriale di f (opzione vectorized) e la fattorizzazione LU della matrice
+di Newton (I - h*beta*J) viene riutilizzata per molti passi, finché la
+convergenza di Newton non peggiora. I sistemi lineari sono risolti con
+lu_factor / lu_solve del pacchetto systems.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+from systems.linear import lu_factor, lu_solve
+
+# Coefficienti BDF: y_{n+1} = sum_j alpha_j * y_{n+1-j} + h * beta * f(x_{n+1}, y_{n+1})
+BDF_ALPHA = {
+    1: [1.0],
+    2: [4/3, -1/3],
+    3: [18/11, -9/11, 2/11],
+    4: [48/25, -36/25, 16/25, -3/25],
+    5: [300/137, -300/137, 200/137, -75/137, 12/137],
+}
+BDF_BETA = {1: 1.0, 2: 2/3, 3: 6/11, 4: 12/25, 5: 60/137}
+
+# Parametro di ROS2 (Verwer): gamma = 1 + 1/sqrt(2)
+ROS2_GAMMA = 1 + 1 / np.sqrt(2)
+
+
+def _prepare(f, y0):
+    """
+    Converte y0 in vettore 1-D e crea le versioni di f che lavorano su vettori
+    (fun) e su blocchi di colonne (fun_batch, una colonna per stato).
+    """
+    y0 = np.array(y0, dtype=float)
+    scalar = y0.ndim == 0
+
+    if scalar:
+        def fun(x, y):
+            return np.atleast_1d(f(x, y[0])).astype(float)
+
+        def fun_batch(x, Y):
+            return np.asarray(f(x, Y[0]), dtype=float).reshape(1, -1)
+    else:
+        def fun(x, y):
+            return np.asarray(f(x, y), dtype=float)
+
+        def fun_batch(x, Y):
+            return np.asarray(f(x, Y), dtype=float)
+
+    return np.atleast_1d(y0), scalar, fun, fun_batch
+
+
+def jacobian_fd(fun, fun_batch, x, y, fy, vectorized=False):
+    """
+    Stima lo Jacobiano df/dy con differenze finite in avanti.
+
+    Con vectorized=True tutte le n perturbazioni vengono valutate in una sola
+    chiamata: f riceve una matrice Y (n_variabili, n) in cui la colonna j è y
+    perturbato nella componente j, e deve restituire una matrice (n_variabili, n).
+    Le funzioni scritte come np.array([... y[0] ..., ... y[1] ...]) lo
+    supportano senza modifiche.
+
+    Args:
+        fun (callable): f(x, y) su vettori.
+        fun_batch (callable): f(x, Y) su blocchi di colonne.
+        x (float): Punto di valutazione.
+        y (np.ndarray): Stato in cui calcolare lo Jacobiano.
+        fy (np.ndarray): Valore già noto f(x, y).
+        vectorized (bool): Usa una sola chiamata vettoriale.
+
+    Returns:
+        np.ndarray: Matrice Jacobiana (n x n).
+    """
+    n = len(y)
+    dy = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(y), 1.0)
+
+    if vectorized:
+        Y = y[:, None] + np.diag(dy)
+        F = fun_batch(x, Y)
+        return (F - fy[:, None]) / dy
+
+    J = np.zeros((n, n))
+    for j in range(n):
+        y_pert = y.copy()
+        y_pert[j] += dy[j]
+        J[:, j] = (fun(x, y_pert) - fy) / dy[j]
+    return J
+
+
+def _newton_matrix(state, hb):
+    """(Ri)fattorizza I - hb * J quando cambia hb o lo Jacobiano."""
+    n = len(state['J'])
+    state['LU'], state['piv'] = lu_factor(np.eye(n) - hb * state['J'], tol=1e-12)
+    state['hb'] = hb
+
+
+def _update_jacobian(state, x, y):
+    """Ricalcola lo Jacobiano in (x, y) e invalida la fattorizzazione."""
+    if state['jac'] is not None:
+        state['J'] = np.atleast_2d(np.array(state['jac'](x, y), dtype=float))
+    else:
+        # f(x, y) serve solo alle differenze finite
+        fy = state['fun'](x, y)
+        state['J'] = jacobian_fd(state['fun'], state['fun_batch'], x, y, fy, state['vectorized'])
+    state['fresh'] = True
+    state['hb'] = None
+
+
+def _newton_iterations(state, x_new, r, hb, z, tol, max_newton, full=False):
+    """
+    Iterazioni di Newton per z = r + hb * f(x_new, z) con la LU corrente.
+    Con full=True lo Jacobiano viene ricalcolato ad ogni iterata (Newton pieno).
+
+    Returns:
+        tuple[np.ndarray, int | None]: (z, iterazioni) oppure (z, None) se non converge.
+    """
+    fun = state['fun']
+    dz_norm_old = None
+
+    for it in range(max_newton):
+        if full:
+            _update_jacobian(state, x_new, z)
+        if state['hb'] != hb:
+            _newton_matrix(state, hb)
+
+        G = z - r - hb * fun(x_new, z)
+        dz = lu_solve(state['LU'], state['piv'], -G)
+        z = z + dz
+
+        dz_norm = np.linalg.norm(dz)
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=x_new, dz=dz_norm)
+        if not np.isfinite(dz_norm):
+            return z, None
+        if dz_norm <= tol * (1 + np.linalg.norm(z)):
+            return z, it + 1
+
+        # Convergenza che peggiora: inutile proseguire con questa matrice
+        if not full and dz_norm_old is not None and dz_norm > 0.9 * dz_norm_old:
+            return z, None
+        dz_norm_old = dz_norm
+
+    return z, None
+
+
+def _implicit_step(state, x, y, x_new, r, hb, z0, tol, max_newton):
+    """
+    Risolve z = r + hb * f(x_new, z) con Newton semplificato.
+
+    La matrice I - hb*J e la sua LU vengono riusate tra i passi. Se Newton
+    diverge o non converge entro max_newton iterazioni con uno Jacobiano
+    vecchio, lo si ricalcola in (x, y) e si ripete il passo; se fallisce
+    anche così si passa a Newton pieno (Jacobiano aggiornato ad ogni
+    iterata) e, in caso di ulteriore fallimento, si solleva RuntimeError.
+    """
+    if not state['fresh']:
+        z, its = _newton_iterations(state, x_new, r, hb, z0, tol, max_newton)
+        if its is None:
+            _update_jacobian(state, x, y)
+
+    if state['fresh']:
+        z, its = _newton_iterations(state, x_new, r, hb, z0, tol, max_newton)
+        if its is None:
+            z, its = _newton_iterations(state, x_new, r, hb, z0, tol, max_newton, full=True)
+        if its is None:
+            raise RuntimeError(f"Newton non converge in x={x_new}: ridurre il passo h.")
+
+    # Convergenza lenta: lo Jacobiano verrà aggiornato al prossimo passo
+    state['stale'] = its > max(2, max_newton // 2)
+    state['fresh'] = False
+    return z
+
+
+def _make_state(f, y0, jac, vectorized):
+    y, scalar, fun, fun_batch = _prepare(f, y0)
+    state = {
+        'fun': fun, 'fun_batch': fun_batch, 'jac': jac, 'vectorized': vectorized,
+        'J': None, 'LU': None, 'piv': None, 'hb': None, 'fresh': False, 'stale': True,
+    }
+    return y, scalar, state
+
+
+def _allocate(x0, x_end, h, y, scalar):
+    x = np.arange(x0, x_end + h/100, h)
+    out = np.zeros((len(x), len(y)))
+    out[0] = y
+    return x, out
+
+
+def _finish(x, out, scalar):
+    return x, (out[:, 0] if scalar else out)
+
+
+@instrumented('backward_euler', evals=('f', 'jac'))
+def backward_euler(f, x0, y0, x_end, h, tol=1e-8, max_newton=10, jac=None, vectorized=False):
+    """
+    Risolve una ODE (anche stiff) con il Metodo di Eulero Implicito.
+    Formula: y_{i+1} = y_i + h * f(x_{i+1}, y_{i+1}), risolta con Newton.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y.
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        tol (float, optional): Tolleranza relativa sul passo di Newton.
+        max_newton (int, optional): Iterazioni massime di Newton per passo.
+        jac (callable, optional): Jacobiano analitico jac(x, y). Se None, differenze finite.
+        vectorized (bool, optional): f accetta blocchi di stati (n_variabili, m).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
+
+    Raises:
+        RuntimeError: Se Newton non converge nemmeno con lo Jacobiano aggiornato.
+    """
+    y, scalar, state = _make_state(f, y0, jac, vectorized)
+    x, out = _allocate(x0, x_end, h, y, scalar)
+
+    for i in range(len(x) - 1):
+        if state['stale']:
+            _update_jacobian(state, x[i], out[i])
+
+        # Predittore: Eulero esplicito
+        z0 = out[i] + h * state['fun'](x[i], out[i])
+        out[i + 1] = _implicit_step(state, x[i], out[i], x[i + 1], out[i], h, z0, tol, max_newton)
+
+    if _diag.ACTIVE is not None:
+        _diag.steps(len(x) - 1)
+
+    return _finish(x, out, scalar)
+
+
+def _extrapolated_step(state, x, y, h, levels, tol, max_newton):
+    """
+    Un passo da x a x + h con Eulero Implicito estrapolato (Richardson).
+
+    Il passo viene ripetuto con m = 1, ..., levels sottopassi di h/m e i
+    risultati sono combinati con il tableau di Aitken-Neville (l'errore di
+    Eulero Implicito si sviluppa in potenze di h). L'errore locale è
+    O(h^(levels+1)) e il metodo resta adatto ai problemi stiff.
+    """
+    T = []
+    for m in range(1, levels + 1):
+        hm = h / m
+        z = y
+        for j in range(m):
+            if state['stale']:
+                _update_jacobian(state, x + j * hm, z)
+            # Predittore: il valore corrente (nessuna valutazione di f in più)
+            z = _implicit_step(state, x + j * hm, z, x + (j + 1) * hm, z, hm, z.copy(), tol, max_newton)
+
+        row = [z]
+        for k in range(1, m):
+            row.append(row[k - 1] + (row[k - 1] - T[-1][k - 1]) / (m / (m - k) - 1))
+        T.append(row)
+    return T[-1][-1]
+
+
+@instrumented('bdf', evals=('f', 'jac'))
+def bdf(f, x0, y0, x_end, h, order=2, tol=1e-8, max_newton=10, jac=None, vectorized=False):
+    """
+    Risolve una ODE (anche stiff) con le formule BDF a passo fisso.
+
+    I primi order-1 punti sono calcolati con Eulero Implicito estrapolato
+    (Richardson) di ordine pari a quello richiesto: con un avvio BDF1, BDF2, ...
+    il loro errore limiterebbe il metodo al 2° ordine qualunque sia 'order'.
+    Gli ordini 1 e 2 sono A-stabili; 3-5 sono stabili su quasi tutto il
+    semipiano sinistro.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y.
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        order (int, optional): Ordine BDF (1-5). Default 2.
+        tol (float, optional): Tolleranza relativa sul passo di Newton.
+        max_newton (int, optional): Iterazioni massime di Newton per passo.
+        jac (callable, optional): Jacobiano analitico jac(x, y). Se None, differenze finite.
+        vectorized (bool, optional): f accetta blocchi di stati (n_variabili, m).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
+
+    Raises:
+        ValueError: Se l'ordine non è tra 1 e 5.
+        RuntimeError: Se Newton non converge nemmeno con lo Jacobiano aggiornato.
+    """
+    if order not in BDF_ALPHA:
+        raise ValueError("L'ordine BDF deve essere compreso tra 1 e 5.")
+
+    y, scalar, state = _make_state(f, y0, jac, vectorized)
+    x, out = _allocate(x0, x_end, h, y, scalar)
+
+    # Avvio: la storia necessaria a BDF di ordine 'order'
+    start = min(order - 1, len(x) - 1)
+    for i in range(start):
+        out[i + 1] = _extrapolated_step(state, x[i], out[i], h, order, tol, max_newton)
+
+    alpha = BDF_ALPHA[order]
+    for i in range(start, len(x) - 1):
+        if state['stale']:
+            _update_jacobian(state, x[i], out[i])
+
+        # Parte nota: sum_j alpha_j * y_{i+1-j}
+        r = np.zeros_like(y)
+        for j, a in enumerate(alpha):
+            r += a * out[i - j]
+
+        # Predittore: estrapolazione lineare dagli ultimi due punti
+        z0 = 2 * out[i] - out[i - 1] if i > 0 else out[i].copy()
+
+        out[i + 1] = _implicit_step(state, x[i], out[i], x[i + 1], r, h * BDF_BETA[order],
+                                    z0, tol, max_newton)
+
+    if _diag.ACTIVE is not None:
+        _diag.steps(len(x) - 1)
+
+    return _finish(x, out, scalar)
+
+
+@instrumented('rosenbrock', evals=('f', 'jac'))
+def rosenbrock(f, x0, y0, x_end, h, jac_every=1, jac=None, vectorized=False):
+    """
+    Risolve una ODE (anche stiff) con il metodo di Rosenbrock ROS2 (Verwer).
+
+    Metodo linearmente implicito: ogni passo richiede due sistemi lineari con
+    la stessa matrice W = I - gamma*h*J e nessuna iterazione di Newton.
+    ROS2 è un W-metodo (il 2° ordine vale per qualunque approssimazione di J),
+    quindi J e la fattorizzazione di W possono essere riusati per più passi.
+
+        W k1 = f(x, y) + gamma h f_x
+        W k2 = f(x + h, y + h k1) - 2 k1 - gamma h f_x
+        y_{i+1} = y + 1.5 h k1 + 0.5 h k2
+
+    Il termine f_x = df/dx (differenze finite, aggiornato insieme a J) rende
+    il metodo del 2° ordine anche per problemi non autonomi.
+
+    Args:
+        f (callable): Funzione derivata dy/dx = f(x, y).
+        x0 (float): Valore iniziale x.
+        y0 (float | np.ndarray): Valore iniziale y.
+        x_end (float): Valore finale x.
+        h (float): Passo di integrazione.
+        jac_every (int, optional): Ogni quanti passi ricalcolare J e la LU di W (default 1).
+                                   Valori maggiori riducono il costo se J varia lentamente.
+        jac (callable, optional): Jacobiano analitico jac(x, y). Se None, differenze finite.
+        vectorized (bool, optional): f accetta blocchi di stati (n_variabili, m).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Tupla (x, y) con i risultati.
+    """
+    if jac_every < 1:
+        raise ValueError("jac_every deve essere almeno 1.")
+
+    y, scalar, state = _make_state(f, y0, jac, vectorized)
+    x, out = _allocate(x0, x_end, h, y, scalar)
+    fun = state['fun']
+    hb = ROS2_GAMMA * h
+
+    for i in range(len(x) - 1):
+        fy = fun(x[i], out[i])
+
+        if i % jac_every == 0:
+            _update_jacobian(state, x[i], out[i])
+            _newton_matrix(state, hb)
+            # Derivata rispetto alla variabile indipendente (problemi non autonomi)
+            dx = np.sqrt(np.finfo(float).eps) * max(abs(x[i]), 1.0)
+            fx = (fun(x[i] + dx, out[i]) - fy) / dx
+
+        LU, piv = state['LU'], state['piv']
+
+        k1 = lu_solve(LU, piv, fy + hb * fx)
+        k2 = lu_solve(LU, piv, fun(x[i] + h, out[i] + h * k1) - 2 * k1 - hb * fx)
+
+        out[i + 1] = out[i] + 1.5 * h * k1 + 0.5 * h * k2
+
+    if _diag.ACTIVE is not None:
+        _diag.steps(len(x) - 1)
+
+    return _finish(x, out, scalar)
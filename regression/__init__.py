@@ -1 +1,40 @@
-from .linear import linear_regression
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from regression import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+# Il modulo di least_squares ha un nome privato (_least_squares.py): con lo stesso
+# nome della funzione, l'import del sottomodulo la sostituirebbe con il modulo
+# come attributo del pacchetto.
+
+_EXPORTS = {
+    'linear_regression': 'linear',
+    'batched_linear_regression': 'linear',
+    'least_squares': '_least_squares',
+    'multiple_regression': '_least_squares',
+    'polynomial_regression': '_least_squares',
+    'FitResult': '_least_squares',
+    'online_init': 'online',
+    'online_update': 'online',
+    'online_merge': 'online',
+    'online_result': 'online',
+    'online_regression': 'online',
+    'online_regression_state': 'online',
+    'RegressionState': 'online',
+    'levenberg_marquardt': 'nonlinear',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
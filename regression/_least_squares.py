@@ -0,0 +1,162 @@
+"""
+Modulo per la Regressione ai Minimi Quadrati (multipla e polinomiale).
+
+Il problema min ||A a - y||^2 viene risolto direttamente sulla matrice di
+progetto A, tramite fattorizzazione QR oppure SVD, invece che con le
+equazioni normali (A^T A) a = A^T y: il condizionamento resta quello di A
+e non il suo quadrato, quindi si perde molta meno precisione quando le x
+sono grandi o i regressori quasi collineari.
+
+Le statistiche (syx, r2 ed errori standard dei coefficienti) sono calcolate
+in forma vettoriale a partire dai residui.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+FitResult = namedtuple('FitResult', ['coef', 'stderr', 'syx', 'r2'])
+FitResult.__doc__ = """
+Risultato di un fit ai minimi quadrati.
+
+    - coef: Coefficienti stimati (intercetta per prima, se presente).
+    - stderr: Errori standard dei coefficienti.
+    - syx: Errore standard della stima.
+    - r2: Coefficiente di determinazione.
+"""
+
+
+def _fit_statistics(y, residuals, n_params):
+    """
+    Calcola syx e r2 dai residui di un fit con n_params coefficienti.
+
+    Args:
+        y (np.ndarray): Valori osservati (n,).
+        residuals (np.ndarray): Residui y - y_stimato (n,).
+        n_params (int): Numero di coefficienti stimati.
+
+    Returns:
+        tuple[float, float, float]: (syx, r2, sr) con sr somma dei quadrati dei residui.
+    """
+    n = len(y)
+    sr = float(residuals @ residuals)
+    dy = y - y.mean()
+    st = float(dy @ dy)
+
+    syx = (sr / (n - n_params)) ** 0.5
+
+    # Se st è 0 (tutti i valori y sono uguali) il fit è perfetto per convenzione
+    r2 = 1.0 if st == 0 else (st - sr) / st
+
+    return syx, r2, sr
+
+
+def _solve(A, y, method):
+    """
+    Risolve min ||A a - y|| e restituisce (a, C) con C = (A^T A)^-1,
+    senza mai formare A^T A.
+    """
+    n_params = A.shape[1]
+    tol = max(A.shape) * np.finfo(float).eps
+
+    if method == 'qr':
+        Q, R = np.linalg.qr(A, mode='reduced')
+        d = np.abs(np.diag(R))
+        if d.min() <= tol * d.max():
+            raise ValueError("Matrice di progetto singolare: regressori linearmente dipendenti.")
+        coef = np.linalg.solve(R, Q.T @ y)
+        R_inv = np.linalg.solve(R, np.eye(n_params))
+        cov = R_inv @ R_inv.T
+    elif method == 'svd':
+        U, S, Vt = np.linalg.svd(A, full_matrices=False)
+        if S[-1] <= tol * S[0]:
+            raise ValueError("Matrice di progetto singolare: regressori linearmente dipendenti.")
+        coef = Vt.T @ ((U.T @ y) / S)
+        cov = (Vt.T / S**2) @ Vt
+    else:
+        raise ValueError("method deve essere 'qr' o 'svd'.")
+
+    return coef, cov
+
+
+def least_squares(A, y, method='qr'):
+    """
+    Fit ai minimi quadrati di y = A a per una matrice di progetto qualsiasi.
+
+    Args:
+        A (array): Matrice di progetto (n, n_parametri); ogni colonna è un regressore.
+        y (array): Valori osservati (n,).
+        method (str, optional): 'qr' (default) oppure 'svd' (più robusto per A
+                                mal condizionata, ma più lento).
+
+    Returns:
+        FitResult: Coefficienti, errori standard, syx e r2.
+
+    Raises:
+        ValueError: Se i dati non bastano o i regressori sono linearmente dipendenti.
+    """
+    A = np.asarray(A, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if A.ndim != 2 or y.ndim != 1 or A.shape[0] != len(y):
+        raise ValueError("A deve avere forma (n, n_parametri) e y forma (n,).")
+
+    n, n_params = A.shape
+    if n <= n_params:
+        raise ValueError(f"Sono necessari almeno {n_params + 1} punti dati.")
+
+    coef, cov = _solve(A, y, method)
+
+    residuals = y - A @ coef
+    syx, r2, _ = _fit_statistics(y, residuals, n_params)
+    stderr = syx * np.sqrt(np.diag(cov))
+
+    return FitResult(coef, stderr, syx, r2)
+
+
+def multiple_regression(X, y, method='qr'):
+    """
+    Regressione lineare multipla y = a0 + a1*x1 + ... + ak*xk.
+
+    Args:
+        X (array): Regressori, forma (n,) per uno solo o (n, k).
+        y (array): Valori osservati (n,).
+        method (str, optional): 'qr' o 'svd'.
+
+    Returns:
+        FitResult: coef = [a0, a1, ..., ak] con errori standard, syx e r2.
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+
+    A = np.empty((X.shape[0], X.shape[1] + 1))
+    A[:, 0] = 1.0
+    A[:, 1:] = X
+
+    return least_squares(A, y, method=method)
+
+
+def polynomial_regression(x, y, degree, method='qr'):
+    """
+    Regressione polinomiale y = a0 + a1*x + ... + am*x^m.
+
+    Args:
+        x (array): Valori della variabile indipendente (n,).
+        y (array): Valori osservati (n,).
+        degree (int): Grado m del polinomio.
+        method (str, optional): 'qr' o 'svd'.
+
+    Returns:
+        FitResult: coef = [a0, a1, ..., am] (potenze crescenti) con errori standard, syx e r2.
+    """
+    if degree < 0:
+        raise ValueError("Il grado deve essere non negativo.")
+
+    x = np.asarray(x, dtype=float)
+    A = np.vander(x, degree + 1, increasing=True)
+
+    return least_squares(A, y, method=method)
@@ -5,12 +5,23 @@ Questo modulo implementa il metodo dei minimi quadrati per il calcolo
 della regressione lineare semplice, includendo il calcolo degli errori standard
 e del coefficiente di determinazione R^2.
 
+È il caso particolare a un solo regressore di least_squares.py, calcolato in
+forma chiusa sugli scarti dalla media con operazioni vettoriali NumPy.
+
 Autore:      Sicky2005
 Corso:       Metodi Numerici per l'Ingegneria
 Descrizione: Programma per la Regressione (Libreria matematica)
 """
 
-def linear_regression(x, y):
+import numpy as np
+
+from backend import kernels as _kernels
+from backend.selection import resolve
+
+from ._least_squares import _fit_statistics
+
+
+def linear_regression(x, y, backend=None):
     """
     Esegue la regressione lineare col metodo dei minimi quadrati.
     Restituisce i coefficienti della retta y = a1*x + a0 e le statistiche di errore.
@@ -18,6 +29,8 @@ def linear_regression(x, y):
     Args:
         x (list): Lista dei valori della variabile indipendente
         y (list): Lista dei valori della variabile dipendente
+        backend (str, optional): 'python' o 'numba' per le somme sugli scarti
+                                 (None = backend globale).
 
     Returns:
         tuple: (a1, a0, syx, r2)
@@ -26,59 +39,103 @@ def linear_regression(x, y):
             - syx: Errore standard della stima
             - r2: Coefficiente di determinazione (0 <= r2 <= 1)
         """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
     n = len(x)
 
     # Controllo di sicurezza: servono almeno 3 punti per calcolare syx (n-2)
     if n < 3:
         raise ValueError("Sono necessari almeno 3 punti dati.")
 
-    # Inizializzazione Variabili
-    sumx = 0 # Somma di tutte le x (Σx). Serve per calcolare la media xm
-    sumy = 0# Somma di tutte le y (Σy). Serve per calcolare la media ym
-    sumxy = 0 # Somma dei prodotti x*y (Σxy). Fondamentale per la covarianza
-    sumx2 = 0 # Somma dei quadrati di x (Σx²). Fondamentale per la varianza di x
-    st = 0 # (Sum Total) Dispersione totale dei dati rispetto alla MEDIA.
-    sr = 0 # (Sum Residuals) Dispersione dei dati rispetto alla RETTA (errore).
-
-    # Primo Ciclo (Accumulo Somme)
-    for i in range(n):
-        sumx += x[i]
-        sumy += y[i]
-        sumxy += (x[i] * y[i])
-        sumx2 += (x[i] ** 2)
-
-    # Calcolo Medie e Coefficienti
-    xm = sumx / n
-    ym = sumy / n
-
-    # Calcolo a1 (Pendenza)
-    numerator = (n * sumxy) - (sumx * sumy)
-    denominator = (n * sumx2) - (sumx * sumx)
-
-    if denominator == 0:
-        raise ValueError("Impossibile calcolare: il denominatore è 0 (tutti gli x sono uguali?)")
+    compiled = _kernels.load() if resolve(backend) == 'numba' else None
+    if compiled is not None:
+        # Stesse somme centrate in un ciclo compilato, senza array temporanei
+        xm, ym, sxx, sxy, st, sr = compiled['regression_sums'](x, y)
+    else:
+        # Medie
+        xm = x.mean()
+        ym = y.mean()
+
+        # Scarti dalla media: la formula centrata evita la cancellazione numerica
+        # di n*Σx² - (Σx)² quando le x sono grandi
+        dx = x - xm
+        dy = y - ym
 
-    a1 = numerator / denominator
+        sxx = dx @ dx   # Σ(x - xm)²: varianza di x (a meno di n)
+        sxy = dx @ dy   # Σ(x - xm)(y - ym): covarianza (a meno di n)
 
-    # Calcolo a0 (Intercetta)
+    if sxx == 0:
+        raise ValueError("Impossibile calcolare: il denominatore è 0 (tutti gli x sono uguali?)")
+
+    # Calcolo a1 (Pendenza) e a0 (Intercetta)
+    a1 = sxy / sxx
     a0 = ym - (a1 * xm)
 
-    # Secondo Ciclo (Calcolo Errori)
-    for i in range(n):
-        # st: scarto quadratico totale rispetto alla media
-        st = st + (y[i] - ym) ** 2
-        # sr: scarto quadratico dei residui (errore della regressione)
-        sr = sr + (y[i] - a1 * x[i] - a0) ** 2
-
-    # Calcolo Statistiche Finali
-    # syx: Errore standard della stima
-    syx = (sr / (n - 2)) ** 0.5
-
-    # r2: Coefficiente di determinazione
-    # Se st è 0 (tutti i valori y sono uguali), r2 non è definito matematicamente, gestiamo il caso.
-    if st == 0:
-        r2 = 1.0  # Adattamento perfetto (linea orizzontale)
+    if compiled is not None:
+        syx = (sr / (n - 2)) ** 0.5
+        r2 = 1.0 if st == 0 else (st - sr) / st
     else:
-        r2 = (st - sr) / st
+        # Residui rispetto alla retta, scritti con gli scarti (y - a1*x - a0 = dy - a1*dx)
+        syx, r2, _ = _fit_statistics(y, dy - a1 * dx, 2)
+
+    return float(a1), float(a0), float(syx), float(r2)
+
+
+def batched_linear_regression(x, y, mask=None):
+    """
+    Esegue la regressione lineare su molte serie insieme, una retta per serie.
+
+    Tutte le somme sono riduzioni vettoriali lungo l'asse dei punti, senza
+    cicli Python sulle serie. I campioni mancanti (NaN in x o y, oppure
+    esclusi da mask) vengono ignorati serie per serie.
+
+    Args:
+        x (array): Variabile indipendente, forma (n_punti,) comune a tutte le serie
+                   oppure (n_serie, n_punti).
+        y (array): Variabile dipendente, forma (n_serie, n_punti).
+        mask (array, optional): Maschera booleana (n_serie, n_punti) dei campioni validi.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (a1, a0, syx, r2), ciascuno
+        di forma (n_serie,). Le serie con meno di 3 punti validi o con tutti gli x
+        uguali restituiscono NaN.
+    """
+    y = np.asarray(y, dtype=float)
+    if y.ndim != 2:
+        raise ValueError("y deve avere forma (n_serie, n_punti).")
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    if mask is not None:
+        valid &= np.asarray(mask, dtype=bool)
+
+    n = valid.sum(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Medie sui soli campioni validi
+        xm = np.where(valid, x, 0).sum(axis=1) / n
+        ym = np.where(valid, y, 0).sum(axis=1) / n
+
+        # Scarti dalla media, nulli sui campioni mancanti
+        dx = np.where(valid, x - xm[:, None], 0)
+        dy = np.where(valid, y - ym[:, None], 0)
+
+        sxx = np.einsum('ij,ij->i', dx, dx)
+        sxy = np.einsum('ij,ij->i', dx, dy)
+        st = np.einsum('ij,ij->i', dy, dy)
+
+        a1 = sxy / sxx
+        a0 = ym - a1 * xm
+
+        residuals = dy - a1[:, None] * dx
+        sr = np.einsum('ij,ij->i', residuals, residuals)
+
+        syx = np.sqrt(sr / (n - 2))
+        r2 = np.where(st == 0, 1.0, (st - sr) / st)
+
+    # Serie non risolvibili: pochi punti o x tutti uguali
+    bad = (n < 3) | (sxx == 0)
+    for arr in (a1, a0, syx, r2):
+        arr[bad] = np.nan
 
-    return a1, a0, syx, r2
\ No newline at end of file
+    return a1, a0, syx, r2
@@ -0,0 +1,175 @@
+"""
+Modulo per la Regressione Non Lineare ai Minimi Quadrati.
+
+Implementa il metodo di Levenberg-Marquardt per modelli y = f(x, p):
+- Jacobiano alle differenze finite calcolato con un'unica chiamata vettoriale
+  del modello, che riceve tutte le perturbazioni dei parametri insieme.
+- Equazioni normali smorzate (J^T J + lambda * diag(J^T J)) dp = J^T r
+  risolte con l'eliminazione di Gauss del progetto (systems.linear).
+- Più dataset indipendenti possono essere adattati in un'unica corsa: ogni
+  dataset ha il proprio smorzamento lambda e si ferma quando converge.
+
+Convenzione per il modello: f(x, p) riceve x di forma (n_punti, m) e p con
+i parametri sul primo asse (p[j] di forma (m,)); la colonna c di x va usata
+con i parametri p[:, c]. Un modello scritto per un solo fit, ad esempio
+    p[0] * np.exp(-p[1] * x)
+funziona quindi senza modifiche.
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+import numpy as np
+
+from systems.linear import gauss_elimination, lu_factor, lu_solve
+
+from ._least_squares import FitResult
+
+
+def _evaluate(model, x, P):
+    """
+    Valuta il modello per tutti i dataset e tutti i set di parametri con una chiamata.
+
+    Args:
+        model (callable): Modello f(x, p).
+        x (np.ndarray): Ascisse dei dataset (n_dataset, n_punti).
+        P (np.ndarray): Parametri (n_dataset, m, n_parametri), m set per dataset.
+
+    Returns:
+        np.ndarray: Valori del modello (n_dataset, n_punti, m).
+    """
+    n_sets, m, n_params = P.shape
+    n_points = x.shape[1]
+
+    x_cols = np.repeat(x.T, m, axis=1)              # (n_punti, n_dataset * m)
+    p_cols = P.reshape(n_sets * m, n_params).T      # (n_parametri, n_dataset * m)
+
+    values = np.asarray(model(x_cols, p_cols), dtype=float)
+    values = np.broadcast_to(values, (n_points, n_sets * m))
+    return values.reshape(n_points, n_sets, m).transpose(1, 0, 2)
+
+
+def _jacobian(model, x, p):
+    """
+    Valori del modello e Jacobiano alle differenze finite in avanti.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (f, J) di forma (n_dataset, n_punti) e
+        (n_dataset, n_punti, n_parametri).
+    """
+    n_params = p.shape[1]
+    step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(p), 1.0)
+
+    # Parametri base più una perturbazione per ciascun parametro
+    P = np.repeat(p[:, None, :], n_params + 1, axis=1)
+    P[:, 1:, :] += step[:, None, :] * np.eye(n_params)
+
+    values = _evaluate(model, x, P)
+    f0 = values[:, :, 0]
+    J = (values[:, :, 1:] - f0[:, :, None]) / step[:, None, :]
+    return f0, J
+
+
+def levenberg_marquardt(model, x, y, p0, tol=1e-8, max_iter=100, lam0=1e-3):
+    """
+    Adatta il modello non lineare y = f(x, p) ai dati con Levenberg-Marquardt.
+
+    Args:
+        model (callable): Modello f(x, p), vettoriale secondo la convenzione del modulo.
+        x (array): Ascisse (n_punti,), oppure (n_dataset, n_punti) per più dataset.
+        y (array): Ordinate (n_punti,), oppure (n_dataset, n_punti).
+        p0 (array): Parametri iniziali (n_parametri,), comuni o (n_dataset, n_parametri).
+        tol (float, optional): Tolleranza relativa sulla correzione dei parametri.
+        max_iter (int, optional): Numero massimo di iterazioni.
+        lam0 (float, optional): Smorzamento iniziale.
+
+    Returns:
+        FitResult: Parametri stimati (coef), errori standard, syx e r2. Con più
+        dataset ogni campo ha un asse iniziale n_dataset.
+
+    Raises:
+        ValueError: Se le dimensioni non sono compatibili o i dati non bastano.
+        RuntimeError: Se qualche fit non converge entro max_iter iterazioni.
+    """
+    y = np.asarray(y, dtype=float)
+    single = y.ndim == 1
+    y = np.atleast_2d(y)
+    n_sets, n_points = y.shape
+
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    p = np.array(np.broadcast_to(np.asarray(p0, dtype=float),
+                                 (n_sets, np.shape(p0)[-1])))
+    n_params = p.shape[1]
+
+    if n_points <= n_params:
+        raise ValueError(f"Sono necessari almeno {n_params + 1} punti dati.")
+
+    lam = np.full(n_sets, float(lam0))
+    active = np.ones(n_sets, dtype=bool)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+
+        f0, J = _jacobian(model, x[idx], p[idx])
+        r = y[idx] - f0
+        cost = np.einsum('ij,ij->i', r, r)
+
+        JTJ = np.einsum('bni,bnj->bij', J, J)
+        g = np.einsum('bni,bn->bi', J, r)
+
+        # Equazioni normali smorzate, una per dataset
+        delta = np.zeros((len(idx), n_params))
+        solved = np.ones(len(idx), dtype=bool)
+        for b, i in enumerate(idx):
+            d = np.maximum(np.diag(JTJ[b]), 1e-12)
+            try:
+                delta[b] = gauss_elimination(JTJ[b] + lam[i] * np.diag(d), g[b], tol=1e-14)
+            except np.linalg.LinAlgError:
+                solved[b] = False
+
+        # Costo dei parametri di prova, con una sola chiamata del modello
+        p_trial = p[idx] + delta
+        r_trial = y[idx] - _evaluate(model, x[idx], p_trial[:, None, :])[:, :, 0]
+        cost_trial = np.einsum('ij,ij->i', r_trial, r_trial)
+
+        accept = solved & (cost_trial <= cost)
+        p[idx[accept]] = p_trial[accept]
+        lam[idx[accept]] /= 10
+        lam[idx[~accept]] *= 10
+
+        # Convergenza: correzione piccola rispetto ai parametri, o residuo nullo
+        small = np.all(np.abs(delta) <= tol * (np.abs(p[idx]) + tol), axis=1)
+        done = (accept & small) | (cost == 0) | (lam[idx] > 1e16)
+        active[idx[done]] = False
+
+    if active.any():
+        raise RuntimeError(f"Levenberg-Marquardt non ha convertito dopo {max_iter} iterazioni "
+                           f"per {active.sum()} dataset su {n_sets}.")
+
+    # Statistiche finali (Jacobiano nei parametri stimati)
+    f0, J = _jacobian(model, x, p)
+    residuals = y - f0
+    sr = np.einsum('ij,ij->i', residuals, residuals)
+    dy = y - y.mean(axis=1, keepdims=True)
+    st = np.einsum('ij,ij->i', dy, dy)
+
+    syx = np.sqrt(sr / (n_points - n_params))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r2 = np.where(st == 0, 1.0, (st - sr) / st)
+
+    # Errori standard: syx * sqrt(diag((J^T J)^-1)), colonna per colonna con la stessa LU
+    stderr = np.full((n_sets, n_params), np.nan)
+    eye = np.eye(n_params)
+    for b in range(n_sets):
+        try:
+            LU, piv = lu_factor(J[b].T @ J[b], tol=1e-14)
+        except np.linalg.LinAlgError:
+            continue
+        diag = np.array([lu_solve(LU, piv, eye[j])[j] for j in range(n_params)])
+        stderr[b] = syx[b] * np.sqrt(diag)
+
+    if single:
+        return FitResult(p[0], stderr[0], float(syx[0]), float(r2[0]))
+    return FitResult(p, stderr, syx, r2)
@@ -0,0 +1,211 @@
+"""
+Modulo per la Regressione Lineare Online (in streaming).
+
+Lo stato della regressione contiene solo il numero di punti, le medie e i
+momenti centrati (somme degli scarti al quadrato e dei prodotti incrociati),
+aggiornati in una sola passata con le formule di Welford/Chan:
+- I dati possono arrivare a blocchi (np.memmap, file più grandi della RAM,
+  iteratori) con memoria costante.
+- Gli stati calcolati su porzioni diverse dei dati (processi paralleli,
+  file distinti) si combinano con online_merge in modo esatto.
+- Lavorare sugli scarti dalla media evita la cancellazione numerica delle
+  somme grezze Σx², Σxy.
+- La somma dei quadrati dei residui sr è conservata nello stato e unita
+  tramite il fattore R (QR) della matrice degli scarti [x, y], invece di
+  ricavarla come syy - a1*sxy: la differenza di due numeri quasi uguali
+  azzererebbe sr per i fit quasi perfetti.
+
+Esempio con più processi:
+    states = executor.map(online_regression_state, shards_x, shards_y)
+    a1, a0, syx, r2 = online_result(functools.reduce(online_merge, states))
+
+Autore:      Sicky2005
+Corso:       Metodi Numerici per l'Ingegneria
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+RegressionState = namedtuple('RegressionState', ['n', 'xm', 'ym', 'sxx', 'syy', 'sxy', 'sr'])
+RegressionState.__doc__ = """
+Stato della regressione online.
+
+    - n: Numero di punti.
+    - xm, ym: Medie di x e y.
+    - sxx, syy: Σ(x - xm)², Σ(y - ym)².
+    - sxy: Σ(x - xm)(y - ym).
+    - sr: Somma dei quadrati dei residui della retta dei minimi quadrati
+          (syy se tutti gli x sono uguali).
+"""
+
+
+def online_init():
+    """Restituisce lo stato vuoto (nessun punto)."""
+    return RegressionState(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _r_factor(state):
+    """
+    Fattore R (2x2, triangolare superiore) con R^T R = [[sxx, sxy], [sxy, syy]].
+
+    L'ultimo elemento diagonale è sqrt(sr): la matrice si costruisce da sr
+    senza sottrazioni.
+    """
+    r11 = state.sxx ** 0.5
+    r12 = state.sxy / r11 if r11 > 0 else 0.0
+    return np.array([[r11, r12], [0.0, state.sr ** 0.5]])
+
+
+def online_merge(a, b):
+    """
+    Combina due stati calcolati su insiemi di punti disgiunti (formule di Chan).
+
+    Args:
+        a (RegressionState): Primo stato.
+        b (RegressionState): Secondo stato.
+
+    Returns:
+        RegressionState: Stato equivalente all'unione dei due insiemi di punti.
+    """
+    if a.n == 0:
+        return b
+    if b.n == 0:
+        return a
+
+    n = a.n + b.n
+    dx = b.xm - a.xm
+    dy = b.ym - a.ym
+    w = a.n * b.n / n
+
+    # sr dell'unione: QR dei fattori R dei due stati più la riga della
+    # differenza delle medie (stessa correzione di Chan, in forma ortogonale)
+    stacked = np.vstack([_r_factor(a), _r_factor(b), [w ** 0.5 * dx, w ** 0.5 * dy]])
+    r22 = np.linalg.qr(stacked, mode='r')[1, 1]
+
+    return RegressionState(
+        n,
+        a.xm + dx * b.n / n,
+        a.ym + dy * b.n / n,
+        a.sxx + b.sxx + dx * dx * w,
+        a.syy + b.syy + dy * dy * w,
+        a.sxy + b.sxy + dx * dy * w,
+        float(r22 * r22),
+    )
+
+
+def online_update(state, x, y):
+    """
+    Aggiorna lo stato con un nuovo blocco di punti.
+
+    Le statistiche del blocco sono calcolate in forma vettoriale e poi unite
+    allo stato con online_merge.
+
+    Args:
+        state (RegressionState): Stato corrente.
+        x (array): Blocco di valori della variabile indipendente.
+        y (array): Blocco di valori della variabile dipendente.
+
+    Returns:
+        RegressionState: Stato aggiornato.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if len(x) != len(y):
+        raise ValueError("x e y devono avere la stessa lunghezza.")
+    if len(x) == 0:
+        return state
+
+    xm = x.mean()
+    ym = y.mean()
+    dx = x - xm
+    dy = y - ym
+
+    sxx = float(dx @ dx)
+    sxy = float(dx @ dy)
+    syy = float(dy @ dy)
+
+    # Residui del blocco calcolati direttamente (come in linear_regression)
+    residuals = dy - (sxy / sxx) * dx if sxx > 0 else dy
+    sr = float(residuals @ residuals)
+
+    chunk = RegressionState(len(x), float(xm), float(ym), sxx, syy, sxy, sr)
+    return online_merge(state, chunk)
+
+
+def online_result(state):
+    """
+    Calcola i risultati della regressione dallo stato.
+
+    Args:
+        state (RegressionState): Stato accumulato.
+
+    Returns:
+        tuple: (a1, a0, syx, r2), come linear_regression.
+
+    Raises:
+        ValueError: Se ci sono meno di 3 punti o tutti gli x sono uguali.
+    """
+    if state.n < 3:
+        raise ValueError("Sono necessari almeno 3 punti dati.")
+    if state.sxx == 0:
+        raise ValueError("Impossibile calcolare: il denominatore è 0 (tutti gli x sono uguali?)")
+
+    a1 = state.sxy / state.sxx
+    a0 = state.ym - a1 * state.xm
+
+    st = state.syy
+    sr = state.sr
+
+    syx = (sr / (state.n - 2)) ** 0.5
+
+    # Se st è 0 (tutti i valori y sono uguali) il fit è perfetto per convenzione
+    r2 = 1.0 if st == 0 else (st - sr) / st
+
+    return a1, a0, syx, r2
+
+
+def online_regression_state(x, y, chunk_size=65536, state=None):
+    """
+    Accumula lo stato della regressione leggendo i dati a blocchi.
+
+    Args:
+        x (array | iterable): Array (anche np.memmap), letto a fette di chunk_size,
+                              oppure iterabile di blocchi.
+        y (array | iterable): Come x, con blocchi della stessa lunghezza.
+        chunk_size (int, optional): Lunghezza dei blocchi letti dagli array.
+        state (RegressionState, optional): Stato da cui ripartire.
+
+    Returns:
+        RegressionState: Stato accumulato.
+    """
+    if chunk_size < 1:
+        raise ValueError("La dimensione del blocco chunk_size deve essere almeno 1.")
+    if state is None:
+        state = online_init()
+
+    if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
+        if len(x) != len(y):
+            raise ValueError("x e y devono avere la stessa lunghezza.")
+        for start in range(0, len(x), chunk_size):
+            state = online_update(state, x[start:start + chunk_size], y[start:start + chunk_size])
+        return state
+
+    for x_chunk, y_chunk in zip(x, y):
+        state = online_update(state, x_chunk, y_chunk)
+    return state
+
+
+def online_regression(x, y, chunk_size=65536):
+    """
+    Regressione lineare in una sola passata, a memoria costante.
+
+    Args:
+        x (array | iterable): Array (anche np.memmap) o iterabile di blocchi.
+        y (array | iterable): Come x.
+        chunk_size (int, optional): Lunghezza dei blocchi letti dagli array.
+
+    Returns:
+        tuple: (a1, a0, syx, r2), come linear_regression.
+    """
+    return online_result(online_regression_state(x, y, chunk_size))
@@ -1,2 +1,27 @@
-from .bracketing import bisezione, falsa_posizione
-from .open_methods import newton_raphson, secanti, fixed_point
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from roots import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+_EXPORTS = {
+    'bisezione': 'bracketing',
+    'falsa_posizione': 'bracketing',
+    'newton_raphson': 'open_methods',
+    'secanti': 'open_methods',
+    'fixed_point': 'open_methods',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
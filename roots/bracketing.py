@@ -8,7 +8,31 @@ Autore:      Sicky2005
 Corso:       Metodi Numerici per l'Ingegneria
 """
 
-def bisezione(f, a, b, tol=1e-6, max_iter=100):
+from backend import kernels as _kernels
+from backend.selection import resolve
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+
+def _compiled_root(name, f, a, b, tol, max_iter, bracket_error, convergence_error):
+    """
+    Esegue il metodo chiuso 'name' con il kernel Numba, sollevando gli stessi
+    errori del ciclo Python. Restituisce None se il kernel non è utilizzabile
+    (il chiamante prosegue con il ciclo Python).
+    """
+    result = _kernels.call_with_function(name, f, float(a), float(b), float(tol), int(max_iter))
+    if result is None:
+        return None
+    xr, status = result
+    if status == _kernels.BAD_BRACKET:
+        raise ValueError(bracket_error)
+    if status == _kernels.NOT_CONVERGED:
+        raise RuntimeError(convergence_error)
+    return xr
+
+
+@instrumented('bisezione', evals=('f',))
+def bisezione(f, a, b, tol=1e-6, max_iter=100, backend=None):
     """
     Trova la radice di f(x) nell'intervallo [a, b] usando il metodo di Bisezione.
 
@@ -18,6 +42,9 @@ def bisezione(f, a, b, tol=1e-6, max_iter=100):
         b (float): Estremo superiore dell'intervallo.
         tol (float): Tolleranza per l'errore relativo stimato.
         max_iter (int): Numero massimo di iterazioni.
+        backend (str, optional): 'python' o 'numba' (None = backend globale). Con
+                                 'numba' f viene compilata e le singole iterazioni
+                                 non sono registrate da diagnostics.
 
     Returns:
         float: La radice approssimata.
@@ -27,6 +54,13 @@ def bisezione(f, a, b, tol=1e-6, max_iter=100):
         RuntimeError: Se il metodo non converge entro max_iter.
     """
 
+    if resolve(backend) == 'numba':
+        xr = _compiled_root('bisezione', f, a, b, tol, max_iter,
+                            "La funzione deve avere segni opposti agli estremi a e b (Bracketing non valido).",
+                            f"Il metodo di bisezione non ha convertito dopo {max_iter} iterazioni.")
+        if xr is not None:
+            return xr
+
     # Valutiamo la funzione agli estremi
     fa = f(a)
     fb = f(b)
@@ -41,6 +75,8 @@ def bisezione(f, a, b, tol=1e-6, max_iter=100):
         # Stima della radice (punto medio)
         xr = (a + b) / 2
         fxr = f(xr)
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=xr, fx=fxr, width=abs(b - a))
 
         # Calcolo dell'errore relativo (evitiamo divisione per zero)
         if xr != 0 and i > 0:
@@ -66,7 +102,8 @@ def bisezione(f, a, b, tol=1e-6, max_iter=100):
     raise RuntimeError(f"Il metodo di bisezione non ha convertito dopo {max_iter} iterazioni.")
 
 
-def falsa_posizione(f, a, b, tol=1e-6, max_iter=100):
+@instrumented('falsa_posizione', evals=('f',))
+def falsa_posizione(f, a, b, tol=1e-6, max_iter=100, backend=None):
     """
     Trova la radice di f(x) in [a, b] usando il metodo di Falsa Posizione (Variante Illinois).
 
@@ -79,6 +116,9 @@ def falsa_posizione(f, a, b, tol=1e-6, max_iter=100):
         b (float): Estremo superiore dell'intervallo.
         tol (float): Tolleranza per l'errore relativo.
         max_iter (int): Numero massimo di iterazioni.
+        backend (str, optional): 'python' o 'numba' (None = backend globale). Con
+                                 'numba' f viene compilata e le singole iterazioni
+                                 non sono registrate da diagnostics.
 
     Returns:
         float: La radice approssimata.
@@ -88,6 +128,13 @@ def falsa_posizione(f, a, b, tol=1e-6, max_iter=100):
         RuntimeError: Se il metodo non converge entro max_iter.
     """
 
+    if resolve(backend) == 'numba':
+        xr = _compiled_root('falsa_posizione', f, a, b, tol, max_iter,
+                            "La funzione deve avere segni opposti agli estremi a e b.",
+                            f"Il metodo di Falsa Posizione non ha convertito dopo {max_iter} iterazioni.")
+        if xr is not None:
+            return xr
+
     fa = f(a)
     fb = f(b)
 
@@ -106,6 +153,8 @@ def falsa_posizione(f, a, b, tol=1e-6, max_iter=100):
         # xr = b - fb * (a - b) / (fa - fb)
         xr = b - (fb * (a - b)) / (fa - fb)
         fxr = f(xr)
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=xr, fx=fxr)
 
         # Calcolo errore relativo (dalla seconda iterazione)
         if xr != 0 and i > 0:
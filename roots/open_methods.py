@@ -8,7 +8,11 @@ Autore:      Sicky2005
 Corso:       Metodi Numerici per l'Ingegneria
 """
 
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
 
+
+@instrumented('fixed_point', evals=('g',))
 def fixed_point(g, x0, tol=1e-6, max_iter=100):
     """
     Trova la radice usando il Metodo del Punto Fisso (Iterazione funzionale).
@@ -34,6 +38,8 @@ def fixed_point(g, x0, tol=1e-6, max_iter=100):
 
     for i in range(max_iter):
         xr = g(xr_old)
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=xr, dx=abs(xr - xr_old))
 
         # Calcolo errore relativo
         if xr != 0:
@@ -51,6 +57,7 @@ def fixed_point(g, x0, tol=1e-6, max_iter=100):
         f"Il metodo del Punto Fisso non ha convertito dopo {max_iter} iterazioni (possibile divergenza).")
 
 
+@instrumented('newton_raphson', evals=('f', 'df'))
 def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
     """
     Trova la radice di f(x) usando il metodo di Newton-Raphson (Metodo delle tangenti).
@@ -77,6 +84,8 @@ def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
     for i in range(max_iter):
         fx = f(xr)
         dfx = df(xr)
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=xr, fx=fx)
 
         # Controllo derivata nulla (tangente orizzontale)
         if dfx == 0:
@@ -101,6 +110,7 @@ def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
     raise RuntimeError(f"Il metodo di Newton non ha convertito dopo {max_iter} iterazioni.")
 
 
+@instrumented('secanti', evals=('f',))
 def secanti(f, x0, x1, tol=1e-6, max_iter=100):
     """
     Trova la radice di f(x) usando il metodo delle Secanti.
@@ -131,6 +141,9 @@ def secanti(f, x0, x1, tol=1e-6, max_iter=100):
 
     for i in range(max_iter):
 
+        if _diag.ACTIVE is not None:
+            _diag.iteration(x=x1, fx=f1)
+
         denom = f1 - f0
 
         # Controllo sicurezza numerica (Secante orizzontale)
@@ -1,3 +1,29 @@
-from .linear import gauss_elimination, thomas
-from .iterative import gauss_seidel, jacobi
-from .nonlinear import broyden
\ No newline at end of file
+# I nomi sono importati al primo accesso (PEP 562): 'from systems import ...'
+# carica solo il modulo che li definisce e le sue dipendenze.
+
+import importlib
+
+_EXPORTS = {
+    'gauss_elimination': 'linear',
+    'thomas': 'linear',
+    'lu_factor': 'linear',
+    'lu_solve': 'linear',
+    'gauss_seidel': 'iterative',
+    'jacobi': 'iterative',
+    'broyden': 'nonlinear',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
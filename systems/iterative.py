@@ -10,8 +10,14 @@ Corso:       Metodi Numerici per l'Ingegneria
 
 import numpy as np
 
+from backend import kernels as _kernels
+from backend.selection import resolve
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
 
-def gauss_seidel(A, b, x0=None, tol=1e-6, max_iter=100, omega=1.0):
+
+@instrumented('gauss_seidel')
+def gauss_seidel(A, b, x0=None, tol=1e-6, max_iter=100, omega=1.0, backend=None):
     """
     Risolve il sistema Ax = b usando il metodo di Gauss-Seidel.
     Supporta il rilassamento (SOR - Successive Over-Relaxation) tramite il parametro omega.
@@ -25,6 +31,8 @@ def gauss_seidel(A, b, x0=None, tol=1e-6, max_iter=100, omega=1.0):
         omega (float): Fattore di rilassamento (1.0 = Gauss-Seidel standard).
                        0 < omega < 1: Sotto-rilassamento (per convergenza difficile)
                        1 < omega < 2: Sovra-rilassamento (per accelerare)
+        backend (str, optional): 'python' o 'numba' per il ciclo sulle righe
+                                 (None = backend globale).
 
     Returns:
         np.array: Il vettore soluzione x.
@@ -47,21 +55,31 @@ def gauss_seidel(A, b, x0=None, tol=1e-6, max_iter=100, omega=1.0):
     else:
         x = np.array(x0, dtype=float)
 
+    sweep = None
+    if resolve(backend) == 'numba':
+        compiled = _kernels.load()
+        if compiled is not None:
+            sweep = compiled['gauss_seidel_sweep']
+
     for k in range(max_iter):
         x_old = x.copy()
 
         # Iterazione sulle righe
-        for i in range(n):
-            # Calcolo sigma: somma di A[i,j] * x[j] per tutti i j != i
-            # Nota: x contiene già i valori aggiornati per j < i (caratteristica di GS)
-            # Ottimizzazione: prodotto scalare intera riga - elemento diagonale
-            sigma = np.dot(A[i, :], x) - A[i, i] * x[i]
+        if sweep is not None:
+            # Stesso ciclo, compilato con Numba
+            sweep(A, b, x, x_old, float(omega))
+        else:
+            for i in range(n):
+                # Calcolo sigma: somma di A[i,j] * x[j] per tutti i j != i
+                # Nota: x contiene già i valori aggiornati per j < i (caratteristica di GS)
+                # Ottimizzazione: prodotto scalare intera riga - elemento diagonale
+                sigma = np.dot(A[i, :], x) - A[i, i] * x[i]
 
-            # Calcolo nuovo valore (Formula di Gauss-Seidel)
-            x_new = (b[i] - sigma) / A[i, i]
+                # Calcolo nuovo valore (Formula di Gauss-Seidel)
+                x_new = (b[i] - sigma) / A[i, i]
 
-            # Applicazione del rilassamento (SOR)
-            x[i] = omega * x_new + (1 - omega) * x_old[i]
+                # Applicazione del rilassamento (SOR)
+                x[i] = omega * x_new + (1 - omega) * x_old[i]
 
         # Controllo convergenza (Norma dell'errore relativo)
         # Evitiamo divisione per zero se x è nullo
@@ -71,12 +89,16 @@ def gauss_seidel(A, b, x0=None, tol=1e-6, max_iter=100, omega=1.0):
         else:
             diff = np.linalg.norm(x - x_old) / norm_x
 
+        if _diag.ACTIVE is not None:
+            _diag.iteration(ea=diff, residual=np.linalg.norm(b - A @ x))
+
         if diff < tol:
             return x
 
     raise RuntimeError(f"Gauss-Seidel non ha convertito dopo {max_iter} iterazioni.")
 
 
+@instrumented('jacobi')
 def jacobi(A, b, x0=None, tol=1e-6, max_iter=100):
     """
     Risolve il sistema Ax = b usando il metodo di Jacobi.
@@ -122,6 +144,9 @@ def jacobi(A, b, x0=None, tol=1e-6, max_iter=100):
         else:
             diff = np.linalg.norm(x_new - x) / norm_x
 
+        if _diag.ACTIVE is not None:
+            _diag.iteration(ea=diff, residual=np.linalg.norm(b - A @ x_new))
+
         if diff < tol:
             return x_new
 
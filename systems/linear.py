@@ -9,7 +9,13 @@ Corso:       Metodi Numerici per l'Ingegneria
 
 import numpy as np
 
-def gauss_elimination(A, b, tol=1e-6):
+from backend import kernels as _kernels
+from backend.selection import resolve
+from diagnostics.recorder import instrumented
+
+
+@instrumented('gauss_elimination')
+def gauss_elimination(A, b, tol=1e-6, backend=None):
     """
     Risolve il sistema lineare Ax = b usando l'eliminazione di Gauss
     con pivoting parziale scalato.
@@ -18,6 +24,8 @@ def gauss_elimination(A, b, tol=1e-6):
         A (list or np.array): Matrice dei coefficienti (n x n).
         b (list or np.array): Vettore dei termini noti (n).
         tol (float): Tolleranza per determinare se la matrice è singolare.
+        backend (str, optional): 'python' o 'numba' per la sostituzione all'indietro
+                                 (None = backend globale, vedi backend.set_backend).
 
     Returns:
         np.array: Il vettore soluzione x.
@@ -72,6 +80,11 @@ def gauss_elimination(A, b, tol=1e-6):
          raise np.linalg.LinAlgError("Matrice singolare (ultimo pivot troppo piccolo).")
 
     # --- Sostituzione all'indietro ---
+    if resolve(backend) == 'numba':
+        compiled = _kernels.load()
+        if compiled is not None:
+            return compiled['back_substitution'](A, b)
+
     x = np.zeros(n)
     x[n - 1] = b[n - 1] / A[n - 1, n - 1]
 
@@ -85,7 +98,8 @@ def gauss_elimination(A, b, tol=1e-6):
     return x
 
 
-def thomas(e, f, g, b):
+@instrumented('thomas')
+def thomas(e, f, g, b, backend=None):
     """
     Risolve un sistema tridiagonale Ax = b usando l'algoritmo di Thomas (TDMA).
 
@@ -99,12 +113,13 @@ def thomas(e, f, g, b):
         f (list/array): Vettore diagonale principale (lunghezza n).
         g (list/array): Vettore diagonale superiore (lunghezza n).
         b (list/array): Vettore dei termini noti (lunghezza n).
+        backend (str, optional): 'python' o 'numba' (None = backend globale).
 
     Returns:
         np.array: Il vettore soluzione x.
 
     Raises:
-        ValueError: Se le dimensioni dei vettori non coincidono.
+        ValueError: Se le dimensioni dei vettori non coincidono o un pivot è nullo.
     """
     n = len(f)
     if len(e) != n or len(g) != n or len(b) != n:
@@ -117,6 +132,16 @@ def thomas(e, f, g, b):
     b_work = np.array(b, dtype=float)
     g_work = np.array(g, dtype=float)
 
+    if resolve(backend) == 'numba':
+        compiled = _kernels.load()
+        if compiled is not None:
+            x, k = compiled['thomas'](e_work, f_work, g_work, b_work)
+            if k == n - 1:
+                raise ValueError("Pivot nullo nell'ultimo elemento. Sistema singolare.")
+            if k >= 0:
+                raise ValueError(f"Pivot nullo in k={k}. Thomas algorithm fallisce.")
+            return x
+
     # --- Decomposizione (Eliminazione in avanti) ---
     for k in range(1, n):
         if f_work[k - 1] == 0:
@@ -142,4 +167,87 @@ def thomas(e, f, g, b):
     for k in range(n - 2, -1, -1):
         x[k] = (b_work[k] - g_work[k] * x[k + 1]) / f_work[k]
 
-    return x
\ No newline at end of file
+    return x
+
+
+def lu_factor(A, tol=1e-6):
+    """
+    Calcola la fattorizzazione LU di A con pivoting parziale scalato (PA = LU).
+
+    Utile quando si devono risolvere molti sistemi con la stessa matrice:
+    la fattorizzazione (O(n^3)) si calcola una volta sola e ogni soluzione
+    successiva con lu_solve costa solo O(n^2).
+
+    Args:
+        A (list or np.array): Matrice dei coefficienti (n x n).
+        tol (float): Tolleranza per determinare se la matrice è singolare.
+
+    Returns:
+        tuple[np.array, np.array]: (LU, piv) dove:
+            - LU contiene U nel triangolo superiore e i moltiplicatori di L
+              (diagonale unitaria implicita) nel triangolo inferiore.
+            - piv è la permutazione delle righe (b permutato = b[piv]).
+
+    Raises:
+        ValueError: Se la matrice non è quadrata.
+        np.linalg.LinAlgError: Se la matrice è singolare (pivot vicino a 0).
+    """
+    LU = np.array(A, dtype=float)
+    n = LU.shape[0]
+
+    if LU.shape != (n, n):
+        raise ValueError("La matrice A deve essere quadrata.")
+
+    piv = np.arange(n)
+    s = np.max(np.abs(LU), axis=1)
+
+    if np.any(s == 0):
+        raise np.linalg.LinAlgError("Matrice singolare (riga nulla).")
+
+    for k in range(n - 1):
+        # Scelta del pivot scalato (come in gauss_elimination)
+        p = np.argmax(np.abs(LU[k:, k]) / s[k:]) + k
+
+        if abs(LU[p, k] / s[p]) < tol:
+            raise np.linalg.LinAlgError("Matrice singolare (pivot troppo piccolo).")
+
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            s[[k, p]] = s[[p, k]]
+            piv[[k, p]] = piv[[p, k]]
+
+        # Moltiplicatori salvati al posto degli zeri e aggiornamento del blocco
+        LU[k+1:, k] /= LU[k, k]
+        LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+
+    if abs(LU[n - 1, n - 1] / s[n - 1]) < tol:
+        raise np.linalg.LinAlgError("Matrice singolare (ultimo pivot troppo piccolo).")
+
+    return LU, piv
+
+
+def lu_solve(LU, piv, b):
+    """
+    Risolve Ax = b a partire dalla fattorizzazione calcolata con lu_factor.
+
+    Args:
+        LU (np.array): Fattori L e U compattati (output di lu_factor).
+        piv (np.array): Permutazione delle righe (output di lu_factor).
+        b (list or np.array): Vettore dei termini noti (n).
+
+    Returns:
+        np.array: Il vettore soluzione x.
+    """
+    b = np.array(b, dtype=float)[piv]
+    n = len(b)
+
+    # --- Sostituzione in avanti (L con diagonale unitaria) ---
+    for i in range(1, n):
+        b[i] -= np.dot(LU[i, :i], b[:i])
+
+    # --- Sostituzione all'indietro ---
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = (b[i] - np.dot(LU[i, i+1:], x[i+1:])) / LU[i, i]
+
+    return x
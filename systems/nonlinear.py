@@ -7,6 +7,11 @@ Corso:       Metodi Numerici per l'Ingegneria
 
 import numpy as np
 
+from diagnostics import recorder as _diag
+from diagnostics.recorder import instrumented
+
+
+@instrumented('broyden', evals=('f',))
 def broyden(f, x0, tol=1e-6, max_iter=100, B0=None):
     """
     Risolve un sistema di equazioni non lineari f(x) = 0 usando il metodo di Broyden.
@@ -51,6 +56,9 @@ def broyden(f, x0, tol=1e-6, max_iter=100, B0=None):
         x_new = x + delta_x
         fx_new = np.array(f(x_new), dtype=float).flatten()
 
+        if _diag.ACTIVE is not None:
+            _diag.iteration(step=np.linalg.norm(delta_x), residual=np.linalg.norm(fx_new))
+
         # 3. Controllo convergenza (sulla norma del passo o del residuo)
         if np.linalg.norm(delta_x) < tol:
             return x_new